@@ -0,0 +1,71 @@
+# benchmarks/extraction_throughput.py
+"""Measures the extraction throughput of JobSearch/JobExtractor, headless, against the synthetic job board
+(LinkedIn-shaped search and job pages served locally), so results are reproducible and comparable between changes.
+
+    python -m benchmarks.extraction_throughput --sizes 10 100 1000 --tabs 1
+"""
+
+import argparse
+import tempfile
+import time
+from math import ceil
+from typing import Dict, List
+
+from playwright.sync_api import sync_playwright
+
+import src.logger as LOGGER
+from src.search.linkedin.search import JobSearch
+from tests.fixtures.job_board import JobBoard
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    values = sorted(values)
+    return values[max(0, ceil(percentile / 100 * len(values)) - 1)] if values else 0.0
+
+
+def _measure(browser_type, board: JobBoard, limit: int, tabs: int) -> Dict:
+    with board.server(), tempfile.TemporaryDirectory() as user_data_dir:
+        context = browser_type.launch_persistent_context(user_data_dir=user_data_dir, headless=True)
+        page = context.pages[0] if context.pages else context.new_page()
+        search = JobSearch(page, board.constants(), tabs)
+        latencies = []
+        start = last = time.perf_counter()
+        for _ in search.iter_jobs(keywords="automation engineer", limit=limit):
+            now = time.perf_counter()
+            latencies.append(now - last)
+            last = now
+        elapsed = time.perf_counter() - start
+        context.close()
+    return {
+        "jobs": len(latencies),
+        "seconds": elapsed,
+        "jobs_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="number of jobs on the board, one run each")
+    parser.add_argument("--tabs", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before every search or job page response")
+    parser.add_argument("--detail-latency", type=float, default=0.0, help="seconds before every detail pane response")
+    parser.add_argument("--missing-rate", type=float, default=0.0, help="fraction of the jobs missing their company or location")
+    parser.add_argument("--browser", default="webkit", choices=["webkit", "chromium", "firefox"])
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+    LOGGER.setup(args.log_level)
+
+    with sync_playwright() as playwright:
+        browser_type = getattr(playwright, args.browser)
+        for size in args.sizes:
+            board = JobBoard(size, latency=args.latency, detail_latency=args.detail_latency, missing_rate=args.missing_rate)
+            result = _measure(browser_type, board, size, args.tabs)
+            print(f"{size:>6} jobs: {result['jobs']:>6} extracted in {result['seconds']:8.2f}s, "
+                  f"{result['jobs_per_second']:7.2f} jobs/s, "
+                  f"per job p50 {result['p50'] * 1000:7.1f} ms p95 {result['p95'] * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
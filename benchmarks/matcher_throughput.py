@@ -0,0 +1,95 @@
+# benchmarks/matcher_throughput.py
+"""Measures Facade.filter_jobs throughput and tail latency across job counts and matcher modes,
+offline: the LLM modes run against FakeLLM, a local stand-in with configurable latency, errors and malformed replies.
+Jobs are filtered in chunks of matcher.batch_size * matcher.concurrency, the batches a streaming run keeps in flight,
+and the latencies of the single batches are taken from the matcher metrics.
+
+    python -m benchmarks.matcher_throughput --sizes 10 100 1000 --latency 0.5
+"""
+
+import argparse
+import time
+from math import ceil
+from typing import Dict, List
+
+import src.logger as LOGGER
+import src.utils.metrics as METRICS
+from src.constants.linkedin import LinkedInConstants
+from src.facade import Facade
+from src.models.job import Job
+from src.utils.description_matcher import DescriptionMatcher
+from tests.fixtures.fake_llm import FakeLLM
+from tests.fixtures.job_board import JobBoard
+
+USER_DESCRIPTION = "automation engineer position to utilize python coding for tests and infrastructure tasks"
+
+# Mode name -> DescriptionMatcher arguments.
+MODES = {
+    "llm single": {"method": "llm", "batch_size": 1, "concurrency": 1},
+    "llm batch 10": {"method": "llm", "batch_size": 10, "concurrency": 1},
+    "llm batch 10 x4": {"method": "llm", "batch_size": 10, "concurrency": 4},
+    "vector": {"method": "vector", "batch_size": 10},
+}
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    values = sorted(values)
+    return values[max(0, ceil(percentile / 100 * len(values)) - 1)] if values else 0.0
+
+
+def _jobs(count: int) -> List[Job]:
+    return [Job(title=job["title"], company=job["company"], location=job["location"],
+                url=f"https://www.linkedin.com/jobs/view/{job['job_id']}/", description=job["description"], easy_apply=job["easy_apply"])
+            for job in JobBoard(count).jobs]
+
+
+def _measure(matcher: DescriptionMatcher, jobs: List[Job]) -> Dict:
+    facade = Facade(None, LinkedInConstants, matcher=matcher)
+    chunk_size = matcher.batch_size * matcher.concurrency
+    failed = 0
+    metrics = METRICS.enable()
+    start = time.perf_counter()
+    try:
+        for offset in range(0, len(jobs), chunk_size):
+            try:
+                facade.filter_jobs(jobs[offset:offset + chunk_size], USER_DESCRIPTION)
+            except Exception:
+                failed += 1
+    finally:
+        METRICS.disable()
+    elapsed = time.perf_counter() - start
+    # The LLM modes time every batch, the other backends score a whole chunk, which is a single batch for them.
+    latencies = metrics.durations.get("llm_batch") or metrics.durations.get("scoring", [])
+    return {
+        "jobs_per_second": len(jobs) / elapsed if elapsed else 0.0,
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+        "failed_chunks": failed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds of every fake LLM call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of the LLM calls failing with a quota error")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="fraction of the LLM calls returning an unparsable reply")
+    parser.add_argument("--log-level", default="WARNING", help="the matcher logs every prompt at DEBUG")
+    args = parser.parse_args()
+    LOGGER.setup(args.log_level)
+
+    for size in args.sizes:
+        jobs = _jobs(size)
+        for mode in args.modes:
+            fake_llm = FakeLLM(args.latency, args.error_rate, args.malformed_rate)
+            matcher = DescriptionMatcher(threshold=LinkedInConstants.DEFAULT_THRESHOLD, llm=fake_llm, **MODES[mode])
+            result = _measure(matcher, jobs)
+            print(f"{size:>6} jobs, {mode:<16}: {result['jobs_per_second']:9.2f} jobs/s, "
+                  f"batch p50 {result['p50'] * 1000:8.1f} ms p95 {result['p95'] * 1000:8.1f} ms p99 {result['p99'] * 1000:8.1f} ms, "
+                  f"{fake_llm.calls} LLM calls, {result['failed_chunks']} failed chunks")
+
+
+if __name__ == "__main__":
+    main()
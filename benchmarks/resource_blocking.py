@@ -0,0 +1,92 @@
+# benchmarks/resource_blocking.py
+"""Compares page load time and transferred bytes with and without the resource blocking profile,
+against a local site with the asset mix of a job search page (images, fonts, media, tracking pixels).
+
+    python -m benchmarks.resource_blocking --runs 5
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from playwright.sync_api import sync_playwright
+
+import src.logger as LOGGER
+from src.utils.resource_blocker import ResourceBlocker
+from tests.fixtures.server import FixtureServer
+
+ASSET_LATENCY = 0.05 # seconds, stands in for the round-trip to a remote CDN
+IMAGE_SIZE = 100 * 1024
+FONT_SIZE = 50 * 1024
+MEDIA_SIZE = 500 * 1024
+
+
+def _page(num_images: int) -> bytes:
+    images = "".join(f'<img src="/static/image-{i}.png">' for i in range(num_images))
+    return f"""<html><head>
+<style>@font-face {{ font-family: f; src: url(/static/font.woff2); }} body {{ font-family: f; }}</style>
+<script src="/li/track.js"></script>
+</head><body>
+<ul class="jobs-search-results">{"".join(f"<li>Job {i}</li>" for i in range(25))}</ul>
+{images}<video src="/static/video.mp4" autoplay muted></video>
+</body></html>""".encode("utf-8")
+
+
+def _asset(content_type: str, size: int):
+    def route(path, query):
+        time.sleep(ASSET_LATENCY)
+        return 200, content_type, b"\0" * size
+    return route
+
+
+def _routes(num_images: int) -> Dict:
+    return {
+        "/jobs/search": lambda path, query: (200, "text/html", _page(num_images)),
+        "/static/image-": _asset("image/png", IMAGE_SIZE),
+        "/static/font": _asset("font/woff2", FONT_SIZE),
+        "/static/video": _asset("video/mp4", MEDIA_SIZE),
+        "/li/track": _asset("application/javascript", 1024),
+    }
+
+
+def _measure(browser_type, url: str, runs: int, blocker: Optional[ResourceBlocker]) -> List[float]:
+    timings = []
+    with tempfile.TemporaryDirectory() as user_data_dir:
+        context = browser_type.launch_persistent_context(user_data_dir=user_data_dir, headless=True)
+        if blocker:
+            blocker.attach(context)
+        page = context.pages[0] if context.pages else context.new_page()
+        for run in range(runs):
+            start = time.perf_counter()
+            page.goto(f"{url}/jobs/search?run={run}", wait_until="load")
+            timings.append(time.perf_counter() - start)
+        context.close()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--images", type=int, default=25)
+    parser.add_argument("--browser", default="webkit", choices=["webkit", "chromium", "firefox"])
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+    LOGGER.setup(args.log_level)
+
+    with FixtureServer(_routes(args.images)) as server, sync_playwright() as playwright:
+        browser_type = getattr(playwright, args.browser)
+        baseline = ResourceBlocker([], [])
+        blocking = ResourceBlocker()
+        for name, blocker in [("no blocking", baseline), ("blocking", blocking)]:
+            timings = _measure(browser_type, server.url, args.runs, blocker)
+            stats = blocker.stats()
+            print(f"{name:>12}: median load {statistics.median(timings) * 1000:8.1f} ms, "
+                  f"{stats['allowed_requests'] / args.runs:5.1f} requests/page, "
+                  f"{stats['bytes_transferred'] / args.runs / 1024:8.1f} KiB/page, "
+                  f"blocked {stats['blocked_by_type']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/startup_time.py
+"""Measures the cold import time of the entry point modules with python -X importtime, in fresh interpreters,
+and lists the modules that cost the most, so a slow import added to a CLI or the test suite shows up.
+
+    python -m benchmarks.startup_time --runs 5 --top 10
+    python -m benchmarks.startup_time --modules src.utils.description_matcher --fail-above 300
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+MODULES = [
+    "src.logger",
+    "src.utils.description_matcher",
+    "src.utils.results_store",
+    "src.search.linkedin.snapshot_parser",
+    "src.facade",
+    "main",
+]
+
+# "import time:  self [us] | cumulative | imported package", nested imports indented by two spaces per level.
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def _import_times(module: str) -> Tuple[float, Dict[str, int]]:
+    """Wall-clock seconds of `import module` in a fresh interpreter and the self time in microseconds of every module imported,
+    including the ones the interpreter imports at startup."""
+    command = [sys.executable, "-X", "importtime", "-c", f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    self_times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_times[match.group(4)] = int(match.group(1))
+    return float(result.stdout.strip().splitlines()[-1]), self_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module, the median is reported")
+    parser.add_argument("--top", type=int, default=5, help="heaviest imported modules listed per module")
+    parser.add_argument("--fail-above", type=float, default=0, help="exit with an error when a median import takes longer, in ms")
+    args = parser.parse_args()
+
+    startup_modules = set(_import_times("time")[1])
+    slow: List[str] = []
+    for module in args.modules:
+        runs = [_import_times(module) for _ in range(args.runs)]
+        median = statistics.median(seconds for seconds, _ in runs) * 1000
+        self_times = {name: microseconds for name, microseconds in runs[-1][1].items() if name not in startup_modules}
+        heaviest = sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        print(f"{module:<40}: {median:8.1f} ms, {len(self_times)} modules imported")
+        for name, microseconds in heaviest:
+            print(f"    {name:<50} {microseconds / 1000:8.1f} ms")
+        if args.fail_above and median > args.fail_above:
+            slow.append(module)
+    if slow:
+        sys.exit(f"Imports slower than {args.fail_above} ms: {', '.join(slow)}")
+
+
+if __name__ == "__main__":
+    main()
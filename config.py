@@ -2,47 +2,83 @@
 
 import os
 import configparser
-import src.logger as LOGGER
 from src.constants.constants import Constants
 
+# Nothing is read on import: the entry point calls load() before importing the settings,
+# then validate() checks them and logging is set up by the entry point.
 config = configparser.ConfigParser()
-config.read("config.ini")
 
-chrome_user_data_path = os.environ.get("CHROME_USER_DATA")
-if not chrome_user_data_path:
-    raise ValueError("CHROME_USER_DATA environment variable is not set.")
-config.get("general", "user_data_path")
 
-# Load Credentials: (First from .env, else from config)
-linkedin_username = os.environ.get("LINKEDIN_USERNAME")
-if not linkedin_username:
-    linkedin_username = config.get("user_info", "username", fallback=None)
+def load(path: str = "config.ini") -> None:
+    """Reads `path` and the environment into the module settings."""
+    global config, chrome_user_data_path, linkedin_username, linkedin_password, resume_path, keywords_list, locations, epochs_ago, keywords, \
+        location, epoch_ago, parallel_queries, limit, tabs, fetch_descriptions, extraction, seen_jobs_path, snapshots_path, pacing_rate, \
+        pacing_max_rate, search_filters, matching_method, threshold, batch_size, concurrency, requests_per_minute, score_cache_path, \
+        score_cache_ttl, score_cache_max_entries, near_duplicate_distance, compact_descriptions, description_token_budget, \
+        user_description, results_db_path, session_state_path, results_log_path, checkpoint_path, metrics_path, engine, block_resources, \
+        blocked_resource_types, blocked_url_patterns, log_level, log_file_path
+    config = configparser.ConfigParser()
+    config.read(path)
+
+    chrome_user_data_path = os.environ.get("CHROME_USER_DATA")
+
+    # Load Credentials: (First from .env, else from config)
+    linkedin_username = os.environ.get("LINKEDIN_USERNAME") or config.get("user_info", "username", fallback=None)
+    linkedin_password = os.environ.get("LINKEDIN_PASSWORD") or config.get("user_info", "password", fallback=None)
+
+    # Load resume path
+    resume_path = config.get("general", "resume_path", fallback=None)
+
+    # ... other configuration ...
+    keywords_list = [item.strip() for item in config.get("search", "keywords", fallback="").split(";") if item.strip()] or [None]
+    locations = [item.strip() for item in config.get("search", "location", fallback="").split(";") if item.strip()] or [None]
+    epochs_ago = [int(item) for item in str(config.get("search", "epoch_ago", fallback=Constants.DEFAULT_EPOCH_AGO)).split(";") if item.strip()]
+    keywords, location, epoch_ago = keywords_list[0], locations[0], epochs_ago[0]
+    parallel_queries = int(config.get("search", "parallel_queries", fallback=Constants.DEFAULT_PARALLEL_QUERIES))
+    limit = int(config.get("search", "limit", fallback=Constants.DEFAULT_JOB_LIMIT))
+    tabs = int(config.get("search", "tabs", fallback=Constants.DEFAULT_EXTRACTION_TABS))
+    fetch_descriptions = config.getboolean("search", "fetch_descriptions", fallback=True)
+    extraction = config.get("search", "extraction", fallback=Constants.DEFAULT_EXTRACTION).lower()
+    seen_jobs_path = config.get("search", "seen_jobs_path", fallback=None)
+    snapshots_path = config.get("search", "snapshots_path", fallback=None)
+    pacing_rate = float(config.get("search", "pacing_rate", fallback=Constants.DEFAULT_PACING_RATE))
+    pacing_max_rate = float(config.get("search", "pacing_max_rate", fallback=Constants.DEFAULT_PACING_MAX_RATE))
+    search_filters = {name: config.get("search", name) for name in ["easy_apply", "experience", "workplace", "job_type", "sort_by"] if config.get("search", name, fallback="").strip()}
+    matching_method = config.get("matching", "method", fallback=Constants.DEFAULT_MATCHING_METHOD).lower()
+    threshold = int(config.get("matching", "threshold", fallback=Constants.DEFAULT_THRESHOLD))
+    batch_size = int(config.get("matching", "batch_size", fallback=Constants.DEFAULT_BATCH_SIZE))
+    concurrency = int(config.get("matching", "concurrency", fallback=Constants.DEFAULT_LLM_CONCURRENCY))
+    requests_per_minute = int(config.get("matching", "requests_per_minute", fallback=Constants.DEFAULT_LLM_REQUESTS_PER_MINUTE))
+    score_cache_path = config.get("matching", "cache_path", fallback=None)
+    score_cache_ttl = int(config.get("matching", "cache_ttl", fallback=Constants.DEFAULT_SCORE_CACHE_TTL))
+    score_cache_max_entries = int(config.get("matching", "cache_max_entries", fallback=Constants.DEFAULT_SCORE_CACHE_MAX_ENTRIES))
+    near_duplicate_distance = config.get("matching", "near_duplicate_distance", fallback=str(Constants.DEFAULT_NEAR_DUPLICATE_DISTANCE)).strip()
+    near_duplicate_distance = int(near_duplicate_distance) if near_duplicate_distance else None
+    compact_descriptions = config.getboolean("matching", "compact_descriptions", fallback=False)
+    description_token_budget = int(config.get("matching", "description_token_budget", fallback=Constants.DEFAULT_DESCRIPTION_TOKEN_BUDGET))
+    user_description = config.get("matching", "description", fallback=None)
+    results_db_path = config.get("general", "results_db_path", fallback=Constants.DEFAULT_RESULTS_DB_PATH)
+    session_state_path = config.get("general", "session_state_path", fallback=Constants.DEFAULT_SESSION_STATE_PATH) or None
+    results_log_path = config.get("general", "results_log_path", fallback=Constants.DEFAULT_RESULTS_LOG_PATH)
+    checkpoint_path = config.get("general", "checkpoint_path", fallback=Constants.DEFAULT_CHECKPOINT_PATH)
+    metrics_path = config.get("general", "metrics_path", fallback=None)
+    engine = config.get("general", "engine", fallback=Constants.DEFAULT_ENGINE).lower()
+    block_resources = config.getboolean("general", "block_resources", fallback=False)
+    blocked_resource_types = [item.strip() for item in config.get("general", "blocked_resource_types", fallback=", ".join(Constants.DEFAULT_BLOCKED_RESOURCE_TYPES)).split(",") if item.strip()]
+    blocked_url_patterns = [item.strip() for item in config.get("general", "blocked_url_patterns", fallback=", ".join(Constants.DEFAULT_BLOCKED_URL_PATTERNS)).split(",") if item.strip()]
+
+    # logging configuration
+    log_level = config.get("general", "log_level", fallback=Constants.DEFAULT_LOGGING_LEVEL)
+    log_file_path = config.get("general", "log_file_path", fallback=None)
+
+def validate() -> None:
+    """Raises ValueError for the required settings that are missing."""
+    config.get("general", "user_data_path")
+    if not chrome_user_data_path:
+        raise ValueError("CHROME_USER_DATA environment variable is not set.")
     if not linkedin_username:
         raise ValueError("LINKEDIN_USERNAME is not set in environment variables or config.ini.")
-
-linkedin_password = os.environ.get("LINKEDIN_PASSWORD")
-if not linkedin_password:
-    linkedin_password = config.get("user_info", "password", fallback=None)
     if not linkedin_password:
         raise ValueError("LINKEDIN_PASSWORD is not set in environment variables or config.ini.")
-
-# Load resume path
-resume_path = config.get("general", "resume_path", fallback=None)
-if not resume_path:
-    raise ValueError("Resume path is not set in config.ini.")
-
-# ... other configuration ...
-keywords = config.get("search", "keywords", fallback=None)
-location = config.get("search", "location", fallback=None)
-epoch_ago = int(config.get("search", "epoch_ago", fallback=Constants.DEFAULT_EPOCH_AGO))
-limit = int(config.get("search", "limit", fallback=Constants.DEFAULT_JOB_LIMIT))
-matching_method = config.get("matching", "method", fallback=Constants.DEFAULT_MATCHING_METHOD).lower()
-threshold = int(config.get("matching", "threshold", fallback=Constants.DEFAULT_THRESHOLD))
-user_description = config.get("matching", "description", fallback=None)
-output_file_name = config.get("general", "output_path", fallback=None)
-
-# logging configuration
-log_level = config.get("general", "log_level", fallback=Constants.DEFAULT_LOGGING_LEVEL)
-log_file_path = config.get("general", "log_file", fallback=None)
-if log_file_path:
-    LOGGER.set_output_path(log_file_path)
\ No newline at end of file
+    if not resume_path:
+        raise ValueError("Resume path is not set in config.ini.")
\ No newline at end of file
@@ -1,11 +1,26 @@
 # driver.py
 
+from typing import Optional
 from playwright.sync_api import sync_playwright
 from playwright.sync_api import BrowserContext
+from playwright.async_api import async_playwright
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from src.utils.resource_blocker import ResourceBlocker
 
-def initialize_driver(headless: bool = True, user_data_dir: str = "") -> BrowserContext:
+def initialize_driver(headless: bool = True, user_data_dir: str = "", resource_blocker: Optional[ResourceBlocker] = None) -> BrowserContext:
     playwright = sync_playwright().start()
     browser = playwright.webkit.launch_persistent_context(
                 user_data_dir=user_data_dir,
                 headless=headless)
+    if resource_blocker:
+        resource_blocker.attach(browser)
+    return browser
+
+async def initialize_async_driver(headless: bool = True, user_data_dir: str = "", resource_blocker: Optional[ResourceBlocker] = None) -> AsyncBrowserContext:
+    playwright = await async_playwright().start()
+    browser = await playwright.webkit.launch_persistent_context(
+                user_data_dir=user_data_dir,
+                headless=headless)
+    if resource_blocker:
+        await resource_blocker.attach_async(browser)
     return browser
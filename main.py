@@ -1,60 +1,173 @@
 # main.py
 
-import datetime
-import json
-from typing import List
-from dataclasses import asdict
-from driver import initialize_driver
+import argparse
+import asyncio
+import config
+from typing import Dict, List, Optional, Tuple
+from driver import initialize_driver, initialize_async_driver
 from dotenv import load_dotenv
 
 from src.constants.linkedin import LinkedInConstants
 from src.facade import Facade
+from src.async_facade import AsyncFacade
 from src.exceptions import AutomationError
+from src.run_matrix import AsyncRunMatrix, RunMatrix, SearchQuery, build_run_matrix
 from src.models.job import Job
+from src.utils.description_matcher import DescriptionMatcher
+from src.utils.score_cache import ScoreCache
+from src.utils.near_duplicates import NearDuplicates
+from src.utils.description_compactor import DescriptionCompactor
+from src.utils.resource_blocker import ResourceBlocker
+from src.utils.seen_jobs import SeenJobs
+from src.utils.jsonl_writer import JsonlWriter
+from src.utils.checkpoint import Checkpoint
+from src.utils.pacer import Pacer
+from src.utils.snapshot_store import SnapshotStore
+from src.utils.results_store import ResultsStore
 import src.logger as LOGGER
+import src.utils.metrics as METRICS
 
 logger = LOGGER.get(__name__)
 load_dotenv()
 
-def _save_results(path: str, jobs: List[Job]) -> None:
-    """Saves application results to a JSON file."""
+def _save_results(results: ResultsStore, jobs: List[Job], query: Optional[Dict] = None) -> None:
+    """Saves application results to the results store, in one transaction."""
     try:
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        output_file_name = f"{path}_{current_date}.json"
-
-        with open(output_file_name, 'w', encoding='utf-8') as f:
-            json.dump(list(map(asdict, jobs)), f, ensure_ascii=False, indent=4)
-        logger.info(f"Results saved to {output_file_name}")
+        with METRICS.span("save"):
+            results.add_many(jobs, query)
     except Exception as e:
-        logger.error(f"Error saving results to JSON: {e}")
+        logger.error(f"Error saving results to {results.path}: {e}")
+
+def _resume_point(checkpoint: Checkpoint, query: Dict, resume: bool, results_log_path: str, threshold: int) -> Tuple[Optional[Dict], List[Job]]:
+    """The checkpoint of the search to resume from, and the jobs it already matched, when `resume` is set."""
+    resume_from = checkpoint.load(query) if resume else None
+    if resume and not resume_from:
+        logger.warning("No checkpoint of this search to resume from, starting a new run.")
+    if not resume_from:
+        return None, []
+    logger.info(f"Resuming from results offset {resume_from['start']}, {resume_from['processed']} jobs already processed.")
+    return resume_from, [job for job in JsonlWriter.read(results_log_path) if job.score is not None and job.score >= threshold]
+
+async def _run_async(matcher: DescriptionMatcher, username: str, password: str, queries: List[SearchQuery], user_description: str, results: ResultsStore, user_data_path: str, limit: int, tabs: int, parallel_queries: int, session_state_path: Optional[str] = None, resource_blocker: Optional[ResourceBlocker] = None, seen: Optional[SeenJobs] = None, pacer: Optional[Pacer] = None, snapshots: Optional[SnapshotStore] = None, results_log_path: str = None, checkpoint_path: str = None, resume: bool = False) -> List[Job]:
+    """Runs the search pipeline on the asyncio engine, results are saved while jobs are still being scraped.
+    Several queries run on parallel pages of the logged-in context."""
+    logger.info("Initialize async Playwright")
+    browser = await initialize_async_driver(False, user_data_path, resource_blocker)
+    try:
+        facade = AsyncFacade(browser.pages[0], LinkedInConstants, matcher=matcher, tabs=tabs, seen=seen, session_path=session_state_path, pacer=pacer, snapshots=snapshots)
+        await facade.login(username, password)
+        if len(queries) > 1:
+            with JsonlWriter(results_log_path, append=False) as writer:
+                return await AsyncRunMatrix(browser, LinkedInConstants, matcher, queries, parallel_queries, tabs, seen, pacer, snapshots).run(user_description, limit, writer)
+        query = queries[0]
+        checkpoint = Checkpoint(checkpoint_path)
+        resume_from, jobs_to_apply = _resume_point(checkpoint, facade.query(query.keywords, query.location, query.epoch_ago, query.filters), resume, results_log_path, matcher.threshold)
+        with JsonlWriter(results_log_path, append=bool(resume_from)) as writer:
+            jobs_to_apply += await facade.run(user_description, query.keywords, query.location, query.epoch_ago, query.filters, limit=limit,
+                                              save=lambda jobs: _save_results(results, jobs, Facade.query(query.keywords, query.location, query.epoch_ago, query.filters)),
+                                              start=resume_from["start"] if resume_from else 0,
+                                              processed=resume_from["processed"] if resume_from else 0,
+                                              writer=writer, checkpoint=checkpoint)
+        checkpoint.clear()
+        return jobs_to_apply
+    finally:
+        logger.info("Close the browser")
+        await browser.close()
         
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Search LinkedIn jobs and filter them by description.")
+    parser.add_argument("--resume", action="store_true", help="continue the last interrupted search from its checkpoint")
+    return parser.parse_args()
+
 def main():
+    args = _parse_args()
+    results = None
     try:
-        logger.info("Load Configuration")
-        from config import matching_method, threshold, linkedin_password, linkedin_username, keywords, location, epoch_ago, user_description, output_file_name, log_level, chrome_user_data_path, resume_path, limit
-        if log_level: logger.setLevel(level=log_level)
+        config.load()
+        from config import validate, log_file_path, matching_method, threshold, linkedin_password, linkedin_username, keywords, location, epoch_ago, user_description, results_db_path, log_level, chrome_user_data_path, resume_path, limit, batch_size, concurrency, requests_per_minute, score_cache_path, score_cache_ttl, score_cache_max_entries, tabs, engine, fetch_descriptions, extraction, block_resources, blocked_resource_types, blocked_url_patterns, seen_jobs_path, results_log_path, checkpoint_path, keywords_list, locations, epochs_ago, parallel_queries, session_state_path, search_filters, pacing_rate, pacing_max_rate, metrics_path, snapshots_path, near_duplicate_distance, compact_descriptions, description_token_budget
+        LOGGER.setup(log_level, log_file_path)
+        logger.info("Configuration loaded")
+        validate()
+        metrics = METRICS.enable() if metrics_path else None
 
-        logger.info("Initialize Playwright")
-        browser = initialize_driver(False, chrome_user_data_path)
-        page = browser.pages[0]
+        score_cache = ScoreCache(score_cache_path, score_cache_ttl, score_cache_max_entries) if score_cache_path else None
+        duplicates = NearDuplicates(near_duplicate_distance) if near_duplicate_distance is not None else None
+        compactor = DescriptionCompactor(description_token_budget) if compact_descriptions else None
+        matcher = DescriptionMatcher(matching_method, threshold, batch_size=batch_size, concurrency=concurrency, requests_per_minute=requests_per_minute, cache=score_cache, duplicates=duplicates, compactor=compactor)
+        seen = SeenJobs(seen_jobs_path) if seen_jobs_path else None
+        snapshots = SnapshotStore(snapshots_path) if snapshots_path else None
+        results = ResultsStore(results_db_path)
+        resource_blocker = ResourceBlocker(blocked_resource_types, blocked_url_patterns) if block_resources else None
+        pacer = Pacer(pacing_rate, pacing_max_rate, challenge_urls=LinkedInConstants.CHALLENGE_URLS) if pacing_rate > 0 else None
+        queries = build_run_matrix(keywords_list, locations, epochs_ago, search_filters)
 
-        logger.info("Initialize and run the facade")
-        facade = Facade(page, LinkedInConstants, matching_method, threshold)
-        facade.login(linkedin_username, linkedin_password)
-        # Search for Jobs
-        jobs = facade.search_jobs(keywords, location, epoch_ago, limit=limit)
-        jobs_to_apply = facade.filter_jobs(jobs, user_description)
+        if len(queries) > 1 and args.resume:
+            logger.warning(f"--resume only applies to single query searches, the {len(queries)} queries start over.")
+        if engine == "async":
+            if extraction != "dom" or not fetch_descriptions:
+                logger.warning(f"The async engine always extracts the full jobs from the DOM, extraction = {extraction} and fetch_descriptions = {fetch_descriptions} are ignored.")
+            jobs_to_apply = asyncio.run(_run_async(matcher, linkedin_username, linkedin_password, queries, user_description, results, chrome_user_data_path, limit, tabs, parallel_queries, session_state_path, resource_blocker,
+                                                   seen, pacer, snapshots, results_log_path, checkpoint_path, args.resume))
+        else:
+            logger.info("Initialize Playwright")
+            browser = initialize_driver(False, chrome_user_data_path, resource_blocker)
+            page = browser.pages[0]
 
-        logger.info("Close the browser")
-        browser.close()
+            logger.info("Initialize and run the facade")
+            facade = Facade(page, LinkedInConstants, matching_method, threshold, matcher=matcher, tabs=tabs, seen=seen, session_path=session_state_path, pacer=pacer, snapshots=snapshots)
+            facade.login(linkedin_username, linkedin_password)
+            # Search for Jobs
+            if len(queries) > 1:
+                if extraction != "dom" or not fetch_descriptions:
+                    logger.warning(f"Several search queries always extract the full jobs from the DOM, extraction = {extraction} and fetch_descriptions = {fetch_descriptions} are ignored.")
+                if parallel_queries > 1:
+                    logger.warning(f"The sync engine runs the search queries one after the other, parallel_queries = {parallel_queries} is ignored.")
+                logger.info(f"Running {len(queries)} search queries in one session")
+                with JsonlWriter(results_log_path, append=False) as writer:
+                    jobs_to_apply = RunMatrix(facade, queries).run(user_description, limit, writer)
+            elif extraction == "network":
+                jobs = facade.search_jobs_from_network(keywords, location, epoch_ago, search_filters, limit=limit, descriptions=fetch_descriptions)
+                if fetch_descriptions:
+                    jobs_to_apply = facade.filter_jobs(jobs, user_description)
+                else:
+                    jobs_to_apply = facade.filter_job_cards(jobs, user_description)
+            elif fetch_descriptions:
+                checkpoint = Checkpoint(checkpoint_path)
+                resume_from, jobs_to_apply = _resume_point(checkpoint, Facade.query(keywords, location, epoch_ago, search_filters), args.resume, results_log_path, matcher.threshold)
+                with JsonlWriter(results_log_path, append=bool(resume_from)) as writer:
+                    for job in facade.iter_filtered(user_description, keywords, location, epoch_ago, search_filters, limit=limit,
+                                                    start=resume_from["start"] if resume_from else 0,
+                                                    processed=resume_from["processed"] if resume_from else 0,
+                                                    writer=writer, checkpoint=checkpoint):
+                        jobs_to_apply.append(job)
+                checkpoint.clear()
+            else:
+                jobs = facade.search_job_cards(keywords, location, epoch_ago, search_filters, limit=limit)
+                jobs_to_apply = facade.filter_job_cards(jobs, user_description)
+
+            logger.info("Close the browser")
+            browser.close()
 
-        logger.info("Save results")
-        _save_results(output_file_name, jobs_to_apply)
+        if resource_blocker: resource_blocker.log_stats()
+        if seen: seen.log_stats()
+        if pacer: pacer.log_stats()
+        if snapshots: snapshots.log_stats()
+        if duplicates: duplicates.log_stats()
+        if compactor: compactor.log_stats()
+        # The async engine already saved the matches of every scored batch.
+        if engine != "async":
+            logger.info("Save results")
+            _save_results(results, jobs_to_apply, Facade.query(keywords, location, epoch_ago, search_filters) if len(queries) == 1 else None)
+        if metrics:
+            metrics.log_summary()
+            metrics.export(metrics_path)
 
     except Exception as e:
         error_msg = f"Failed in main execution: {str(e)}"
         logger.error(error_msg)
         raise AutomationError(error_msg) from e
+    finally:
+        if results: results.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
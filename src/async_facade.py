@@ -0,0 +1,162 @@
+# src/async_facade.py
+
+import asyncio
+import src.logger as LOGGER
+import src.utils.metrics as METRICS
+from time import perf_counter
+from playwright.async_api import Page
+from typing import Callable, List, Dict, Optional
+
+from src.facade import Facade
+from src.login.async_login import AsyncLogin
+from src.search.linkedin.async_search import AsyncJobSearch
+from src.models.job import Job
+from src.utils.description_matcher import DescriptionMatcher
+from src.utils.seen_jobs import SeenJobs
+from src.utils.jsonl_writer import JsonlWriter
+from src.utils.checkpoint import Checkpoint
+from src.utils.pacer import Pacer
+from src.utils.snapshot_store import SnapshotStore
+
+from src.constants.constants import Constants
+
+
+logger = LOGGER.get(__name__)
+
+class AsyncFacade:
+    """asyncio facade for LinkedIn automation, scraping, scoring and saving run as concurrent tasks."""
+
+    # The checkpoint query and the seen jobs bookkeeping do not touch the page, share them with the sync facade.
+    query = staticmethod(Facade.query)
+    mark_seen = Facade.mark_seen
+
+    def __init__(self, page: Page, constants: Constants, method: str = "llm", threshold: int = Constants.DEFAULT_THRESHOLD, matcher: Optional[DescriptionMatcher] = None, tabs: int = Constants.DEFAULT_EXTRACTION_TABS, seen: Optional[SeenJobs] = None, session_path: Optional[str] = None, pacer: Optional[Pacer] = None, snapshots: Optional[SnapshotStore] = None):
+        logger.debug("AsyncFacade instance is created")
+        self.page = page
+        self.login_obj = AsyncLogin(self.page, constants)
+        self.search_obj = AsyncJobSearch(self.page, constants, tabs, seen, pacer, snapshots)
+        self.matcher = matcher if matcher else DescriptionMatcher(method, threshold)
+        self.seen = seen
+        self.session_path = session_path
+        self.login_seconds: Optional[float] = None
+        self.constants = constants
+
+    async def login(self, username: str, password: str) -> None:
+        """Reuses the saved session when a single request shows it is still valid, otherwise logs in with the form."""
+        logger.debug("AsyncFacade.login")
+        start = perf_counter()
+        with METRICS.span("login"):
+            if self.page.url == self.constants.FEED_URL:
+                method = "already on the feed"
+            else:
+                if self.session_path:
+                    await self.login_obj.load_session(self.session_path)
+                if await self.login_obj.is_logged_in():
+                    method = "session reused"
+                else:
+                    await self.login_obj.login(username, password)
+                    method = "login form"
+                    if self.session_path:
+                        await self.login_obj.save_session(self.session_path)
+        self.login_seconds = perf_counter() - start
+        logger.info(f"Login overhead: {self.login_seconds:.2f}s ({method})")
+
+    async def search_jobs(self,
+                          keywords: Optional[str] = None,
+                          location: Optional[str] = None,
+                          epoch_ago: Optional[str] = None,
+                          filters: Optional[Dict[str, str]] = None,
+                          limit: Optional[int] = None
+                      ) -> List[Job]:
+        logger.debug("AsyncFacade.search_jobs")
+        return await self.search_obj.search_jobs(keywords=keywords,
+                                                 location=location,
+                                                 epoch_ago=epoch_ago,
+                                                 additional_filters=filters,
+                                                 limit=limit)
+
+    async def filter_jobs(self, jobs: List[Job], user_description: str) -> List[Job]:
+        """Filters jobs based on user description, the raw score is kept on every job.
+        The blocking matcher runs in a worker thread."""
+        logger.debug("AsyncFacade.filter_jobs")
+        scores = await asyncio.to_thread(self.matcher.scores, [job.description for job in jobs], user_description)
+        for job, score in zip(jobs, scores):
+            job.score = score
+        self.mark_seen(jobs)
+        return [job for job in jobs if job.score >= self.matcher.threshold]
+
+    async def run(self,
+                  user_description: str,
+                  keywords: Optional[str] = None,
+                  location: Optional[str] = None,
+                  epoch_ago: Optional[str] = None,
+                  filters: Optional[Dict[str, str]] = None,
+                  limit: Optional[int] = None,
+                  save: Optional[Callable[[List[Job]], None]] = None,
+                  start: int = 0,
+                  processed: int = 0,
+                  writer: Optional[JsonlWriter] = None,
+                  checkpoint: Optional[Checkpoint] = None
+              ) -> List[Job]:
+        """Searches, filters and saves jobs as three concurrent tasks.
+        Extracted jobs are scored in batches of matcher.batch_size, up to matcher.concurrency batches at once,
+        while the browser keeps extracting. Scored batches are stored in extraction order,
+        `save` is called in a worker thread with the newly matched jobs of every scored batch.
+        Every scored batch is appended to `writer` and the search position is then saved to `checkpoint`,
+        an interrupted run resumes by passing the checkpoint `start` and `processed` back."""
+        logger.debug("AsyncFacade.run")
+        if limit and processed >= limit:
+            return []
+        query = self.query(keywords, location, epoch_ago, filters)
+        extractor = self.search_obj.job_extractor
+        extracted: asyncio.Queue = asyncio.Queue()
+        matched: asyncio.Queue = asyncio.Queue()
+        scoring_slots = asyncio.Semaphore(self.matcher.concurrency)
+        jobs_to_apply: List[Job] = []
+
+        async def scrape() -> None:
+            try:
+                async for job in self.search_obj.iter_jobs(keywords, location, epoch_ago, filters, limit - processed if limit else limit, start):
+                    await extracted.put((job, extractor.position, processed + extractor.processed))
+            finally:
+                await extracted.put(None)
+
+        async def filter_batch(batch: List[Job]) -> List[Job]:
+            try:
+                return await self.filter_jobs(batch, user_description)
+            finally:
+                scoring_slots.release()
+
+        async def score() -> None:
+            try:
+                batch: List[Job] = []
+                while True:
+                    item = await extracted.get()
+                    if item is not None:
+                        job, position, batch_processed = item
+                        batch.append(job)
+                    if batch and (item is None or len(batch) >= self.matcher.batch_size):
+                        await scoring_slots.acquire()
+                        await matched.put((batch, asyncio.create_task(filter_batch(batch)), position, batch_processed))
+                        batch = []
+                    if item is None:
+                        break
+            finally:
+                await matched.put(None)
+
+        async def store() -> None:
+            while (item := await matched.get()) is not None:
+                batch, scoring, position, batch_processed = item
+                jobs = await scoring
+                jobs_to_apply.extend(jobs)
+                if writer:
+                    with METRICS.span("save"):
+                        writer.write_many(batch)
+                if checkpoint:
+                    checkpoint.save(query, position, batch_processed)
+                if save and jobs:
+                    await asyncio.to_thread(save, jobs)
+
+        await asyncio.gather(scrape(), score(), store())
+        logger.info(f"{len(jobs_to_apply)} jobs matched.")
+        return jobs_to_apply
@@ -11,6 +11,42 @@ class Constants():
     DEFAULT_MATCHING_METHOD = "llm"
     DEFAULT_JOB_LIMIT = 10
     DEFAULT_EPOCH_AGO = 86400
+    DEFAULT_BATCH_SIZE = 10
+    DEFAULT_EXTRACTION_TABS = 1
+    CARD_SCROLL_DELAY = 50 # milliseconds to let a results card render after scrolling it into view
+    DEFAULT_ENGINE = "sync" # "sync" or "async"
+    DEFAULT_PARALLEL_QUERIES = 1 # queries of the run matrix searched at the same time, async engine only
+    DEFAULT_EXTRACTION = "dom" # "dom" scrapes the rendered pages, "network" reads the API responses
+    DEFAULT_LLM_CONCURRENCY = 1
+    DEFAULT_LLM_REQUESTS_PER_MINUTE = 0 # 0 means unlimited
+    LLM_MAX_RETRIES = 3
+    LLM_RETRY_BACKOFF = 2 # seconds, doubled on every retry
+    DEFAULT_SCORE_CACHE_PATH = "data/cache/scores.sqlite"
+    DEFAULT_SCORE_CACHE_TTL = 604800 # seconds, 0 means entries never expire
+    DEFAULT_SCORE_CACHE_MAX_ENTRIES = 10000 # 0 means unlimited
+    DEFAULT_NEAR_DUPLICATE_DISTANCE = 6 # SimHash bits two job descriptions may differ by and still share one score
+    NEAR_DUPLICATE_SHINGLE_SIZE = 3 # words per shingle of the SimHash fingerprint
+    DEFAULT_DESCRIPTION_TOKEN_BUDGET = 400 # tokens a compacted job description is capped at, 0 means no cap
+    CHARS_PER_TOKEN = 4 # rough characters per LLM token, for token estimates
+    DEFAULT_VECTOR_FEATURES = 2 ** 20 # hashed feature space of the "vector" matching method
+    VECTOR_FEATURE_CACHE_SIZE = 100000 # most recently used token hashes kept by the "vector" matching method
+    DEFAULT_RESULTS_LOG_PATH = "data/results/results.jsonl"
+    DEFAULT_RESULTS_DB_PATH = "data/results/results.sqlite"
+    DEFAULT_CHECKPOINT_PATH = "data/results/checkpoint.json"
+    RESULTS_FSYNC_INTERVAL = 5 # seconds between fsyncs of the results log
+    DEFAULT_SESSION_STATE_PATH = "data/personal/storage_state.json"
+    DEFAULT_SEEN_JOBS_PATH = "data/cache/seen_jobs.sqlite"
+    DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+    DEFAULT_PACING_RATE = 1.0 # browser actions per second the pacer starts at, 0 disables pacing
+    DEFAULT_PACING_MAX_RATE = 4.0 # actions per second the pacer may speed up to while the site responds normally
+    PACING_MIN_RATE = 0.1
+    PACING_BURST = 5 # actions allowed back to back before the rate applies
+    PACING_JITTER = 0.3 # random extra wait, as a fraction of the interval between actions
+    PACING_SPEEDUP = 1.05 # rate multiplier after every healthy navigation
+    PACING_BACKOFF = 5 # seconds, doubled on every consecutive throttling
+    PACING_MAX_BACKOFF = 300
+    PACING_CLICK_COST = 0.5 # tokens of a results card click, a navigation costs 1
+    DEFAULT_BLOCKED_URL_PATTERNS = ["*doubleclick.net*", "*googletagmanager.com*", "*google-analytics.com*", "*px.ads.linkedin.com*", "*/li/track*"]
 
     # --- Logging ---
     LOGGING_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'  # Standard logging format
@@ -31,6 +67,13 @@ class Constants():
     LOGIN_URL = None
     FEED_URL = None
     JOBS_SEARCH_URL = None
+    JOB_VIEW_URL = None # formatted with job_id
+    CHALLENGE_URLS = [] # URL fragments of the pages the site shows instead of results when it suspects a bot
+
+    # --- API endpoints (URL fragments of the JSON responses the site UI loads) ---
+    class Api:
+        def __init__(self):
+            raise NotImplementedError("Abstarct Constants class does not have Api implementation.")
 
     # --- Locators ---
     class Locators:
@@ -8,6 +8,13 @@ class LinkedInConstants(Constants):
     LOGIN_URL = "https://www.linkedin.com/login"
     FEED_URL = "https://www.linkedin.com/feed/"
     JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+    JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{job_id}/"
+    CHALLENGE_URLS = ["/checkpoint/challenge", "/authwall"]
+
+    # --- LinkedIn API endpoints ---
+    class Api:
+        JOB_CARDS = "/voyager/api/voyagerJobsDashJobCards"
+        JOB_POSTING = "/voyager/api/jobs/jobPostings/"
 
     # --- Locators ---
     class Locators:
@@ -28,10 +35,19 @@ class LinkedInConstants(Constants):
             LOCATION = "xpath=//div[contains(@class, 'primary-description')]"
             URL = "//a[@class='ember-view']"
             DESCRIPTION = "//div[@id='job-details']"
+            DETAILS_PANE = "//div[contains(@class, 'jobs-details')]" # container of all the fields above, kept by the snapshot store
             EASY_APPLY = "//button[span[text()='Easy Apply']]"
             APPLY = "//button[span[text()='Apply']]"
             SEARCH_RESULTS = "//li[contains(@class, 'occludable-update')]"
 
+        class Card: # relative to a single SEARCH_RESULTS item
+            TITLE = ".//a[contains(@class, 'job-card-list__title') or contains(@class, 'job-card-container__link')]"
+            COMPANY = ".//*[contains(@class, 'artdeco-entity-lockup__subtitle')]"
+            LOCATION = ".//*[contains(@class, 'artdeco-entity-lockup__caption')]"
+            URL = ".//a[contains(@class, 'job-card-list__title') or contains(@class, 'job-card-container__link')]"
+            EASY_APPLY = ".//*[contains(@class, 'job-card-container__footer-item') and contains(normalize-space(.), 'Easy Apply')]"
+            JOB_ID_ATTRIBUTE = "data-occludable-job-id"
+
     NUM_OF_JOBS_IN_PAGE = 25
     URL_PAGE_NUM_PARAMETER = "&start="
 
@@ -1,13 +1,22 @@
 # src/facade.py
 
 import src.logger as LOGGER
+import src.utils.metrics as METRICS
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
 from playwright.sync_api import Page
-from typing import List, Dict, Optional
+from typing import Callable, Deque, Iterator, List, Dict, Optional, Tuple
 
 from src.login.login import Login
 from src.search.linkedin.search import JobSearch
 from src.models.job import Job
 from src.utils.description_matcher import DescriptionMatcher
+from src.utils.seen_jobs import SeenJobs
+from src.utils.jsonl_writer import JsonlWriter
+from src.utils.checkpoint import Checkpoint
+from src.utils.pacer import Pacer
+from src.utils.snapshot_store import SnapshotStore
 
 from src.constants.constants import Constants
 
@@ -17,18 +26,37 @@ logger = LOGGER.get(__name__)
 class Facade:
     """Facade class for LinkedIn automation."""
 
-    def __init__(self, page: Page, constants: Constants, method: str = "llm", threshold: int = Constants.DEFAULT_THRESHOLD):
+    def __init__(self, page: Page, constants: Constants, method: str = "llm", threshold: int = Constants.DEFAULT_THRESHOLD, matcher: Optional[DescriptionMatcher] = None, tabs: int = Constants.DEFAULT_EXTRACTION_TABS, seen: Optional[SeenJobs] = None, session_path: Optional[str] = None, pacer: Optional[Pacer] = None, snapshots: Optional[SnapshotStore] = None):
         logger.debug("Facade instance is created")
         self.page = page
         self.login_obj = Login(self.page, constants)
-        self.search_obj = JobSearch(self.page, constants)
-        self.matcher = DescriptionMatcher(method, threshold)
+        self.search_obj = JobSearch(self.page, constants, tabs, seen, pacer, snapshots)
+        self.matcher = matcher if matcher else DescriptionMatcher(method, threshold)
+        self.seen = seen
+        self.session_path = session_path
+        self.login_seconds: Optional[float] = None
         self.constants = constants
 
     def login(self, username: str, password: str) -> None:
+        """Reuses the saved session when a single request shows it is still valid, otherwise logs in with the form
+        and saves the new session. The time spent is logged and kept in login_seconds."""
         logger.debug("Facade.login")
-        if self.page.url != self.constants.FEED_URL:
-            self.login_obj.login(username, password)
+        start = perf_counter()
+        with METRICS.span("login"):
+            if self.page.url == self.constants.FEED_URL:
+                method = "already on the feed"
+            else:
+                if self.session_path:
+                    self.login_obj.load_session(self.session_path)
+                if self.login_obj.is_logged_in():
+                    method = "session reused"
+                else:
+                    self.login_obj.login(username, password)
+                    method = "login form"
+                    if self.session_path:
+                        self.login_obj.save_session(self.session_path)
+        self.login_seconds = perf_counter() - start
+        logger.info(f"Login overhead: {self.login_seconds:.2f}s ({method})")
 
     def search_jobs(self, 
                     keywords: Optional[str] = None, 
@@ -44,8 +72,146 @@ class Facade:
                                            additional_filters=filters, 
                                            limit=limit)
     
+    def iter_jobs(self,
+                  keywords: Optional[str] = None,
+                  location: Optional[str] = None,
+                  epoch_ago: Optional[str] = None,
+                  filters: Optional[Dict[str, str]] = None,
+                  limit: Optional[int] = None,
+                  start: int = 0
+              ) -> Iterator[Job]:
+        logger.debug("Facade.iter_jobs")
+        return self.search_obj.iter_jobs(keywords=keywords,
+                                         location=location,
+                                         epoch_ago=epoch_ago,
+                                         additional_filters=filters,
+                                         limit=limit,
+                                         start=start)
+
+    def search_job_cards(self,
+                         keywords: Optional[str] = None,
+                         location: Optional[str] = None,
+                         epoch_ago: Optional[str] = None,
+                         filters: Optional[Dict[str, str]] = None,
+                         limit: Optional[int] = None
+                     ) -> List[Job]:
+        """Searches jobs reading only the result cards, use fetch_descriptions for the jobs that need one."""
+        logger.debug("Facade.search_job_cards")
+        return self.search_obj.search_job_cards(keywords=keywords,
+                                                location=location,
+                                                epoch_ago=epoch_ago,
+                                                additional_filters=filters,
+                                                limit=limit)
+
+    def search_jobs_from_network(self,
+                                 keywords: Optional[str] = None,
+                                 location: Optional[str] = None,
+                                 epoch_ago: Optional[str] = None,
+                                 filters: Optional[Dict[str, str]] = None,
+                                 limit: Optional[int] = None,
+                                 descriptions: bool = True
+                             ) -> List[Job]:
+        """Searches jobs building them from the site JSON responses instead of scraping the DOM."""
+        logger.debug("Facade.search_jobs_from_network")
+        return self.search_obj.search_jobs_from_network(keywords=keywords,
+                                                        location=location,
+                                                        epoch_ago=epoch_ago,
+                                                        additional_filters=filters,
+                                                        limit=limit,
+                                                        descriptions=descriptions)
+
+    def fetch_descriptions(self, jobs: List[Job]) -> List[Job]:
+        logger.debug("Facade.fetch_descriptions")
+        return self.search_obj.job_extractor.fetch_descriptions(jobs)
+
     def filter_jobs(self, jobs: List[Job], user_description: str) -> List[Job]:
-        """Filters jobs based on user description."""
+        """Filters jobs based on user description, the raw score is kept on every job."""
         logger.debug("Facade.filter_jobs")
-        jobs_to_apply = [job for job in jobs if self.matcher.matches(job.description, user_description)]
-        return jobs_to_apply
\ No newline at end of file
+        scores = self.matcher.scores([job.description for job in jobs], user_description)
+        for job, score in zip(jobs, scores):
+            job.score = score
+        self.mark_seen(jobs)
+        jobs_to_apply = [job for job in jobs if job.score >= self.matcher.threshold]
+        return jobs_to_apply
+
+    def filter_job_cards(self, jobs: List[Job], user_description: str) -> List[Job]:
+        """Filters jobs extracted without their description. Jobs seen in previous runs are dropped first,
+        the descriptions are then fetched for the remaining jobs only and they are scored like filter_jobs."""
+        logger.debug("Facade.filter_job_cards")
+        known = self.seen.known(SeenJobs.job_id(job) for job in jobs) if self.seen else set()
+        jobs = [job for job in jobs if SeenJobs.job_id(job) not in known]
+        self.fetch_descriptions(jobs)
+        described = [job for job in jobs if job.description]
+        if len(described) < len(jobs):
+            logger.warning(f"No description fetched for {len(jobs) - len(described)} jobs, they are not scored.")
+        return self.filter_jobs(described, user_description)
+
+    def iter_filtered(self,
+                      user_description: str,
+                      keywords: Optional[str] = None,
+                      location: Optional[str] = None,
+                      epoch_ago: Optional[str] = None,
+                      filters: Optional[Dict[str, str]] = None,
+                      limit: Optional[int] = None,
+                      start: int = 0,
+                      processed: int = 0,
+                      writer: Optional[JsonlWriter] = None,
+                      checkpoint: Optional[Checkpoint] = None,
+                      exclude: Optional[Callable[[Job], bool]] = None
+                  ) -> Iterator[Job]:
+        """Searches and filters jobs as a stream, yielding the matched jobs in extraction order.
+        The browser keeps extracting on the calling thread while batches of matcher.batch_size jobs
+        are scored by up to matcher.concurrency worker threads, so scraping and scoring overlap.
+        Every scored batch is appended to `writer` and the search position is then saved to `checkpoint`,
+        an interrupted run resumes by passing the checkpoint `start` and `processed` back.
+        Extracted jobs for which `exclude` returns True are dropped without being scored."""
+        logger.debug("Facade.iter_filtered")
+        if limit and processed >= limit:
+            return
+        query = self.query(keywords, location, epoch_ago, filters)
+        extractor = self.search_obj.job_extractor
+        pending: Deque[Tuple[Future, List[Job], int, int]] = deque()
+        batch: List[Job] = []
+
+        def submit(batch: List[Job]) -> None:
+            future = executor.submit(self.filter_jobs, batch, user_description)
+            pending.append((future, batch, extractor.position, processed + extractor.processed))
+
+        def complete() -> List[Job]:
+            future, batch, position, batch_processed = pending.popleft()
+            jobs_to_apply = future.result()
+            if writer:
+                with METRICS.span("save"):
+                    writer.write_many(batch)
+            if checkpoint:
+                checkpoint.save(query, position, batch_processed)
+            return jobs_to_apply
+
+        with ThreadPoolExecutor(max_workers=self.matcher.concurrency) as executor:
+            for job in self.iter_jobs(keywords, location, epoch_ago, filters, limit - processed if limit else limit, start):
+                if exclude and exclude(job):
+                    continue
+                batch.append(job)
+                if len(batch) >= self.matcher.batch_size:
+                    submit(batch)
+                    batch = []
+                while pending and pending[0][0].done():
+                    yield from complete()
+            if batch:
+                submit(batch)
+            while pending:
+                yield from complete()
+
+    @staticmethod
+    def query(keywords: Optional[str] = None,
+              location: Optional[str] = None,
+              epoch_ago: Optional[str] = None,
+              filters: Optional[Dict[str, str]] = None) -> Dict:
+        """The search parameters identifying a run in its checkpoint."""
+        return {"keywords": keywords, "location": location, "epoch_ago": epoch_ago, "filters": filters}
+
+    def mark_seen(self, jobs: List[Job]) -> None:
+        """Records jobs in the seen jobs index, so the next runs skip them."""
+        logger.debug("Facade.mark_seen")
+        if self.seen:
+            self.seen.record(jobs)
\ No newline at end of file
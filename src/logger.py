@@ -1,19 +1,28 @@
 # src\logger.py
 
 import logging
+import os
+from typing import Optional
 from src.constants.constants import Constants
 
-logging.basicConfig(level=Constants.DEFAULT_LOGGING_LEVEL, format=Constants.LOGGING_FORMAT)
-
 
 def get(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
+def setup(level: str = Constants.DEFAULT_LOGGING_LEVEL, path: Optional[str] = None) -> None:
+    """Configures the root logger, called once by the entry points instead of on import.
+    Logs also go to `path`, or to DEFAULT_LOGGING_FILE when LOG_TO_FILE is set."""
+    logging.basicConfig(level=level, format=Constants.LOGGING_FORMAT)
+    logging.getLogger().setLevel(level)
+    path = path or (Constants.DEFAULT_LOGGING_FILE if Constants.LOG_TO_FILE else None)
+    if path:
+        set_output_path(path)
+
 def set_output_path(path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
     file_handler = logging.FileHandler(path, encoding="utf-8")
     formatter = logging.Formatter(Constants.LOGGING_FORMAT)
     file_handler.setFormatter(formatter)
     logging.getLogger().addHandler(file_handler)
-
-if Constants.LOG_TO_FILE:
-    set_output_path(Constants.DEFAULT_LOGGING_FILE)
@@ -0,0 +1,77 @@
+# src/login/async_login.py
+
+import json
+import os
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+import src.logger as LOGGER
+from src.exceptions import LoginError
+from src.constants.constants import Constants
+
+logger = LOGGER.get(__name__)
+
+class AsyncLogin:
+    """asyncio counterpart of Login, built on playwright.async_api."""
+
+    def __init__(self, page: Page, constants: Constants):
+        logger.debug("AsyncLogin instance created")
+        self.page = page
+        self.constants = constants
+        self.timeout = Constants.DEFAULT_TIMEOUT * 1000
+
+    async def is_logged_in(self) -> bool:
+        """Checks the session with a single request of the feed, without rendering it."""
+        logger.debug("AsyncLogin.is_logged_in")
+        try:
+            response = await self.page.context.request.get(self.constants.FEED_URL, max_redirects=0, timeout=self.timeout)
+            logger.debug(f"Session check status: {response.status}")
+            return response.status == 200
+        except Exception as e:
+            logger.warning(f"Session check failed: {str(e)}")
+            return False
+
+    async def load_session(self, path: str) -> bool:
+        """Adds the cookies of a saved storage state to the browser context."""
+        logger.debug("AsyncLogin.load_session")
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, encoding="utf-8") as f:
+                cookies = json.load(f).get("cookies") or []
+            await self.page.context.add_cookies(cookies)
+            return bool(cookies)
+        except Exception as e:
+            logger.warning(f"Failed loading session state {path}: {str(e)}")
+            return False
+
+    async def save_session(self, path: str) -> None:
+        logger.debug("AsyncLogin.save_session")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        await self.page.context.storage_state(path=path)
+
+    async def login(self, username: str, password: str):
+        """Logs into site."""
+        logger.info("Starting Login process...")
+        login_url = self.constants.LOGIN_URL
+        feed_url = self.constants.FEED_URL
+        await self.page.goto(login_url)
+
+        try:
+            await self.page.wait_for_url(lambda url: url != login_url, timeout=self.timeout)
+            if feed_url in self.page.url:
+                logger.info("Already login.")
+            else:
+                logger.info("Not login, performing login.")
+                await self.page.fill(self.constants.Locators.Login.USERNAME_FIELD, username, timeout=self.timeout)
+                await self.page.fill(self.constants.Locators.Login.PASSWORD_FIELD, password, timeout=self.timeout)
+                await self.page.click(self.constants.Locators.Login.LOGIN_BUTTON, timeout=self.timeout)
+                await self.page.wait_for_url(lambda url: feed_url in url, timeout=self.timeout)
+                logger.info("Login successful.")
+        except PlaywrightTimeoutError:
+            if feed_url in self.page.url:
+                logger.info("Already login.")
+            else:
+                raise LoginError("Login failed Due to timeout.")
+        except Exception as e:
+            raise LoginError(f"An unexpected error occurred during login: {str(e)}")
@@ -1,5 +1,7 @@
 # src/login/login.py
 
+import json
+import os
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from playwright_utils import wait_for_element, wait_for_url_change, send_keys_safely
 import src.logger as LOGGER
@@ -16,6 +18,39 @@ class Login:
         self.page = page
         self.constants = constants
 
+    def is_logged_in(self) -> bool:
+        """Checks the session with a single request of the feed, without rendering it:
+        a valid session gets the page, an expired one is redirected to the login."""
+        logger.debug("Login.is_logged_in")
+        try:
+            response = self.page.context.request.get(self.constants.FEED_URL, max_redirects=0, timeout=self.constants.DEFAULT_TIMEOUT * 1000)
+            logger.debug(f"Session check status: {response.status}")
+            return response.status == 200
+        except Exception as e:
+            logger.warning(f"Session check failed: {str(e)}")
+            return False
+
+    def load_session(self, path: str) -> bool:
+        """Adds the cookies of a saved storage state to the browser context."""
+        logger.debug("Login.load_session")
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, encoding="utf-8") as f:
+                cookies = json.load(f).get("cookies") or []
+            self.page.context.add_cookies(cookies)
+            return bool(cookies)
+        except Exception as e:
+            logger.warning(f"Failed loading session state {path}: {str(e)}")
+            return False
+
+    def save_session(self, path: str) -> None:
+        logger.debug("Login.save_session")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.page.context.storage_state(path=path)
+
     def login(self, username: str, password: str):
         """Logs into site."""
         logger.info("Starting Login process...")
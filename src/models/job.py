@@ -4,7 +4,7 @@ from typing import Dict, Optional, List
 from dataclasses import dataclass
 
 
-@dataclass  # Use dataclass for concise class definition
+@dataclass(slots=True)  # Use dataclass for concise class definition, slots keep the many jobs of a run compact
 class Job:
     title: str
     company: str
@@ -16,6 +16,9 @@ class Job:
     # Add other relevant attributes as needed (e.g., seniority level, job type, etc.)
     application_status: Optional[str] = None # "Applied", "Not Applied", "Failed" etc.
     raw_data: Optional[Dict] = None # Store the unprocessed or original data format
+    score: Optional[int] = None # Raw 0-100 match score, set when the job is filtered
+    queries: Optional[List[Dict]] = None # The search queries of the run that found the job
+    posted_at: Optional[float] = None # Epoch seconds the job was listed at, when the site tells
 
 
     def __str__(self): # Customize string representation
@@ -0,0 +1,129 @@
+# src/run_matrix.py
+
+import asyncio
+import itertools
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+import src.logger as LOGGER
+
+from src.async_facade import AsyncFacade
+from src.constants.constants import Constants
+from src.facade import Facade
+from src.models.job import Job
+from src.utils.description_matcher import DescriptionMatcher
+from src.utils.jsonl_writer import JsonlWriter
+from src.utils.seen_jobs import SeenJobs
+from src.utils.pacer import Pacer
+from src.utils.snapshot_store import SnapshotStore
+
+
+logger = LOGGER.get(__name__)
+
+@dataclass
+class SearchQuery:
+    keywords: Optional[str] = None
+    location: Optional[str] = None
+    epoch_ago: Optional[int] = None
+    filters: Optional[Dict[str, str]] = None
+
+    def __str__(self):
+        return f"'{self.keywords}' in '{self.location}' (last {self.epoch_ago}s)"
+
+
+def build_run_matrix(keywords: List[Optional[str]], locations: List[Optional[str]], epochs_ago: List[Optional[int]], filters: Optional[Dict[str, str]] = None) -> List[SearchQuery]:
+    """Every keywords x location x time range combination, in config order, all with the same search filters."""
+    return [SearchQuery(*combination, filters) for combination in itertools.product(keywords or [None], locations or [None], epochs_ago or [None])]
+
+
+class _QueryHits:
+    """Jobs found by the queries of a run, keyed by job id, annotated with every query that hit them."""
+
+    def __init__(self):
+        self.jobs: Dict[str, Job] = {}
+
+    def add(self, job: Job, query: SearchQuery) -> bool:
+        """Annotates the job with the query, returns False if an earlier query already found it."""
+        key = SeenJobs.job_id(job)
+        if key in self.jobs:
+            self.jobs[key].queries.append(asdict(query))
+            return False
+        job.queries = [asdict(query)]
+        self.jobs[key] = job
+        return True
+
+
+class RunMatrix:
+    """Runs several search queries one after the other in the logged-in browser session of a facade.
+    A job found again by a later query is not scored twice, it is only annotated with that query."""
+
+    def __init__(self, facade: Facade, queries: List[SearchQuery]):
+        logger.debug("RunMatrix instance created")
+        self.facade = facade
+        self.queries = queries
+
+    def run(self, user_description: str, limit: Optional[int] = None, writer: Optional[JsonlWriter] = None) -> List[Job]:
+        """Returns the matched jobs of all the queries, without duplicates."""
+        logger.debug("RunMatrix.run")
+        hits = _QueryHits()
+        jobs_to_apply: List[Job] = []
+        for number, query in enumerate(self.queries, start=1):
+            logger.info(f"Running query {number}/{len(self.queries)}: {query}")
+            try:
+                jobs_to_apply.extend(self.facade.iter_filtered(user_description, query.keywords, query.location, query.epoch_ago, query.filters, limit=limit,
+                                                               writer=writer, exclude=lambda job: not hits.add(job, query)))
+            except Exception as e:
+                logger.error(f"Query {query} failed: {str(e)}")
+        logger.info(f"{len(jobs_to_apply)} jobs matched out of {len(hits.jobs)} distinct jobs found by {len(self.queries)} queries.")
+        return jobs_to_apply
+
+
+class AsyncRunMatrix:
+    """Runs several search queries concurrently, each on its own page of one logged-in browser context."""
+
+    def __init__(self,
+                 context: AsyncBrowserContext,
+                 constants: Constants,
+                 matcher: DescriptionMatcher,
+                 queries: List[SearchQuery],
+                 parallel: int = Constants.DEFAULT_PARALLEL_QUERIES,
+                 tabs: int = Constants.DEFAULT_EXTRACTION_TABS,
+                 seen: Optional[SeenJobs] = None,
+                 pacer: Optional[Pacer] = None,
+                 snapshots: Optional[SnapshotStore] = None):
+        logger.debug("AsyncRunMatrix instance created")
+        self.context = context
+        self.constants = constants
+        self.matcher = matcher
+        self.queries = queries
+        self.parallel = max(1, parallel)
+        self.tabs = tabs
+        self.seen = seen
+        self.pacer = pacer
+        self.snapshots = snapshots
+
+    async def run(self, user_description: str, limit: Optional[int] = None, writer: Optional[JsonlWriter] = None) -> List[Job]:
+        """Returns the matched jobs of all the queries, without duplicates."""
+        logger.debug("AsyncRunMatrix.run")
+        hits = _QueryHits()
+        jobs_to_apply: List[Job] = []
+        semaphore = asyncio.Semaphore(self.parallel)
+
+        async def run_query(query: SearchQuery) -> None:
+            async with semaphore:
+                page = await self.context.new_page()
+                try:
+                    facade = AsyncFacade(page, self.constants, matcher=self.matcher, tabs=self.tabs, seen=self.seen, pacer=self.pacer, snapshots=self.snapshots)
+                    jobs = await facade.search_jobs(query.keywords, query.location, query.epoch_ago, query.filters, limit=limit)
+                    new_jobs = [job for job in jobs if hits.add(job, query)]
+                    jobs_to_apply.extend(await facade.filter_jobs(new_jobs, user_description))
+                    if writer:
+                        writer.write_many(new_jobs)
+                except Exception as e:
+                    logger.error(f"Query {query} failed: {str(e)}")
+                finally:
+                    await page.close()
+
+        await asyncio.gather(*(run_query(query) for query in self.queries))
+        logger.info(f"{len(jobs_to_apply)} jobs matched out of {len(hits.jobs)} distinct jobs found by {len(self.queries)} queries.")
+        return jobs_to_apply
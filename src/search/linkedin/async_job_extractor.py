@@ -0,0 +1,310 @@
+# src/search/linkedin/async_job_extractor.py
+
+import asyncio
+import re
+from math import ceil
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from playwright.async_api import Page, Locator
+
+import src.logger as LOGGER
+import src.utils.metrics as METRICS
+from src.constants.constants import Constants
+from src.models.job import Job
+from src.search.linkedin.job_extractor import JobExtractor
+from src.search.linkedin.scripts import DETAILS_PANE_SCRIPT, JOB_DETAILS_SCRIPT, JOB_IDS_SCRIPT, job_details_selectors
+from src.utils.seen_jobs import SeenJobs
+from src.utils.pacer import Pacer
+from src.utils.snapshot_store import SnapshotStore
+
+logger = LOGGER.get(__name__)
+
+
+class AsyncJobExtractor:
+    """asyncio counterpart of JobExtractor, built on playwright.async_api."""
+
+    # Data validation, Job creation and the pacing reports do not touch the page, share them with the sync extractor.
+    _is_valid_job_data = JobExtractor._is_valid_job_data
+    _create_job_object = JobExtractor._create_job_object
+    _log_invalid_job_data = JobExtractor._log_invalid_job_data
+    _report_empty_page = JobExtractor._report_empty_page
+    _current_start = JobExtractor._current_start
+    _job_key = staticmethod(JobExtractor._job_key)
+
+    def __init__(self, page: Page, constants: Constants, tabs: int = Constants.DEFAULT_EXTRACTION_TABS, seen: Optional[SeenJobs] = None, pacer: Optional[Pacer] = None, snapshots: Optional[SnapshotStore] = None):
+        logger.debug("AsyncJobExtractor instance created")
+        self.page = page
+        self.constants = constants
+        self.locators = constants.Locators
+        self.tabs = max(1, tabs)
+        self.seen = seen
+        self.pacer = pacer
+        self.snapshots = snapshots
+        self.page_fully_known = False # set by _process_current_page when every card of the page was seen in previous runs
+        self.position = 0 # results offset of the next card to process, with `processed` the resume point of the search
+        self.processed = 0
+        self.timeout = Constants.DEFAULT_TIMEOUT * 1000
+        self.URL_PAGE_NUM_PARAMETER = constants.URL_PAGE_NUM_PARAMETER
+        self.NUM_OF_JOBS_IN_PAGE = constants.NUM_OF_JOBS_IN_PAGE
+
+    async def _search_results_elements(self) -> List[Locator]:
+        results = self.page.locator(self.locators.Job.SEARCH_RESULTS)
+        await results.first.wait_for(timeout=self.timeout)
+        return await results.all()
+
+    async def _text(self, selector: str) -> Optional[str]:
+        try:
+            return await self.page.locator(selector).first.inner_text(timeout=self.timeout)
+        except Exception:
+            return None
+
+    async def _attribute(self, selector: str, name: str) -> Optional[str]:
+        try:
+            return await self.page.locator(selector).first.get_attribute(name, timeout=self.timeout)
+        except Exception:
+            return None
+
+    async def _apply_buttons(self) -> Tuple[bool, bool]:
+        """Waits once for either apply button, then reports which of them is present."""
+        job_locators = self.locators.Job
+        try:
+            await self.page.locator(f"{job_locators.EASY_APPLY} | {job_locators.APPLY}").first.wait_for(timeout=self.timeout)
+        except Exception:
+            return False, False
+        return (await self.page.locator(job_locators.EASY_APPLY).count() > 0,
+                await self.page.locator(job_locators.APPLY).count() > 0)
+
+    async def navigate(self, page: Page, url: str, **kwargs) -> Any:
+        """page.goto, paced when a pacer is set."""
+        if self.pacer:
+            return await self.pacer.goto_async(page, url, **kwargs)
+        return await page.goto(url, **kwargs)
+
+    async def click(self, element: Locator) -> None:
+        """Clicks a results card, paced when a pacer is set."""
+        with METRICS.span("card_click"):
+            if self.pacer:
+                await self.pacer.click_async(element)
+            else:
+                await element.click()
+
+    async def _next_results_page(self) -> None:
+        """Navigate to the next page in the search results"""
+        logger.debug("AsyncJobExtractor._next_results_page")
+        with METRICS.span("pagination"):
+            current_url = self.page.url
+            pattern = fr"{re.escape(self.URL_PAGE_NUM_PARAMETER)}(\d+)"
+            match = re.search(pattern, current_url)
+            if match:
+                new_start = int(match.group(1)) + self.NUM_OF_JOBS_IN_PAGE
+                await self.navigate(self.page, re.sub(pattern, f"{self.URL_PAGE_NUM_PARAMETER}{new_start}", current_url))
+            else:
+                await self.navigate(self.page, f"{current_url}{self.URL_PAGE_NUM_PARAMETER}{self.NUM_OF_JOBS_IN_PAGE}")
+
+    async def extract_jobs(self, url: Optional[str] = None, limit: Optional[int] = None) -> List[Job]:
+        """Extracts job information from the search results page."""
+        logger.debug("AsyncJobExtractor.extract_jobs")
+        jobs = [job async for job in self.iter_jobs(url, limit)]
+        logger.info(f"Extracted {len(jobs)} jobs in total.")
+        return jobs
+
+    async def iter_jobs(self, url: Optional[str] = None, limit: Optional[int] = None) -> AsyncIterator[Job]:
+        """Yields jobs as soon as they are extracted, so the caller can process them while extraction goes on."""
+        logger.debug("AsyncJobExtractor.iter_jobs")
+        logger.info("Extracting job information from search results.")
+        try:
+            if url:
+                await self.navigate(self.page, url)
+            if not limit:
+                limit = await self._determine_job_limit()
+            jobs = self._iter_job_elements_parallel(limit) if self.tabs > 1 else self._iter_job_elements(limit)
+            async for job in jobs:
+                yield job
+        except Exception as e:
+            logger.error(f"Failed to extract jobs: {str(e)}")
+
+    async def _iter_job_elements(self, limit: int) -> AsyncIterator[Job]:
+        """Clicks the results cards one after the other, cards seen in previous runs are skipped."""
+        logger.debug("AsyncJobExtractor._iter_job_elements")
+        total_processed_elements = 0
+        page_start = self._current_start()
+        self.position, self.processed = page_start, 0
+        while total_processed_elements < limit:
+            elements = await self._search_results_elements_or_none()
+            if elements is None:
+                if total_processed_elements:
+                    self._report_empty_page()
+                break
+            known = await self._known_cards(len(elements))
+            if elements and all(known):
+                logger.info("Every job of the results page was seen in a previous run, stopping.")
+                break
+            for index, (element, is_known) in enumerate(zip(elements, known), start=1):
+                if total_processed_elements >= limit:
+                    break
+                if is_known:
+                    self.position = page_start + index
+                    continue
+                job = await self._process_job_element(element)
+                total_processed_elements += 1
+                self.position, self.processed = page_start + index, total_processed_elements
+                if job: yield job
+            if len(elements) < self.NUM_OF_JOBS_IN_PAGE:
+                break
+            if total_processed_elements < limit:
+                page_start += len(elements)
+                await self._next_results_page()
+
+    async def _search_results_elements_or_none(self) -> Optional[List[Locator]]:
+        """The results cards of the loaded page, None when none showed up before the timeout."""
+        try:
+            return await self._search_results_elements()
+        except Exception as e:
+            logger.warning(f"No search results on {self.page.url}: {str(e)}")
+            return None
+
+    async def _iter_job_elements_parallel(self, limit: int) -> AsyncIterator[Job]:
+        """Every tab loads and processes a different results page (`&start=` offset) concurrently.
+        The jobs of a round are yielded in offset order and deduplicated by job URL."""
+        logger.debug("AsyncJobExtractor._iter_job_elements_parallel")
+        base_url = re.sub(fr"{re.escape(self.URL_PAGE_NUM_PARAMETER)}\d+", "", self.page.url)
+        first_offset = self._current_start()
+        self.position, self.processed = first_offset, 0
+        num_of_pages = ceil(limit / self.NUM_OF_JOBS_IN_PAGE)
+        tabs = [self.page] + [await self.page.context.new_page() for _ in range(min(self.tabs, num_of_pages) - 1)]
+        job_keys = set()
+
+        async def process_page(tab: Page, offset: int) -> Tuple[List[Job], int, bool, int]:
+            await self.navigate(tab, f"{base_url}{self.URL_PAGE_NUM_PARAMETER}{offset}")
+            tab_extractor = AsyncJobExtractor(tab, self.constants, seen=self.seen, pacer=self.pacer, snapshots=self.snapshots)
+            page_jobs, num_of_elements = await tab_extractor._process_current_page(min(self.NUM_OF_JOBS_IN_PAGE, limit - (offset - first_offset)))
+            return page_jobs, num_of_elements, tab_extractor.page_fully_known, tab_extractor.processed
+
+        try:
+            for first_page in range(0, num_of_pages, len(tabs)):
+                offsets = [first_offset + page_num * self.NUM_OF_JOBS_IN_PAGE for page_num in range(first_page, min(first_page + len(tabs), num_of_pages))]
+                results = await asyncio.gather(*(process_page(tab, offset) for tab, offset in zip(tabs, offsets)))
+                last_page_reached = False
+                for offset, (page_jobs, num_of_elements, page_fully_known, page_processed) in zip(offsets, results):
+                    if not num_of_elements and offset > first_offset:
+                        self._report_empty_page()
+                    self.position = offset + min(limit - (offset - first_offset), num_of_elements)
+                    self.processed += page_processed
+                    for job in page_jobs:
+                        if len(job_keys) < limit and self._job_key(job.url) not in job_keys:
+                            job_keys.add(self._job_key(job.url))
+                            yield job
+                    if num_of_elements < self.NUM_OF_JOBS_IN_PAGE or page_fully_known:
+                        last_page_reached = True
+                        break
+                if last_page_reached:
+                    break
+        finally:
+            for tab in tabs[1:]:
+                await tab.close()
+
+    async def _process_current_page(self, limit: int) -> Tuple[List[Job], int]:
+        """Process up to limit job cards of the currently loaded results page.
+        Returns the extracted jobs and the number of cards found on the page, cards seen in previous runs are not clicked
+        and, like in the sequential search, only the clicked cards are added to `processed`."""
+        logger.debug("AsyncJobExtractor._process_current_page")
+        jobs = []
+        elements = await self._search_results_elements_or_none() or []
+        known = await self._known_cards(len(elements))
+        self.page_fully_known = bool(elements) and all(known)
+        for element, is_known in zip(elements[:limit], known):
+            if is_known:
+                continue
+            self.processed += 1
+            job = await self._process_job_element(element)
+            if job: jobs.append(job)
+        return jobs, len(elements)
+
+    async def _known_cards(self, num_of_cards: int) -> List[bool]:
+        """Tells for every card of the loaded results page whether its job was seen in a previous run,
+        reading all the card job ids in a single evaluate call."""
+        logger.debug("AsyncJobExtractor._known_cards")
+        if self.seen is None:
+            return [False] * num_of_cards
+        job_ids = await self.page.locator(self.locators.Job.SEARCH_RESULTS).evaluate_all(JOB_IDS_SCRIPT, self.locators.Card.JOB_ID_ATTRIBUTE)
+        known = self.seen.known(job_ids)
+        return ([job_id in known for job_id in job_ids] + [False] * num_of_cards)[:num_of_cards]
+
+    async def _process_job_element(self, element: Locator) -> Optional[Job]:
+        try:
+            await self.click(element)
+            return await self._process_single_job_element()
+        except Exception as e:
+            # A failing card is counted as processed, retrying it would never end.
+            logger.warning(f"Failed processing job element: {str(e)}")
+            return None
+
+    async def _determine_job_limit(self) -> int:
+        logger.debug("AsyncJobExtractor._determine_job_limit")
+        limit_text = await self._text(self.locators.Search.NUM_OF_SEARCH_RESULTS)
+        match = re.match(r"^\d+", (limit_text or "").replace(",", ""))
+        if match:
+            return int(match.group(0))
+        raise ValueError("Cannot determine the total number of search results")
+
+    async def _process_single_job_element(self) -> Optional[Job]:
+        """Process a single job element, extracting and validating its data."""
+        logger.debug("AsyncJobExtractor._process_single_job_element")
+        job_data = await self._extract_single_job_data()
+
+        if (not job_data['easy_apply']) and (not job_data['apply_button']):
+            logger.info(f"Already applied to job: {job_data['title']}")
+            return None
+
+        if self._is_valid_job_data(job_data):
+            job = self._create_job_object(job_data)
+            METRICS.count("jobs_extracted")
+            logger.info(f"Job added: {job_data['title']}")
+            return job
+
+        self._log_invalid_job_data(job_data)
+        return None
+
+    async def _extract_single_job_data(self) -> Dict:
+        """Reads the detail pane in a single page.evaluate round-trip,
+        falling back to reading the fields concurrently so their waits overlap."""
+        logger.debug("AsyncJobExtractor._extract_single_job_data")
+        with METRICS.span("detail_extraction"):
+            try:
+                await self.page.wait_for_selector(self.locators.Job.DESCRIPTION, timeout=self.timeout)
+                job = await self.page.evaluate(JOB_DETAILS_SCRIPT, job_details_selectors(self.locators))
+            except Exception as e:
+                logger.debug(f"Bulk job extraction failed: {str(e)}")
+                job = None
+
+            if not isinstance(job, dict):
+                job_locators = self.locators.Job
+                title, company, location, url, description, (easy_apply, apply_button) = await asyncio.gather(
+                    self._text(job_locators.TITLE),
+                    self._text(job_locators.COMPANY),
+                    self._text(job_locators.LOCATION),
+                    self._attribute(job_locators.URL, "href"),
+                    self._text(job_locators.DESCRIPTION),
+                    self._apply_buttons(),
+                )
+                job = {
+                    "title": title,
+                    "company": company,
+                    "location": location,
+                    "url": url,
+                    "description": description,
+                    "easy_apply": easy_apply,
+                    "apply_button": apply_button,
+                }
+        logger.debug(f"extracted job details: {job}")
+        if self.snapshots and job.get("url"):
+            await self._save_snapshot(job["url"])
+        return job
+
+    async def _save_snapshot(self, url: str) -> None:
+        """Keeps the detail pane HTML, so the job can be parsed again later without the browser."""
+        logger.debug("AsyncJobExtractor._save_snapshot")
+        try:
+            html = await self.page.evaluate(DETAILS_PANE_SCRIPT, self.locators.Job.DETAILS_PANE)
+            self.snapshots.put(SeenJobs.url_job_id(url), url, html)
+        except Exception as e:
+            logger.warning(f"Failed saving the snapshot of {url}: {str(e)}")
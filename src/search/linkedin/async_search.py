@@ -0,0 +1,74 @@
+# src/search/linkedin/async_search.py
+
+import re
+import src.logger as LOGGER
+import src.utils.metrics as METRICS
+from typing import AsyncIterator, List, Dict, Optional
+from playwright.async_api import Page
+from src.models.job import Job
+from src.exceptions import SearchError
+from src.search.linkedin.async_job_extractor import AsyncJobExtractor
+from src.search.linkedin.search import JobSearch
+from src.constants.constants import Constants
+from src.utils.seen_jobs import SeenJobs
+from src.utils.pacer import Pacer
+from src.utils.snapshot_store import SnapshotStore
+
+
+logger = LOGGER.get(__name__)
+
+
+class AsyncJobSearch:
+    """asyncio counterpart of JobSearch, built on playwright.async_api."""
+
+    # URL building does not touch the page, share it with the sync search.
+    _build_search_url = JobSearch._build_search_url
+
+    def __init__(self, page: Page, constants: Constants, tabs: int = Constants.DEFAULT_EXTRACTION_TABS, seen: Optional[SeenJobs] = None, pacer: Optional[Pacer] = None, snapshots: Optional[SnapshotStore] = None) -> None:
+        logger.debug("AsyncJobSearch instance created")
+        self.page = page
+        self.constants = constants
+        self.pacer = pacer
+        self.job_extractor = AsyncJobExtractor(page, constants, tabs, seen, pacer, snapshots)
+
+    async def search_jobs(
+        self,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        epoch_ago: Optional[str] = None,
+        additional_filters: Dict[str, str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Job]:
+        """Searches for jobs on LinkedIn."""
+        jobs = [job async for job in self.iter_jobs(keywords, location, epoch_ago, additional_filters, limit)]
+        logger.info(f"Found {len(jobs)} jobs.")
+        return jobs
+
+    async def iter_jobs(
+        self,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        epoch_ago: Optional[str] = None,
+        additional_filters: Dict[str, str] = None,
+        limit: Optional[int] = None,
+        start: int = 0,
+    ) -> AsyncIterator[Job]:
+        """Searches for jobs on LinkedIn, yielding every job as soon as it is extracted.
+        `start` is the results offset to begin from, to resume an interrupted search."""
+        try:
+            logger.info(f"Searching for jobs with keywords '{keywords}' in '{location}'...")
+            search_url = self._build_search_url(keywords, location, additional_filters, epoch_ago)
+            with METRICS.span("search_navigation"):
+                await self.job_extractor.navigate(self.page, search_url)
+        except Exception as e:
+            error_msg = f"Failed to perform job search: {str(e)}"
+            logger.error(error_msg)
+            raise SearchError(error_msg) from e
+
+        start_url = None
+        if start:
+            page_num_parameter = self.constants.URL_PAGE_NUM_PARAMETER
+            search_url = re.sub(fr"{re.escape(page_num_parameter)}\d+", "", self.page.url)
+            start_url = f"{search_url}{page_num_parameter}{start}"
+        async for job in self.job_extractor.iter_jobs(start_url, limit):
+            yield job
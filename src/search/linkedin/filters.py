@@ -0,0 +1,57 @@
+# src/search/linkedin/filters.py
+
+from typing import Dict, Iterable, Optional, Union
+import src.logger as LOGGER
+
+
+logger = LOGGER.get(__name__)
+
+# Search filter name -> (URL parameter, {value name: URL value}). Values may also be given as the raw URL value.
+FILTERS = {
+    "easy_apply": ("f_AL", {"true": "true"}),
+    "experience": ("f_E", {"internship": "1", "entry": "2", "associate": "3", "mid_senior": "4", "director": "5", "executive": "6"}),
+    "workplace": ("f_WT", {"on_site": "1", "remote": "2", "hybrid": "3"}),
+    "job_type": ("f_JT", {"full_time": "F", "part_time": "P", "contract": "C", "temporary": "T", "volunteer": "V", "internship": "I", "other": "O"}),
+    "sort_by": ("sortBy", {"recent": "DD", "relevant": "R"}),
+}
+TIME_RANGE_PARAMETER = "f_TPR" # "r<seconds>", jobs posted in the last epoch_ago seconds
+
+FilterValue = Union[str, bool, int, Iterable[str]]
+
+
+def _encode_value(name: str, value: FilterValue) -> Optional[str]:
+    values = FILTERS[name][1]
+    if isinstance(value, bool):
+        return "true" if value and name == "easy_apply" else None
+    if isinstance(value, (str, int)):
+        value = str(value).split(",")
+    raw_values = {code.lower(): code for code in values.values()}
+    encoded = []
+    for item in value:
+        item = str(item).strip().lower().replace("-", "_").replace(" ", "_")
+        if not item or item == "false":
+            continue
+        if item in values:
+            encoded.append(values[item])
+        elif item in raw_values:
+            encoded.append(raw_values[item])
+        else:
+            raise ValueError(f"Unknown {name} filter value '{item}', expected one of: {', '.join(values)}")
+    return ",".join(dict.fromkeys(encoded)) or None
+
+
+def encode_filters(epoch_ago: Optional[Union[str, int]] = None, filters: Optional[Dict[str, FilterValue]] = None) -> Dict[str, str]:
+    """Maps the time range and the search filters onto the search URL parameters,
+    so a filtered search is a single navigation instead of clicks through the filter dropdowns.
+    Multiple values of a filter are given as a list or a comma separated string."""
+    logger.debug("filters.encode_filters")
+    parameters = {}
+    if epoch_ago:
+        parameters[TIME_RANGE_PARAMETER] = f"r{int(epoch_ago)}"
+    for name, value in (filters or {}).items():
+        if name not in FILTERS:
+            raise ValueError(f"Unknown search filter '{name}', expected one of: {', '.join(FILTERS)}")
+        encoded = _encode_value(name, value)
+        if encoded:
+            parameters[FILTERS[name][0]] = encoded
+    return parameters
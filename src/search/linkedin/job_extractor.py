@@ -2,13 +2,21 @@
 
 
 import re
+import urllib.parse
+from math import ceil
 from time import sleep
 from src.constants.constants import Constants
 import src.logger as LOGGER
-from typing import Optional, List, Dict
-from playwright.sync_api import Page, Locator
+import src.utils.metrics as METRICS
+from typing import Any, Iterator, Optional, List, Dict, Tuple
+from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
 
 from src.models.job import Job
+from src.search.linkedin.response_capture import JobResponseCapture
+from src.search.linkedin.scripts import DETAILS_PANE_SCRIPT, JOB_CARDS_SCRIPT, JOB_DETAILS_SCRIPT, JOB_IDS_SCRIPT, job_cards_selectors, job_details_selectors
+from src.utils.seen_jobs import SeenJobs
+from src.utils.pacer import Pacer
+from src.utils.snapshot_store import SnapshotStore
 from playwright_utils import (
     get_element_attribute,
     get_element_text,
@@ -61,17 +69,28 @@ class JobExtractor:
         except Exception:
             return False
 
-    def __init__(self, page: Page, constants: Constants):
+    def __init__(self, page: Page, constants: Constants, tabs: int = Constants.DEFAULT_EXTRACTION_TABS, seen: Optional[SeenJobs] = None, pacer: Optional[Pacer] = None, snapshots: Optional[SnapshotStore] = None):
         logger.debug("JobExtractor instance created")
         self.page = page
         self.constants = constants
         self.locators = constants.Locators
+        self.tabs = max(1, tabs)
+        self.seen = seen
+        self.pacer = pacer
+        self.snapshots = snapshots
+        self.page_fully_known = False # set by _process_current_page when every card of the page was seen in previous runs
+        self.position = 0 # results offset of the next card to process, with `processed` the resume point of the search
+        self.processed = 0
         self.URL_PAGE_NUM_PARAMETER = constants.URL_PAGE_NUM_PARAMETER
         self.NUM_OF_JOBS_IN_PAGE = constants.NUM_OF_JOBS_IN_PAGE
     
     def _next_results_page(self) -> None:
         """Navigate to the next page in the search results"""
         logger.debug("JobExtractor._next_results_page")
+        with METRICS.span("pagination"):
+            self._goto_next_results_page()
+
+    def _goto_next_results_page(self) -> None:
         current_url = self.page.url
 
         if self.URL_PAGE_NUM_PARAMETER in current_url:
@@ -81,64 +100,303 @@ class JobExtractor:
                 current_start_str = match.group(1)
                 new_start = int(current_start_str) + self.NUM_OF_JOBS_IN_PAGE
                 updated_url = re.sub(pattern, f"&start={new_start}", current_url)
-                self.page.goto(updated_url)
+                self.navigate(self.page, updated_url)
             else:
                 raise ValueError("Could not find 'start' parameter in the URL.")
         else:
-            self.page.goto(f"{self.page.url}{self.URL_PAGE_NUM_PARAMETER}{self.NUM_OF_JOBS_IN_PAGE}")
+            self.navigate(self.page, f"{self.page.url}{self.URL_PAGE_NUM_PARAMETER}{self.NUM_OF_JOBS_IN_PAGE}")
+
+    def navigate(self, page: Page, url: str, **kwargs) -> Any:
+        """page.goto, paced when a pacer is set."""
+        if self.pacer:
+            return self.pacer.goto(page, url, **kwargs)
+        return page.goto(url, **kwargs)
+
+    def click(self, element: Locator) -> None:
+        """Clicks a results card, paced when a pacer is set."""
+        with METRICS.span("card_click"):
+            if self.pacer:
+                self.pacer.click(element)
+            else:
+                element.click()
+
+    def _report_empty_page(self) -> None:
+        """A results page following a full one came back empty, the site is likely throttling."""
+        if self.pacer:
+            self.pacer.throttled("empty results page")
+
+    def _current_start(self) -> int:
+        """The results offset of the loaded page, from its `&start=` parameter."""
+        if not self.URL_PAGE_NUM_PARAMETER:
+            return 0
+        match = re.search(fr"{re.escape(self.URL_PAGE_NUM_PARAMETER)}(\d+)", self.page.url)
+        return int(match.group(1)) if match else 0
 
     def extract_jobs(self, url: Optional[str] = None, limit: Optional[int] = None) -> List[Job]:
         """Extracts job information from the search results page."""
         logger.debug("JobExtractor.extract_jobs")
+        jobs = list(self.iter_jobs(url, limit))
+        logger.info(f"Extracted {len(jobs)} jobs in total.")
+        return jobs
 
+    def iter_jobs(self, url: Optional[str] = None, limit: Optional[int] = None) -> Iterator[Job]:
+        """Yields jobs as soon as they are extracted, so the caller can process them while extraction goes on."""
+        logger.debug("JobExtractor.iter_jobs")
         logger.info("Extracting job information from search results.")
-        jobs = []
 
         if url:
-            self.page.goto(url)
+            self.navigate(self.page, url)
         try:
-            jobs = self._process_job_elements(limit)
+            if self.tabs > 1:
+                yield from self._iter_job_elements_parallel(limit)
+            else:
+                yield from self._iter_job_elements(limit)
         except Exception as e:
             logger.error(f"Failed to extract jobs: {str(e)}")
 
+    def extract_job_cards(self, url: Optional[str] = None, limit: Optional[int] = None) -> List[Job]:
+        """Extracts the jobs listed on the search results pages without clicking them.
+        Every results page is read with a single evaluate call, the jobs have no description."""
+        logger.debug("JobExtractor.extract_job_cards")
+        logger.info("Extracting job cards from search results.")
+        jobs = []
+
+        if url:
+            self.navigate(self.page, url)
+        try:
+            if not limit:
+                limit = self._determine_job_limit(limit)
+            first_page = True
+            while len(jobs) < limit:
+                cards = self._extract_page_cards()
+                if not cards and not first_page:
+                    self._report_empty_page()
+                first_page = False
+                known = self.seen.known(card["job_id"] for card in cards) if self.seen else set()
+                new_cards = [card for card in cards if card["job_id"] not in known]
+                jobs.extend(self._create_card_job_object(card) for card in new_cards[:limit - len(jobs)] if self._is_valid_job_data(card))
+                if len(cards) < self.NUM_OF_JOBS_IN_PAGE or (cards and not new_cards):
+                    break
+                if len(jobs) < limit:
+                    self._next_results_page()
+        except Exception as e:
+            logger.error(f"Failed to extract job cards: {str(e)}")
+
+        METRICS.count("jobs_extracted", len(jobs))
+        logger.info(f"Extracted {len(jobs)} job cards in total.")
+        return jobs
+
+    def fetch_descriptions(self, jobs: List[Job]) -> List[Job]:
+        """Fills in the description of jobs extracted from cards by opening every job page."""
+        logger.debug("JobExtractor.fetch_descriptions")
+        for job in jobs:
+            try:
+                self.navigate(self.page, job.url)
+                job_data = self._extract_single_job_data()
+                job.description = job_data["description"]
+            except Exception as e:
+                logger.warning(f"Failed fetching description of {job}: {str(e)}")
+        return jobs
+
+    def extract_jobs_from_network(self, url: Optional[str] = None, limit: Optional[int] = None, descriptions: bool = True) -> List[Job]:
+        """Builds jobs from the JSON responses the results and job pages load, instead of scraping the rendered DOM.
+        Pages are only navigated until their API response arrives, nothing waits for rendering."""
+        logger.debug("JobExtractor.extract_jobs_from_network")
+        logger.info("Extracting job information from network responses.")
+        jobs = []
+        base_url = re.sub(fr"{re.escape(self.URL_PAGE_NUM_PARAMETER)}\d+", "", url or self.page.url)
+        limit = limit or self.constants.DEFAULT_JOB_LIMIT
+        timeout = self.constants.DEFAULT_TIMEOUT * 1000
+
+        try:
+            with JobResponseCapture(self.page, self.constants) as capture:
+                job_ids = []
+                offset = 0
+                while len(job_ids) < limit:
+                    try:
+                        with self.page.expect_response(lambda response: capture.is_job_cards_response(response.url), timeout=timeout):
+                            self.navigate(self.page, f"{base_url}{self.URL_PAGE_NUM_PARAMETER}{offset}", wait_until="commit")
+                    except PlaywrightTimeoutError:
+                        if not offset:
+                            raise
+                        logger.warning(f"No job search response for results offset {offset}")
+                    new_ids = capture.collect()
+                    if not new_ids and offset:
+                        self._report_empty_page()
+                    known = self.seen.known(new_ids) if self.seen else set()
+                    job_ids.extend(job_id for job_id in new_ids if job_id not in known)
+                    if len(new_ids) < self.NUM_OF_JOBS_IN_PAGE or (new_ids and len(known) == len(new_ids)):
+                        break
+                    offset += self.NUM_OF_JOBS_IN_PAGE
+                job_ids = job_ids[:limit]
+
+                if descriptions:
+                    for job_id in job_ids:
+                        try:
+                            with self.page.expect_response(lambda response: capture.is_job_posting_response(response.url), timeout=timeout):
+                                self.navigate(self.page, self.constants.JOB_VIEW_URL.format(job_id=job_id), wait_until="commit")
+                        except Exception as e:
+                            logger.warning(f"Failed capturing job posting {job_id}: {str(e)}")
+                    capture.collect()
+                jobs = capture.jobs(job_ids)
+                METRICS.count("jobs_extracted", len(jobs))
+        except Exception as e:
+            logger.error(f"Failed to extract jobs from network: {str(e)}")
+
         logger.info(f"Extracted {len(jobs)} jobs in total.")
         return jobs
 
-    def _process_job_elements(self, limit: Optional[int] = None) -> List[Job]:
+    def _extract_page_cards(self) -> List[Dict]:
+        """The cards of the loaded results page, none when no results showed up before the timeout."""
+        logger.debug("JobExtractor._extract_page_cards")
+        try:
+            self.page.wait_for_selector(self.locators.Search.SEARCH_RESULTS, timeout=self.constants.DEFAULT_TIMEOUT * 1000)
+        except PlaywrightTimeoutError:
+            logger.warning(f"No job cards on {self.page.url}")
+            return []
+        cards = self.page.evaluate(JOB_CARDS_SCRIPT, job_cards_selectors(self.locators, self.constants.CARD_SCROLL_DELAY))
+        logger.debug(f"extracted {len(cards)} job cards: {cards}")
+        return cards
+
+    def _create_card_job_object(self, card: Dict) -> Job:
+        return Job(
+            title=card["title"],
+            company=card["company"],
+            location=card["location"],
+            url=card["url"],
+            easy_apply=card["easy_apply"],
+            raw_data={"job_id": card["job_id"]},
+        )
+
+    def _iter_job_elements(self, limit: Optional[int] = None) -> Iterator[Job]:
         """Process job elements from search results, extracting and validating job data."""
-        logger.debug("JobExtractor._process_job_elements")
+        logger.debug("JobExtractor._iter_job_elements")
         
         if not limit:
             limit = self._determine_job_limit(limit)
-        jobs = []
         total_processed_elements = 0
+        page_start = self._current_start()
+        self.position, self.processed = page_start, 0
         elements = self.search_results_elements
         num_of_elements_in_page = len(elements)
+        known = self._known_cards(num_of_elements_in_page)
         proccesed_in_current_page = 0
 
         while total_processed_elements < limit:
-            try:
-                if proccesed_in_current_page >= num_of_elements_in_page:
-                    if num_of_elements_in_page < self.NUM_OF_JOBS_IN_PAGE:
-                        break
-                    proccesed_in_current_page = 0
-                    self._next_results_page()
-                    # TODO: still need to verify that next page is loaded with results.
-                    elements.append(self.search_results_elements)
-                
-                element = elements[proccesed_in_current_page]                
-                element.click()
-                
-                job = self._process_single_job_element()
-                if job: jobs.append(job)
+            if num_of_elements_in_page and all(known):
+                logger.info("Every job of the results page was seen in a previous run, stopping.")
+                break
+            if proccesed_in_current_page >= num_of_elements_in_page:
+                if num_of_elements_in_page < self.NUM_OF_JOBS_IN_PAGE:
+                    break
+                proccesed_in_current_page = 0
+                page_start += num_of_elements_in_page
+                self._next_results_page()
+                # TODO: still need to verify that next page is loaded with results.
+                elements = self.search_results_elements
+                num_of_elements_in_page = len(elements)
+                if not num_of_elements_in_page:
+                    self._report_empty_page()
+                known = self._known_cards(num_of_elements_in_page)
+                continue
 
-                total_processed_elements += 1
+            if known[proccesed_in_current_page]:
                 proccesed_in_current_page += 1
+                self.position = page_start + proccesed_in_current_page
+                continue
+
+            job = None
+            try:
+                self.click(elements[proccesed_in_current_page])
+                job = self._process_single_job_element()
             except Exception as e:
+                # A failing card is counted as processed, retrying it would never end.
                 logger.warning(f"Failed processing job elements: {str(e)}")
+
+            total_processed_elements += 1
+            proccesed_in_current_page += 1
+            self.position, self.processed = page_start + proccesed_in_current_page, total_processed_elements
+            if job: yield job
+
+    def _iter_job_elements_parallel(self, limit: Optional[int] = None) -> Iterator[Job]:
+        """Process the search results with several tabs of the same browser context.
+        Every tab loads a different results page (`&start=` offset), the loads of a round overlap
+        and the cards of each tab are then processed in offset order, deduplicated by job URL."""
+        logger.debug("JobExtractor._iter_job_elements_parallel")
+
+        if not limit:
+            limit = self._determine_job_limit(limit)
+        base_url = re.sub(fr"{re.escape(self.URL_PAGE_NUM_PARAMETER)}\d+", "", self.page.url)
+        first_offset = self._current_start()
+        self.position, self.processed = first_offset, 0
+        num_of_pages = ceil(limit / self.NUM_OF_JOBS_IN_PAGE)
+        tabs = [self.page] + [self.page.context.new_page() for _ in range(min(self.tabs, num_of_pages) - 1)]
+        job_keys = set()
+
+        try:
+            for first_page in range(0, num_of_pages, len(tabs)):
+                offsets = [first_offset + page_num * self.NUM_OF_JOBS_IN_PAGE for page_num in range(first_page, min(first_page + len(tabs), num_of_pages))]
+                for tab, offset in zip(tabs, offsets):
+                    # "commit" returns as soon as the navigation starts, so all tabs load at the same time.
+                    self.navigate(tab, f"{base_url}{self.URL_PAGE_NUM_PARAMETER}{offset}", wait_until="commit")
+
+                last_page_reached = False
+                for tab, offset in zip(tabs, offsets):
+                    tab_extractor = JobExtractor(tab, self.constants, seen=self.seen, pacer=self.pacer, snapshots=self.snapshots)
+                    page_limit = min(self.NUM_OF_JOBS_IN_PAGE, limit - (offset - first_offset))
+                    page_jobs, num_of_elements = tab_extractor._process_current_page(page_limit)
+                    if not num_of_elements and offset > first_offset:
+                        self._report_empty_page()
+                    self.position = offset + min(page_limit, num_of_elements)
+                    self.processed += tab_extractor.processed
+                    for job in page_jobs:
+                        if len(job_keys) < limit and self._job_key(job.url) not in job_keys:
+                            job_keys.add(self._job_key(job.url))
+                            yield job
+                    if num_of_elements < self.NUM_OF_JOBS_IN_PAGE or tab_extractor.page_fully_known:
+                        last_page_reached = True
+                        break
+                if last_page_reached:
+                    break
+        finally:
+            for tab in tabs[1:]:
+                tab.close()
+
+    def _process_current_page(self, limit: int) -> Tuple[List[Job], int]:
+        """Process up to limit job cards of the currently loaded results page.
+        Returns the extracted jobs and the number of cards found on the page, cards seen in previous runs are not clicked
+        and, like in the sequential search, only the clicked cards are added to `processed`."""
+        logger.debug("JobExtractor._process_current_page")
+        jobs = []
+        elements = self.search_results_elements
+        known = self._known_cards(len(elements))
+        self.page_fully_known = bool(elements) and all(known)
+        for element, is_known in zip(elements[:limit], known):
+            if is_known:
                 continue
+            self.processed += 1
+            try:
+                self.click(element)
+                job = self._process_single_job_element()
+                if job: jobs.append(job)
+            except Exception as e:
+                logger.warning(f"Failed processing job element: {str(e)}")
+        return jobs, len(elements)
 
-        return jobs
+    def _known_cards(self, num_of_cards: int) -> List[bool]:
+        """Tells for every card of the loaded results page whether its job was seen in a previous run,
+        reading all the card job ids in a single evaluate call."""
+        logger.debug("JobExtractor._known_cards")
+        if self.seen is None:
+            return [False] * num_of_cards
+        job_ids = self.page.locator(self.locators.Job.SEARCH_RESULTS).evaluate_all(JOB_IDS_SCRIPT, self.locators.Card.JOB_ID_ATTRIBUTE)
+        known = self.seen.known(job_ids)
+        return ([job_id in known for job_id in job_ids] + [False] * num_of_cards)[:num_of_cards]
+
+    @staticmethod
+    def _job_key(url: str) -> str:
+        """Job URLs carry tracking parameters, the path alone identifies the job."""
+        return urllib.parse.urlsplit(url).path.rstrip("/")
 
     def _determine_job_limit(self, limit: Optional[int]) -> int:
         """Determine the number of jobs to process."""
@@ -160,12 +418,13 @@ class JobExtractor:
         logger.debug("JobExtractor._process_single_job_element")
         job_data = self._extract_single_job_data()
 
-        if ((not job_data['easy_apply']) and (not self.is_job_apply_button)):
+        if ((not job_data['easy_apply']) and (not self._has_apply_button(job_data))):
             logger.info(f"Already applied to job: {job_data['title']}")
             return None
 
         if self._is_valid_job_data(job_data):
             job = self._create_job_object(job_data)
+            METRICS.count("jobs_extracted")
             logger.info(f"Job added: {job_data['title']}")
             return job
         
@@ -174,17 +433,47 @@ class JobExtractor:
 
     def _extract_single_job_data(self) -> Dict:
         logger.debug("JobExtractor._extract_single_job_data")
-        job = {
-            "title": self.job_title,
-            "company": self.job_company,
-            "location": self.job_location,
-            "url": self.job_url,
-            "description": self.job_description,
-            "easy_apply": self.is_job_easy_apply,
-        }
+        with METRICS.span("detail_extraction"):
+            job = self._extract_single_job_data_bulk()
+            if job is None:
+                job = {
+                    "title": self.job_title,
+                    "company": self.job_company,
+                    "location": self.job_location,
+                    "url": self.job_url,
+                    "description": self.job_description,
+                    "easy_apply": self.is_job_easy_apply,
+                }
         logger.debug(f"extracted job details: {job}")
+        if self.snapshots and job.get("url"):
+            self._save_snapshot(job["url"])
         return job
 
+    def _save_snapshot(self, url: str) -> None:
+        """Keeps the detail pane HTML, so the job can be parsed again later without the browser."""
+        logger.debug("JobExtractor._save_snapshot")
+        try:
+            html = self.page.evaluate(DETAILS_PANE_SCRIPT, self.locators.Job.DETAILS_PANE)
+            self.snapshots.put(SeenJobs.url_job_id(url), url, html)
+        except Exception as e:
+            logger.warning(f"Failed saving the snapshot of {url}: {str(e)}")
+
+    def _extract_single_job_data_bulk(self) -> Optional[Dict]:
+        """Waits once for the detail pane, then reads every field in a single page.evaluate round-trip.
+        Returns None when the bulk read is not possible, so the per-field locators are used instead."""
+        logger.debug("JobExtractor._extract_single_job_data_bulk")
+        try:
+            self.page.wait_for_selector(self.locators.Job.DESCRIPTION, timeout=self.constants.DEFAULT_TIMEOUT * 1000)
+            job = self.page.evaluate(JOB_DETAILS_SCRIPT, job_details_selectors(self.locators))
+        except Exception as e:
+            logger.debug(f"Bulk job extraction failed: {str(e)}")
+            return None
+        return job if isinstance(job, dict) else None
+
+    def _has_apply_button(self, job_data: Dict) -> bool:
+        apply_button = job_data.get("apply_button")
+        return self.is_job_apply_button if apply_button is None else apply_button
+
     def _is_valid_job_data(self, job_data: Dict) -> bool:
         logger.debug("JobExtractor._is_valid_job_data")
         required_fields = ["title", "company", "location", "url"]
@@ -0,0 +1,138 @@
+# src/search/linkedin/response_capture.py
+
+import re
+import src.logger as LOGGER
+from typing import Dict, List, Optional
+from playwright.sync_api import Page, Response
+
+from src.constants.constants import Constants
+from src.models.job import Job
+
+logger = LOGGER.get(__name__)
+
+
+class JobResponseCapture:
+    """Collects the job search and job posting JSON responses of a page and builds Job objects from them,
+    without waiting for the data to be rendered."""
+
+    JOB_ID_PATTERN = re.compile(r"(\d+)\)?$")
+
+    def __init__(self, page: Page, constants: Constants):
+        logger.debug("JobResponseCapture instance created")
+        self.page = page
+        self.constants = constants
+        self.records: Dict[str, Dict] = {}
+        self._responses: List[Response] = []
+
+    def __enter__(self) -> "JobResponseCapture":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        logger.debug("JobResponseCapture.start")
+        self.page.on("response", self._on_response)
+
+    def stop(self) -> None:
+        logger.debug("JobResponseCapture.stop")
+        self.page.remove_listener("response", self._on_response)
+
+    def is_job_cards_response(self, url: str) -> bool:
+        return self.constants.Api.JOB_CARDS in url
+
+    def is_job_posting_response(self, url: str) -> bool:
+        return self.constants.Api.JOB_POSTING in url
+
+    def _on_response(self, response: Response) -> None:
+        # Only keep the response here, the body is read later outside of the event dispatch.
+        if self.is_job_cards_response(response.url) or self.is_job_posting_response(response.url):
+            self._responses.append(response)
+
+    def collect(self) -> List[str]:
+        """Parses the responses received so far, returns the ids of the jobs that were not seen before."""
+        logger.debug("JobResponseCapture.collect")
+        new_ids = []
+        responses, self._responses = self._responses, []
+        for response in responses:
+            try:
+                payload = response.json()
+            except Exception as e:
+                logger.warning(f"Failed reading job response {response.url}: {str(e)}")
+                continue
+            for job_id, record in self.parse_payload(payload).items():
+                if job_id not in self.records:
+                    new_ids.append(job_id)
+                self._merge(job_id, record)
+        return new_ids
+
+    def jobs(self, job_ids: Optional[List[str]] = None) -> List[Job]:
+        """Builds Job objects, in capture order, from the records that have all the required fields."""
+        logger.debug("JobResponseCapture.jobs")
+        jobs = []
+        for job_id in job_ids if job_ids is not None else list(self.records):
+            record = self.records[job_id]
+            if not all(record.get(field) for field in ["title", "company", "location"]):
+                logger.warning(f"Missing information for job {job_id} in the captured responses. Skipping.")
+                continue
+            jobs.append(Job(
+                title=record["title"],
+                company=record["company"],
+                location=record["location"],
+                url=self.constants.JOB_VIEW_URL.format(job_id=job_id),
+                easy_apply=bool(record.get("easy_apply")),
+                description=record.get("description"),
+                raw_data=record["raw_data"],
+                posted_at=record.get("posted_at"),
+            ))
+        return jobs
+
+    def _merge(self, job_id: str, record: Dict) -> None:
+        merged = self.records.setdefault(job_id, {"raw_data": {"job_id": job_id, "entities": []}})
+        merged["raw_data"]["entities"].append(record.pop("raw_data"))
+        merged.update({key: value for key, value in record.items() if value is not None})
+
+    @classmethod
+    def parse_payload(cls, payload: Dict) -> Dict[str, Dict]:
+        """Extracts job records from a normalized (data + included entities) API payload, keyed by job id."""
+        entities = [payload.get("data") or {}] + list(payload.get("included") or [])
+        companies = {entity.get("entityUrn"): entity.get("name") for entity in entities if entity.get("$type", "").endswith(".Company")}
+        records = {}
+        for entity in entities:
+            entity_type = entity.get("$type", "")
+            if entity_type.endswith(".JobPostingCard"):
+                job_id = cls._job_id(entity.get("jobPostingUrn"))
+                record = {
+                    "title": cls._text(entity.get("title")) or entity.get("jobPostingTitle"),
+                    "company": cls._text(entity.get("primaryDescription")),
+                    "location": cls._text(entity.get("secondaryDescription")),
+                    "easy_apply": any(item.get("type") == "EASY_APPLY_TEXT" for item in entity.get("footerItems") or []) or None,
+                }
+            elif entity_type.endswith(".JobPosting") and ("description" in entity or "formattedLocation" in entity):
+                job_id = str(entity["jobPostingId"]) if entity.get("jobPostingId") else cls._job_id(entity.get("entityUrn"))
+                company_details = entity.get("companyDetails") or {}
+                apply_type = (entity.get("applyMethod") or {}).get("$type", "")
+                record = {
+                    "title": entity.get("title"),
+                    "company": companies.get(company_details.get("company")) or company_details.get("companyName"),
+                    "location": entity.get("formattedLocation"),
+                    "description": cls._text(entity.get("description")),
+                    "easy_apply": apply_type.endswith("OnsiteApply"),
+                    "posted_at": entity["listedAt"] / 1000 if entity.get("listedAt") else None,
+                }
+            else:
+                continue
+            if job_id:
+                record["raw_data"] = entity
+                records[job_id] = record
+        return records
+
+    @classmethod
+    def _job_id(cls, urn: Optional[str]) -> Optional[str]:
+        match = cls.JOB_ID_PATTERN.search(urn or "")
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _text(value) -> Optional[str]:
+        return value.get("text") if isinstance(value, dict) else value
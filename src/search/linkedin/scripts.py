@@ -0,0 +1,95 @@
+# src/search/linkedin/scripts.py
+
+from typing import Dict
+
+# Resolves a locator the way Playwright would: "xpath=" prefixed or "/"-leading selectors are XPath, anything else is CSS.
+FIND_FUNCTION = """
+    const find = (selector, root = document) => {
+        if (!selector) return null;
+        if (selector.startsWith("xpath=")) selector = selector.slice("xpath=".length);
+        if (selector.startsWith("/") || selector.startsWith("(") || selector.startsWith("./")) {
+            return document.evaluate(selector, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        return root.querySelector(selector);
+    };
+    const findAll = (selector, root = document) => {
+        if (selector.startsWith("xpath=")) selector = selector.slice("xpath=".length);
+        if (selector.startsWith("/") || selector.startsWith("(") || selector.startsWith("./")) {
+            const snapshot = document.evaluate(selector, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({ length: snapshot.snapshotLength }, (_, index) => snapshot.snapshotItem(index));
+        }
+        return Array.from(root.querySelectorAll(selector));
+    };
+    const text = (selector, root) => { const node = find(selector, root); return node ? node.innerText.trim() : null; };
+    const attribute = (selector, name, root) => { const node = find(selector, root); return node ? node.getAttribute(name) : null; };
+"""
+
+# Reads every field of the job detail pane, including the apply buttons presence, in a single round-trip.
+JOB_DETAILS_SCRIPT = "(selectors) => {" + FIND_FUNCTION + """
+    return {
+        title: text(selectors.title),
+        company: text(selectors.company),
+        location: text(selectors.location),
+        url: attribute(selectors.url, "href"),
+        description: text(selectors.description),
+        easy_apply: find(selectors.easy_apply) !== null,
+        apply_button: find(selectors.apply) !== null,
+    };
+}"""
+
+
+# Returns the HTML of the job detail pane, or of the whole page when the pane is not found.
+DETAILS_PANE_SCRIPT = "(selector) => {" + FIND_FUNCTION + """
+    return (find(selector) || document.body).outerHTML;
+}"""
+
+
+# Reads every card of the results list in a single round-trip.
+# The list only renders the cards near the viewport, so every card is scrolled into view before it is read.
+JOB_CARDS_SCRIPT = "async (selectors) => {" + FIND_FUNCTION + """
+    const cards = [];
+    for (const item of findAll(selectors.results)) {
+        item.scrollIntoView({ block: "center" });
+        await new Promise((resolve) => setTimeout(resolve, selectors.scroll_delay));
+        const link = find(selectors.url, item);
+        cards.push({
+            job_id: item.getAttribute(selectors.job_id_attribute),
+            title: (text(selectors.title, item) || "").split("\\n")[0].trim() || null,
+            company: text(selectors.company, item),
+            location: text(selectors.location, item),
+            url: link ? link.href : null,
+            easy_apply: find(selectors.easy_apply, item) !== null,
+        });
+    }
+    return cards;
+}"""
+
+# Reads the job id attribute of every results card, for Locator.evaluate_all.
+JOB_IDS_SCRIPT = "(items, name) => items.map((item) => item.getAttribute(name))"
+
+
+def job_details_selectors(locators) -> Dict[str, str]:
+    """Maps the JOB_DETAILS_SCRIPT fields to the site job locators."""
+    return {
+        "title": locators.Job.TITLE,
+        "company": locators.Job.COMPANY,
+        "location": locators.Job.LOCATION,
+        "url": locators.Job.URL,
+        "description": locators.Job.DESCRIPTION,
+        "easy_apply": locators.Job.EASY_APPLY,
+        "apply": locators.Job.APPLY,
+    }
+
+
+def job_cards_selectors(locators, scroll_delay: int) -> Dict:
+    """Maps the JOB_CARDS_SCRIPT fields to the site card locators."""
+    return {
+        "results": locators.Search.SEARCH_RESULTS,
+        "title": locators.Card.TITLE,
+        "company": locators.Card.COMPANY,
+        "location": locators.Card.LOCATION,
+        "url": locators.Card.URL,
+        "easy_apply": locators.Card.EASY_APPLY,
+        "job_id_attribute": locators.Card.JOB_ID_ATTRIBUTE,
+        "scroll_delay": scroll_delay,
+    }
@@ -1,15 +1,19 @@
 # src\search\search.py
-# TODO: add sleeps to avoid bot capture
 
-from time import sleep
+import re
 import src.logger as LOGGER
+import src.utils.metrics as METRICS
 import urllib.parse
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from playwright.sync_api import Page
 from src.models.job import Job
 from src.exceptions import SearchError
 from src.search.linkedin.job_extractor import JobExtractor
+from src.search.linkedin.filters import encode_filters
 from src.constants.constants import Constants
+from src.utils.seen_jobs import SeenJobs
+from src.utils.pacer import Pacer
+from src.utils.snapshot_store import SnapshotStore
 
 
 logger = LOGGER.get(__name__)
@@ -18,11 +22,12 @@ logger = LOGGER.get(__name__)
 class JobSearch:
     """Manages job searching on LinkedIn."""
 
-    def __init__(self, page: Page, constants: Constants) -> None:
+    def __init__(self, page: Page, constants: Constants, tabs: int = Constants.DEFAULT_EXTRACTION_TABS, seen: Optional[SeenJobs] = None, pacer: Optional[Pacer] = None, snapshots: Optional[SnapshotStore] = None) -> None:
         logger.debug("LinkedInJobSearch instance created")
         self.page = page
         self.constants = constants
-        self.job_extractor = JobExtractor(page, constants)
+        self.pacer = pacer
+        self.job_extractor = JobExtractor(page, constants, tabs, seen, pacer, snapshots)
 
     def search_jobs(
         self,
@@ -34,10 +39,7 @@ class JobSearch:
     ) -> List[Job]:
         """Searches for jobs on LinkedIn."""
         try:
-            logger.info(f"Searching for jobs with keywords '{keywords}' in '{location}'...")
-            search_url = self._build_search_url(keywords, location, additional_filters)
-            self.page.goto(search_url)
-            self._select_time_range(epoch_ago)
+            self._open_search(keywords, location, epoch_ago, additional_filters)
 
             jobs = self.job_extractor.extract_jobs(None, limit)
             logger.info(f"Found {len(jobs)} jobs.")
@@ -48,13 +50,96 @@ class JobSearch:
             logger.error(error_msg)
             raise SearchError(error_msg) from e
 
+    def iter_jobs(
+        self,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        epoch_ago: Optional[str] = None,
+        additional_filters: Dict[str, str] = None,
+        limit: Optional[int] = None,
+        start: int = 0,
+    ) -> Iterator[Job]:
+        """Searches for jobs on LinkedIn, yielding every job as soon as it is extracted.
+        `start` is the results offset to begin from, to resume an interrupted search."""
+        try:
+            self._open_search(keywords, location, epoch_ago, additional_filters)
+        except Exception as e:
+            error_msg = f"Failed to perform job search: {str(e)}"
+            logger.error(error_msg)
+            raise SearchError(error_msg) from e
+
+        start_url = None
+        if start:
+            page_num_parameter = self.constants.URL_PAGE_NUM_PARAMETER
+            search_url = re.sub(fr"{re.escape(page_num_parameter)}\d+", "", self.page.url)
+            start_url = f"{search_url}{page_num_parameter}{start}"
+        yield from self.job_extractor.iter_jobs(start_url, limit)
+
+    def search_job_cards(
+        self,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        epoch_ago: Optional[str] = None,
+        additional_filters: Dict[str, str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Job]:
+        """Searches for jobs on LinkedIn, reading only the result cards (no description)."""
+        try:
+            self._open_search(keywords, location, epoch_ago, additional_filters)
+
+            jobs = self.job_extractor.extract_job_cards(None, limit)
+            logger.info(f"Found {len(jobs)} job cards.")
+            return jobs
+
+        except Exception as e:
+            error_msg = f"Failed to perform job search: {str(e)}"
+            logger.error(error_msg)
+            raise SearchError(error_msg) from e
+
+    def search_jobs_from_network(
+        self,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        epoch_ago: Optional[str] = None,
+        additional_filters: Dict[str, str] = None,
+        limit: Optional[int] = None,
+        descriptions: bool = True,
+    ) -> List[Job]:
+        """Searches for jobs on LinkedIn, building them from the API responses instead of the rendered pages.
+        The extractor opens the search itself, so the results responses are captured from the first navigation."""
+        try:
+            logger.info(f"Searching for jobs with keywords '{keywords}' in '{location}'...")
+            search_url = self._build_search_url(keywords, location, additional_filters, epoch_ago)
+
+            jobs = self.job_extractor.extract_jobs_from_network(search_url, limit, descriptions)
+            logger.info(f"Found {len(jobs)} jobs.")
+            return jobs
+
+        except Exception as e:
+            error_msg = f"Failed to perform job search: {str(e)}"
+            logger.error(error_msg)
+            raise SearchError(error_msg) from e
+
+    def _open_search(
+        self,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        epoch_ago: Optional[str] = None,
+        additional_filters: Optional[Dict[str, str]] = None,
+    ) -> None:
+        logger.info(f"Searching for jobs with keywords '{keywords}' in '{location}'...")
+        search_url = self._build_search_url(keywords, location, additional_filters, epoch_ago)
+        with METRICS.span("search_navigation"):
+            self.job_extractor.navigate(self.page, search_url)
+
     def _build_search_url(
         self,
         keywords: Optional[str] = None,
         location: Optional[str] = None,
         additional_filters: Optional[Dict[str, str]] = None,
+        epoch_ago: Optional[str] = None,
     ) -> str:
-        """Builds the LinkedIn search URL with the given parameters."""
+        """Builds the LinkedIn search URL with the given parameters, the time range and filters included."""
         logger.debug(f"LinkedInJobSearch._build_search_url")
 
         base_url = self.constants.JOBS_SEARCH_URL + "?"
@@ -64,16 +149,6 @@ class JobSearch:
             url_parts["keywords"] = keywords
         if location:
             url_parts["location"] = location
-        if additional_filters:
-            # TODO: Implement proper filter handling
-            raise NotImplementedError("Filter handling is not implemented yet.")
+        url_parts.update(encode_filters(epoch_ago, additional_filters))
 
         return base_url + urllib.parse.urlencode(url_parts)
-    
-    def _select_time_range(self, epoch_ago: str = 86400) -> None:
-        # TODO: improve code.
-        if epoch_ago:
-            self.page.locator("//button[text()='Date posted']").click()
-            self.page.locator(f"//label[@for='timePostedRange-r{epoch_ago}']").click()
-            self.page.get_by_role("button", name="Apply current filter to show").click()
-            sleep(3)
\ No newline at end of file
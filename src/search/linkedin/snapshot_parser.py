@@ -0,0 +1,118 @@
+# src/search/linkedin/snapshot_parser.py
+"""Rebuilds jobs from the detail pane snapshots of a SnapshotStore with lxml, without a browser,
+so a fixed or new locator can be applied to every stored job in seconds.
+
+    python -m src.search.linkedin.snapshot_parser data/snapshots data/results/reparsed.jsonl --processes 4
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from lxml import html as lxml_html
+import src.logger as LOGGER
+
+from src.constants.constants import Constants
+from src.constants.linkedin import LinkedInConstants
+from src.models.job import Job
+from src.search.linkedin.scripts import job_details_selectors
+from src.utils.jsonl_writer import JsonlWriter
+from src.utils.snapshot_store import SnapshotStore
+
+
+logger = LOGGER.get(__name__)
+
+def _find_all(tree, selector: str) -> list:
+    """Resolves a locator like JOB_DETAILS_SCRIPT does, "xpath=" prefixed or "/"-leading selectors are XPath.
+    Every job details locator is XPath, CSS selectors would need the cssselect package and are not supported."""
+    if selector.startswith("xpath="):
+        selector = selector[len("xpath="):]
+    if selector.startswith(("/", "(", "./")):
+        return tree.xpath(selector)
+    raise ValueError(f"Snapshots can only be parsed with XPath locators: {selector}")
+
+def _text(tree, selector: str) -> Optional[str]:
+    nodes = _find_all(tree, selector)
+    return nodes[0].text_content().strip() if nodes else None
+
+def parse_snapshot(html: str, selectors: Dict[str, str]) -> Dict:
+    """Reads the JOB_DETAILS_SCRIPT fields out of a detail pane snapshot, `selectors` from job_details_selectors."""
+    tree = lxml_html.fromstring(html)
+    url_nodes = _find_all(tree, selectors["url"])
+    return {
+        "title": _text(tree, selectors["title"]),
+        "company": _text(tree, selectors["company"]),
+        "location": _text(tree, selectors["location"]),
+        "url": url_nodes[0].get("href") if url_nodes else None,
+        "description": _text(tree, selectors["description"]),
+        "easy_apply": bool(_find_all(tree, selectors["easy_apply"])),
+        "apply_button": bool(_find_all(tree, selectors["apply"])),
+    }
+
+def _parse_chunk(chunk: List[Tuple[str, str, str]], store_path: str, selectors: Dict[str, str]) -> List[Job]:
+    """Process pool task, the store is only read, through the object files."""
+    jobs = []
+    for job_id, url, digest in chunk:
+        try:
+            job_data = parse_snapshot(SnapshotStore.read(SnapshotStore.object_path_in(store_path, digest)), selectors)
+        except Exception as e:
+            logger.warning(f"Failed parsing snapshot {digest} of job {job_id}: {str(e)}")
+            continue
+        job_data["url"] = job_data["url"] or url
+        if not job_data["easy_apply"] and not job_data["apply_button"]:
+            logger.debug(f"Skipping snapshot of job {job_id} with no apply button, already applied to it")
+            continue
+        if not all(job_data[field] for field in ["title", "company", "location", "url"]):
+            logger.debug(f"Skipping snapshot of job {job_id} with missing fields: {job_data}")
+            continue
+        jobs.append(Job(title=job_data["title"], company=job_data["company"], location=job_data["location"], url=job_data["url"],
+                        description=job_data["description"], easy_apply=job_data["easy_apply"], raw_data={"job_id": job_id, "snapshot": digest}))
+    return jobs
+
+
+class SnapshotParser:
+    """Re-parses every snapshot of a store across a process pool."""
+
+    CHUNK_SIZE = 200
+
+    def __init__(self, store: SnapshotStore, constants: Constants = LinkedInConstants, processes: Optional[int] = None):
+        logger.debug("SnapshotParser instance created")
+        self.store = store
+        self.selectors = job_details_selectors(constants.Locators)
+        self.processes = processes
+
+    def parse_all(self) -> List[Job]:
+        """Returns the jobs rebuilt from the snapshots, in capture order. Like the live extractor, snapshots missing a required field
+        or with neither an Easy Apply nor an Apply button (already applied) are skipped."""
+        logger.debug("SnapshotParser.parse_all")
+        entries = self.store.entries()
+        chunks = [entries[start:start + self.CHUNK_SIZE] for start in range(0, len(entries), self.CHUNK_SIZE)]
+        if self.processes == 1 or len(chunks) <= 1:
+            results = [_parse_chunk(chunk, self.store.path, self.selectors) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.processes) as executor:
+                results = list(executor.map(_parse_chunk, chunks, [self.store.path] * len(chunks), [self.selectors] * len(chunks)))
+        jobs = [job for chunk_jobs in results for job in chunk_jobs]
+        logger.info(f"Rebuilt {len(jobs)} jobs from {len(entries)} snapshots.")
+        return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("store", help="snapshot store directory, snapshots_path in config.ini")
+    parser.add_argument("output", help="JSON Lines file the rebuilt jobs are written to")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes, defaults to the CPU count")
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args()
+    LOGGER.setup(args.log_level)
+
+    store = SnapshotStore(args.store)
+    try:
+        jobs = SnapshotParser(store, LinkedInConstants, args.processes).parse_all()
+    finally:
+        store.close()
+    with JsonlWriter(args.output, append=False) as writer:
+        writer.write_many(jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# src/utils/checkpoint.py
+
+import json
+import os
+from typing import Dict, Optional
+import src.logger as LOGGER
+
+
+logger = LOGGER.get(__name__)
+
+class Checkpoint:
+    """Search position of a run (query, results offset and processed count), saved atomically after every scored batch."""
+
+    def __init__(self, path: str):
+        logger.debug("Checkpoint instance created")
+        self.path = path
+
+    def save(self, query: Dict, start: int, processed: int) -> None:
+        logger.debug(f"Checkpoint.save: start={start}, processed={processed}")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump({"query": query, "start": start, "processed": processed}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, self.path)
+
+    def load(self, query: Optional[Dict] = None) -> Optional[Dict]:
+        """Returns the saved checkpoint, or None if there is none or it belongs to another query."""
+        logger.debug("Checkpoint.load")
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if query is not None and checkpoint.get("query") != query:
+            logger.warning(f"Ignoring checkpoint of another query: {checkpoint.get('query')}")
+            return None
+        return checkpoint
+
+    def clear(self) -> None:
+        logger.debug("Checkpoint.clear")
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,98 @@
+# src/utils/description_compactor.py
+
+import re
+import threading
+from math import ceil
+from typing import List, Optional
+import src.logger as LOGGER
+import src.utils.metrics as METRICS
+from src.constants.constants import Constants
+
+
+logger = LOGGER.get(__name__)
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Rough LLM token count of a text, about CHARS_PER_TOKEN characters per token."""
+    return ceil(len(text or "") / Constants.CHARS_PER_TOKEN)
+
+
+class DescriptionCompactor:
+    """Shrinks job descriptions before they are scored: normalizes whitespace, drops boilerplate sections
+    (about the company, benefits, equal opportunity statements), keeps the responsibilities and requirements
+    sections when the description has them, and caps the result at token_budget tokens."""
+
+    # Headings are matched on short lines, with an optional trailing colon.
+    BOILERPLATE_HEADINGS = re.compile(
+        r"^(about (us|our (company|team|story)|the (company|team|organi[sz]ation|business)|[\w&.' -]{1,40}\b(inc|ltd|llc|gmbh|group|labs|technologies|company|team)\.?)|who we are|our (company|story|mission|culture|values)|why (join|work)\b.*|"
+        r"(what we offer|we offer|benefits|perks)\b.*|equal (employment )?opportunit.*|eeo\b.*|diversity\b.*|privacy\b.*|how to apply)$", re.IGNORECASE)
+    RELEVANT_HEADINGS = re.compile(
+        r"^(about the (role|job|position|opportunity)|the role|role (overview|description)|job description|overview|"
+        r"(key |main |your )?responsibilities|what you('ll| will) (do|be doing)|your (role|mission|tasks)|duties|"
+        r"(minimum |basic |preferred |key )?(requirements|qualifications)|what (you('ll)? need|we('re| are) looking for)|"
+        r"who you are|about you|the ideal candidate|what you bring|you (have|bring)|(required |desired )?(skills|experience)\b.*|must have\b.*|nice to have\b.*|bonus\b.*)$", re.IGNORECASE)
+    # Sentences of equal opportunity statements that often come without a heading.
+    BOILERPLATE_SENTENCE = re.compile(r"equal opportunity employer|without regard to (race|age|sex|gender)|reasonable accommodation", re.IGNORECASE)
+    SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+    MAX_HEADING_WORDS = 8
+
+    def __init__(self, token_budget: int = Constants.DEFAULT_DESCRIPTION_TOKEN_BUDGET):
+        logger.debug("DescriptionCompactor instance created")
+        self.token_budget = token_budget
+        self.descriptions = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+        self._lock = threading.Lock()
+
+    def _heading(self, line: str) -> Optional[str]:
+        """"boilerplate" or "relevant" when the line is a known section heading."""
+        text = line.rstrip(":").strip()
+        if not text or len(text.split()) > self.MAX_HEADING_WORDS:
+            return None
+        if self.RELEVANT_HEADINGS.match(text):
+            return "relevant"
+        if self.BOILERPLATE_HEADINGS.match(text):
+            return "boilerplate"
+        return None
+
+    def compact(self, description: Optional[str]) -> Optional[str]:
+        """Returns the compacted description, None stays None."""
+        if description is None:
+            return None
+        lines = [" ".join(line.split()) for line in description.splitlines()]
+        intro: List[str] = []
+        relevant: List[str] = []
+        section = intro
+        for line in filter(None, lines):
+            heading = self._heading(line)
+            if heading == "boilerplate":
+                section = None
+            elif heading == "relevant":
+                section = relevant
+                section.append(line)
+            elif section is not None:
+                line = " ".join(sentence for sentence in self.SENTENCE_END.split(line) if not self.BOILERPLATE_SENTENCE.search(sentence))
+                if line:
+                    section.append(line)
+        # Without a recognized responsibilities or requirements section the text outside boilerplate is all there is to score.
+        compacted = "\n".join(relevant or intro) or "\n".join(filter(None, lines))
+        max_chars = self.token_budget * Constants.CHARS_PER_TOKEN
+        if self.token_budget and len(compacted) > max_chars:
+            cut = compacted.rfind(" ", 0, max_chars + 1)
+            compacted = compacted[:cut if cut > 0 else max_chars]
+        tokens_before, tokens_after = estimate_tokens(description), estimate_tokens(compacted)
+        with self._lock:
+            self.descriptions += 1
+            self.tokens_before += tokens_before
+            self.tokens_after += tokens_after
+        METRICS.count("description_tokens_before", tokens_before)
+        METRICS.count("description_tokens_after", tokens_after)
+        return compacted
+
+    def compact_many(self, descriptions: List[Optional[str]]) -> List[Optional[str]]:
+        logger.debug("DescriptionCompactor.compact_many")
+        return [self.compact(description) for description in descriptions]
+
+    def log_stats(self) -> None:
+        saved = f", {1 - self.tokens_after / self.tokens_before:.0%} saved" if self.tokens_before else ""
+        logger.info(f"Description compaction: {self.descriptions} descriptions, about {self.tokens_before} tokens before "
+                    f"and {self.tokens_after} after{saved}")
@@ -1,10 +1,24 @@
 # src/utils/description_matcher.py
 
+import hashlib
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from time import sleep
 import src.logger as LOGGER
+import src.utils.metrics as METRICS
 # from fuzzywuzzy import fuzz
-from llm_utils import LLMUtils
+from typing import Any, Dict, List, Optional
 
 from src.constants.constants import Constants
+from src.utils.description_compactor import DescriptionCompactor
+import src.utils.matcher_backends as BACKENDS
+from src.utils.llm_backend import LLMBackend
+from src.utils.near_duplicates import NearDuplicates
+from src.utils.rate_limiter import RateLimiter
+from src.utils.score_cache import ScoreCache
 
 
 logger = LOGGER.get(__name__)
@@ -12,11 +26,43 @@ logger = LOGGER.get(__name__)
 class DescriptionMatcher:
     """Matches job descriptions using various methods."""
 
-    def __init__(self, method: str = Constants.DEFAULT_MATCHING_METHOD, threshold: int = Constants.DEFAULT_THRESHOLD, api_key: str = None):
+    PROMPT_TEMPLATE = "Given the current job description: {job_description}, and the desired job description: {user_description}, rate from 0 to 100 if the current job description is matching the desired job description. return only the final score."
+    BATCH_PROMPT_TEMPLATE = "Given the desired job description: {user_description}, rate from 0 to 100 how well each of the following {count} job descriptions is matching the desired job description.\n{job_descriptions}\nReturn only a JSON list of {count} integer scores, in the same order as the job descriptions."
+
+    def __init__(self,
+                 method: str = Constants.DEFAULT_MATCHING_METHOD,
+                 threshold: int = Constants.DEFAULT_THRESHOLD,
+                 api_key: str = None,
+                 batch_size: int = Constants.DEFAULT_BATCH_SIZE,
+                 concurrency: int = Constants.DEFAULT_LLM_CONCURRENCY,
+                 requests_per_minute: int = Constants.DEFAULT_LLM_REQUESTS_PER_MINUTE,
+                 cache: Optional[ScoreCache] = None,
+                 llm: Optional[LLMBackend] = None,
+                 duplicates: Optional[NearDuplicates] = None,
+                 compactor: Optional[DescriptionCompactor] = None):
         logger.debug("DescriptionMatcher instance created")
         self.method = method
         self.threshold = threshold
-        self.llm = LLMUtils(api_key)
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.rate_limiter = RateLimiter(requests_per_minute)
+        self.cache = cache
+        self.duplicates = duplicates
+        self.compactor = compactor
+        self.api_key = api_key
+        self._backends: Dict[str, Any] = {"llm": llm} if llm is not None else {}
+        self._backends_lock = threading.Lock()
+
+    def backend(self, method: str) -> Any:
+        """The backend of a matching method, imported and built on first use."""
+        with self._backends_lock:
+            if method not in self._backends:
+                self._backends[method] = BACKENDS.load(method, api_key=self.api_key) if method == "llm" else BACKENDS.load(method)
+            return self._backends[method]
+
+    @property
+    def llm(self) -> LLMBackend:
+        return self.backend("llm")
 
     def matches(self, job_description: str, user_description: str) -> bool:
         logger.debug("DescriptionMatcher.matches")
@@ -26,21 +72,187 @@ class DescriptionMatcher:
         # logger.debug(f"User Description: {user_description}")
         
         if self.method == "llm":
-            prompt = f"Given the current job description: {job_description}, and the desired job description: {user_description}, rate from 0 to 100 if the current job description is matching the desired job description. return only the final score."
-            logger.debug(f"LLM prompt: {prompt}")
-            score = int(self.llm.generate_text(prompt))
-            logger.debug(f"Generated score: {score}")
+            score = self.scores([job_description], user_description)[0]
             logger.debug(f"Check if score >= self.threshold: {score} >= {self.threshold}")
             return score >= self.threshold
         elif self.method == "fuzz":
             raise NotImplementedError("Fuzzy matching implementation was removed.")
             # return self._fuzz_matches(job_description, user_description)
+        elif BACKENDS.is_registered(self.method):
+            return self.matches_many([job_description], user_description)[0]
         else:
             logger.error(f"Invalid matching method in config file: {self.method}")
             raise ValueError(f"Invalid matching method in config file: {self.method}")  
 
+    def matches_many(self, job_descriptions: List[Optional[str]], user_description: str) -> List[bool]:
+        """Matches several job descriptions at once, keeping the input order."""
+        logger.debug("DescriptionMatcher.matches_many")
+        scores = self.scores(job_descriptions, user_description)
+        logger.debug(f"Check scores >= self.threshold: {scores} >= {self.threshold}")
+        return [score >= self.threshold for score in scores]
+
+    def scores(self, job_descriptions: List[Optional[str]], user_description: str) -> List[int]:
+        """Returns the raw, threshold independent 0-100 score of each job description."""
+        logger.debug("DescriptionMatcher.scores")
+        METRICS.count("jobs_scored", len(job_descriptions))
+        if self.compactor is not None:
+            job_descriptions = self.compactor.compact_many(job_descriptions)
+        if self.duplicates is not None:
+            return self._deduplicated_scores(job_descriptions, user_description)
+        return self._method_scores(job_descriptions, user_description)
+
+    def _method_scores(self, job_descriptions: List[Optional[str]], user_description: str) -> List[int]:
+        logger.debug("DescriptionMatcher._method_scores")
+        if self.method == "llm":
+            with METRICS.span("scoring"):
+                if self.cache is not None:
+                    return self._cached_llm_scores(job_descriptions, user_description)
+                return self._llm_scores(job_descriptions, user_description)
+        elif self.method == "fuzz":
+            raise NotImplementedError("Fuzzy matching implementation was removed.")
+        elif BACKENDS.is_registered(self.method):
+            backend = self.backend(self.method)
+            with METRICS.span("scoring"):
+                return backend.scores(job_descriptions, user_description)
+        else:
+            logger.error(f"Invalid matching method in config file: {self.method}")
+            raise ValueError(f"Invalid matching method in config file: {self.method}")
+
+    def _deduplicated_scores(self, job_descriptions: List[Optional[str]], user_description: str) -> List[int]:
+        """Scores one description per near-duplicate cluster, the other descriptions of the cluster, in this call
+        or already scored by an earlier one, take its score."""
+        logger.debug("DescriptionMatcher._deduplicated_scores")
+        clusters = [self.duplicates.cluster(job_description) for job_description in job_descriptions]
+        scores: List[Optional[int]] = [None if cluster is None else self.duplicates.score(cluster, user_description) for cluster in clusters]
+        representatives = {}
+        unique = []
+        for index, cluster in enumerate(clusters):
+            if scores[index] is not None:
+                continue
+            if cluster is None or cluster not in representatives:
+                unique.append(index)
+                if cluster is not None:
+                    representatives[cluster] = index
+        unique_scores = self._method_scores([job_descriptions[index] for index in unique], user_description) if unique else []
+        for index, score in zip(unique, unique_scores):
+            scores[index] = score
+            if clusters[index] is not None:
+                self.duplicates.set_score(clusters[index], user_description, score)
+        for index, cluster in enumerate(clusters):
+            if scores[index] is None:
+                scores[index] = scores[representatives[cluster]]
+        skipped = len(job_descriptions) - len(unique)
+        llm_calls_saved = ceil(len(job_descriptions) / self.batch_size) - ceil(len(unique) / self.batch_size) if self.method == "llm" else 0
+        self.duplicates.record(len(job_descriptions), skipped, llm_calls_saved)
+        METRICS.count("near_duplicates", skipped)
+        METRICS.count("llm_calls_saved", llm_calls_saved)
+        if skipped:
+            logger.info(f"{skipped} of {len(job_descriptions)} jobs are near-duplicates, they take the score of their cluster")
+        return scores
+
+    def _cached_llm_scores(self, job_descriptions: List[Optional[str]], user_description: str) -> List[int]:
+        """Serves scores from the cache and only sends the missing descriptions to the LLM."""
+        logger.debug("DescriptionMatcher._cached_llm_scores")
+        keys = [self._cache_key(job_description, user_description) for job_description in job_descriptions]
+        cached = self.cache.get_many(keys)
+        missing = {key: job_description for key, job_description in zip(keys, job_descriptions) if key not in cached}
+        METRICS.count("score_cache_hits", sum(key in cached for key in keys))
+        METRICS.count("score_cache_misses", len(missing))
+        if missing:
+            new_scores = self._llm_scores(list(missing.values()), user_description)
+            new_items = dict(zip(missing.keys(), new_scores))
+            self.cache.put_many(new_items.items())
+            cached.update(new_items)
+        self.cache.log_stats()
+        return [cached[key] for key in keys]
+
+    def _cache_key(self, job_description: Optional[str], user_description: str) -> str:
+        """Hashes everything the raw score depends on: both descriptions, the prompt templates and the model.
+        A score comes from the batch prompt or, for single jobs and unparsable batch replies, the single job prompt, so both are hashed."""
+        normalize = lambda text: " ".join((text or "").split()).lower()
+        payload = json.dumps([normalize(job_description), normalize(user_description), self.PROMPT_TEMPLATE, self.BATCH_PROMPT_TEMPLATE, Constants.GOOGLE_API_MODEL])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _llm_scores(self, job_descriptions: List[Optional[str]], user_description: str) -> List[int]:
+        """Scores batches of up to batch_size descriptions with up to `concurrency` workers at once, keeping the input order."""
+        logger.debug("DescriptionMatcher._llm_scores")
+        batches = [job_descriptions[start:start + self.batch_size] for start in range(0, len(job_descriptions), self.batch_size)]
+        def score_batch(batch: List[Optional[str]]) -> List[int]:
+            with METRICS.span("llm_batch"):
+                return self._llm_batch_scores(batch, user_description)
+        if self.concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                batch_scores = list(executor.map(score_batch, batches))
+        else:
+            batch_scores = [score_batch(batch) for batch in batches]
+        return [score for batch in batch_scores for score in batch]
+
+    def _llm_score(self, job_description: str, user_description: str) -> int:
+        logger.debug("DescriptionMatcher._llm_score")
+        prompt = self.PROMPT_TEMPLATE.format(job_description=job_description, user_description=user_description)
+        logger.debug(f"LLM prompt: {prompt}")
+        score = int(self._generate_text(prompt))
+        logger.debug(f"Generated score: {score}")
+        return score
+
+    def _llm_batch_scores(self, job_descriptions: List[Optional[str]], user_description: str) -> List[int]:
+        """Scores a batch in a single LLM call, falling back to one call per job if the reply cannot be parsed."""
+        logger.debug("DescriptionMatcher._llm_batch_scores")
+        if len(job_descriptions) == 1:
+            return [self._llm_score(job_descriptions[0], user_description)]
+
+        prompt = self._build_batch_prompt(job_descriptions, user_description)
+        logger.debug(f"LLM batch prompt: {prompt}")
+        try:
+            scores = self._parse_batch_scores(self._generate_text(prompt), len(job_descriptions))
+            logger.debug(f"Generated batch scores: {scores}")
+            return scores
+        except ValueError as e:
+            logger.warning(f"Failed parsing batch scores, falling back to per-job scoring: {str(e)}")
+            return [self._llm_score(job_description, user_description) for job_description in job_descriptions]
+
+    def _generate_text(self, prompt: str) -> str:
+        """Calls the LLM within the rate limit, retrying with exponential backoff on quota errors."""
+        logger.debug("DescriptionMatcher._generate_text")
+        for attempt in range(Constants.LLM_MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            METRICS.count("llm_calls")
+            try:
+                with METRICS.span("llm_call"):
+                    return self.llm.generate_text(prompt)
+            except Exception as e:
+                if attempt >= Constants.LLM_MAX_RETRIES or not self._is_quota_error(e):
+                    raise
+                delay = Constants.LLM_RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(f"LLM quota error, retrying in {delay}s ({attempt + 1}/{Constants.LLM_MAX_RETRIES}): {str(e)}")
+                sleep(delay)
+
+    @staticmethod
+    def _is_quota_error(error: Exception) -> bool:
+        message = f"{type(error).__name__} {error}".lower()
+        return any(marker in message for marker in ("429", "quota", "resourceexhausted", "resource exhausted", "rate limit"))
+
+    def _build_batch_prompt(self, job_descriptions: List[Optional[str]], user_description: str) -> str:
+        logger.debug("DescriptionMatcher._build_batch_prompt")
+        numbered = "\n".join(f"Job {index}: {job_description}" for index, job_description in enumerate(job_descriptions, start=1))
+        return self.BATCH_PROMPT_TEMPLATE.format(user_description=user_description, count=len(job_descriptions), job_descriptions=numbered)
+
+    def _parse_batch_scores(self, text: str, expected: int) -> List[int]:
+        """Parses the JSON list of scores out of the LLM reply."""
+        logger.debug("DescriptionMatcher._parse_batch_scores")
+        match = re.search(r"\[[^\[\]]*\]", text or "")
+        if not match:
+            raise ValueError(f"No score list found in LLM reply: {text}")
+        try:
+            scores = [int(score) for score in json.loads(match.group(0))]
+        except (TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Malformed score list in LLM reply: {text}") from e
+        if len(scores) != expected:
+            raise ValueError(f"Expected {expected} scores but got {len(scores)}: {text}")
+        return scores
+
     def _fuzz_matches(self, job_description: str, user_description: str) -> bool:
         logger.debug("DescriptionMatcher._fuzz_matches")
         similarity_ratio = 0 # fuzz.ratio(job_description, user_description)
         logger.debug(f"Check if similarity_ratio >= self.threshold: {similarity_ratio} >= {self.threshold}")
-        return similarity_ratio >= self.threshold
\ No newline at end of file
+        return similarity_ratio >= self.threshold
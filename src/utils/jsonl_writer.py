@@ -0,0 +1,66 @@
+# src/utils/jsonl_writer.py
+
+import json
+import os
+from dataclasses import asdict
+from time import monotonic
+from typing import Iterable, List
+import src.logger as LOGGER
+from src.constants.constants import Constants
+from src.models.job import Job
+
+
+logger = LOGGER.get(__name__)
+
+class JsonlWriter:
+    """Append-only JSON Lines log of jobs. Every record is flushed when written and the file is
+    fsynced at most every fsync_interval seconds, so a crash loses at most that window."""
+
+    def __init__(self, path: str, fsync_interval: float = Constants.RESULTS_FSYNC_INTERVAL, append: bool = True):
+        logger.debug("JsonlWriter instance created")
+        self.path = path
+        self.fsync_interval = fsync_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+        self._last_fsync = monotonic()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write_many(self, jobs: Iterable[Job]) -> None:
+        logger.debug("JsonlWriter.write_many")
+        self._file.writelines(json.dumps(asdict(job), ensure_ascii=False) + "\n" for job in jobs)
+        self._file.flush()
+        if monotonic() - self._last_fsync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        os.fsync(self._file.fileno())
+        self._last_fsync = monotonic()
+
+    def close(self) -> None:
+        logger.debug("JsonlWriter.close")
+        if not self._file.closed:
+            self._file.flush()
+            self.sync()
+            self._file.close()
+
+    @staticmethod
+    def read(path: str) -> List[Job]:
+        """Loads the jobs of a JSON Lines log, ignoring a last line cut by a crash."""
+        logger.debug("JsonlWriter.read")
+        jobs = []
+        if not os.path.exists(path):
+            return jobs
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    jobs.append(Job(**json.loads(line)))
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.warning(f"Skipping unreadable line of {path}: {str(e)}")
+        return jobs
@@ -0,0 +1,12 @@
+# src/utils/llm_backend.py
+
+from typing import Protocol
+
+
+class LLMBackend(Protocol):
+    """What DescriptionMatcher needs from an LLM client, llm_utils.LLMUtils is the default one.
+    Any object with this method can be injected, e.g. a local stand-in for tests and benchmarks."""
+
+    def generate_text(self, prompt: str) -> str:
+        """Returns the model reply to the prompt, raising on API errors (quota errors mention 429 or quota)."""
+        ...
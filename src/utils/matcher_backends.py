@@ -0,0 +1,40 @@
+# src/utils/matcher_backends.py
+
+from typing import Any, Callable, Dict
+import src.logger as LOGGER
+
+
+logger = LOGGER.get(__name__)
+
+# Matching method -> loader building its backend. Loaders import the backend module themselves,
+# so a method's dependencies are only imported when a matcher first uses that method.
+_LOADERS: Dict[str, Callable[..., Any]] = {}
+
+def register(method: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator registering the backend loader of a matching method. The "llm" backend is an LLMBackend,
+    any other backend scores job descriptions with scores(job_descriptions, user_description) -> List[int]."""
+    def decorator(loader: Callable[..., Any]) -> Callable[..., Any]:
+        _LOADERS[method] = loader
+        return loader
+    return decorator
+
+def is_registered(method: str) -> bool:
+    return method in _LOADERS
+
+def load(method: str, **options) -> Any:
+    """Imports and builds the backend of a matching method, `options` are passed on to its loader."""
+    logger.debug(f"Loading the {method} matcher backend")
+    if method not in _LOADERS:
+        raise ValueError(f"Invalid matching method in config file: {method}")
+    return _LOADERS[method](**options)
+
+
+@register("llm")
+def _llm(api_key: str = None) -> Any:
+    from llm_utils import LLMUtils
+    return LLMUtils(api_key)
+
+@register("vector")
+def _vector() -> Any:
+    from src.utils.vector_matcher import VectorMatcher
+    return VectorMatcher()
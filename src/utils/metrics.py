@@ -0,0 +1,130 @@
+# src/utils/metrics.py
+
+import json
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from math import ceil
+from time import perf_counter
+from typing import ContextManager, Dict, Iterator, List, Optional
+import src.logger as LOGGER
+
+
+logger = LOGGER.get(__name__)
+
+class Metrics:
+    """Timing spans and counters of a run, summarized per stage at the end of it."""
+
+    PREFIX = "jobscraper"
+
+    def __init__(self):
+        logger.debug("Metrics instance created")
+        self.started = perf_counter()
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            with self._lock:
+                self.durations[stage].append(duration)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def summary(self) -> Dict:
+        """p50/p95/total seconds per stage, the counters and the extraction throughput."""
+        with self._lock:
+            durations = {stage: sorted(values) for stage, values in self.durations.items()}
+            counters = dict(self.counters)
+        run_seconds = perf_counter() - self.started
+        return {
+            "run_seconds": round(run_seconds, 3),
+            "jobs_per_second": round(counters.get("jobs_extracted", 0) / run_seconds, 3) if run_seconds else 0.0,
+            "stages": {stage: {"count": len(values),
+                               "total": round(sum(values), 3),
+                               "p50": round(_percentile(values, 50), 3),
+                               "p95": round(_percentile(values, 95), 3)} for stage, values in durations.items()},
+            "counters": counters,
+        }
+
+    def to_prometheus(self, summary: Optional[Dict] = None) -> str:
+        """The summary in the Prometheus text exposition format."""
+        summary = summary or self.summary()
+        name = f"{self.PREFIX}_stage_seconds"
+        lines = [f"# HELP {name} Duration of the run stages.", f"# TYPE {name} summary"]
+        for stage, stats in summary["stages"].items():
+            lines.append(f'{name}{{stage="{stage}",quantile="0.5"}} {stats["p50"]}')
+            lines.append(f'{name}{{stage="{stage}",quantile="0.95"}} {stats["p95"]}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {stats["total"]}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {stats["count"]}')
+        for counter, value in summary["counters"].items():
+            counter_name = f"{self.PREFIX}_{re.sub(r'[^a-zA-Z0-9_]', '_', counter)}_total"
+            lines += [f"# TYPE {counter_name} counter", f"{counter_name} {value}"]
+        for gauge in ["run_seconds", "jobs_per_second"]:
+            lines += [f"# TYPE {self.PREFIX}_{gauge} gauge", f"{self.PREFIX}_{gauge} {summary[gauge]}"]
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str) -> None:
+        """Writes the summary to `path`.json and `path`.prom."""
+        logger.debug("Metrics.export")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        summary = self.summary()
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=4)
+        with open(f"{path}.prom", "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(summary))
+        logger.info(f"Run metrics saved to {path}.json and {path}.prom")
+
+    def log_summary(self) -> None:
+        summary = self.summary()
+        stages = ", ".join(f"{stage} p50 {stats['p50']}s p95 {stats['p95']}s x{stats['count']}" for stage, stats in summary["stages"].items())
+        logger.info(f"Run metrics: {summary['jobs_per_second']} jobs/s over {summary['run_seconds']}s; {stages}; counters {summary['counters']}")
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    return values[max(0, ceil(percentile / 100 * len(values)) - 1)]
+
+
+# The metrics of the current run, None while metrics are disabled so spans cost a single check.
+_current: Optional[Metrics] = None
+_NO_SPAN = nullcontext()
+
+
+def enable() -> Metrics:
+    """Starts collecting metrics for a new run."""
+    global _current
+    _current = Metrics()
+    return _current
+
+
+def disable() -> None:
+    global _current
+    _current = None
+
+
+def current() -> Optional[Metrics]:
+    return _current
+
+
+def span(stage: str) -> ContextManager:
+    """Times the enclosed block as one occurrence of `stage`, a shared no-op when metrics are disabled."""
+    return _current.span(stage) if _current else _NO_SPAN
+
+
+def count(name: str, value: int = 1) -> None:
+    if _current:
+        _current.count(name, value)
@@ -0,0 +1,86 @@
+# src/utils/near_duplicates.py
+
+import hashlib
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+import src.logger as LOGGER
+from src.constants.constants import Constants
+
+
+logger = LOGGER.get(__name__)
+
+FINGERPRINT_BITS = 64
+
+def simhash(text: Optional[str], shingle_size: int = Constants.NEAR_DUPLICATE_SHINGLE_SIZE) -> Optional[int]:
+    """64 bit SimHash of the word shingles of a text, None when the text is too short to fingerprint."""
+    words = re.findall(r"\w+", (text or "").lower())
+    if len(words) < shingle_size:
+        return None
+    hashes = [int.from_bytes(hashlib.blake2b(" ".join(words[start:start + shingle_size]).encode("utf-8"), digest_size=8).digest(), "big")
+              for start in range(len(words) - shingle_size + 1)]
+    half = len(hashes) / 2
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        if sum((value >> bit) & 1 for value in hashes) > half:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+class NearDuplicates:
+    """Groups near-duplicate job descriptions, reposts of the same role under different URLs, into clusters
+    whose fingerprints differ by at most max_distance bits, so only one job of a cluster needs to be scored.
+    Fingerprints are split into max_distance + 1 bands, any two within the distance share at least one band."""
+
+    def __init__(self, max_distance: int = Constants.DEFAULT_NEAR_DUPLICATE_DISTANCE):
+        logger.debug("NearDuplicates instance created")
+        self.max_distance = max_distance
+        self.checked = 0
+        self.skipped = 0
+        self.llm_calls_saved = 0
+        self._fingerprints: List[int] = []
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._scores: Dict[Tuple[int, str], int] = {}
+        self._lock = threading.Lock()
+        bands = max_distance + 1
+        width = FINGERPRINT_BITS // bands
+        self._bands = [(band * width, FINGERPRINT_BITS if band == bands - 1 else (band + 1) * width) for band in range(bands)]
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        return [(start, (fingerprint >> start) & ((1 << (end - start)) - 1)) for start, end in self._bands]
+
+    def cluster(self, text: Optional[str]) -> Optional[int]:
+        """Returns the cluster of a near-duplicate of the text seen before, or starts a new one.
+        Texts too short to fingerprint get no cluster."""
+        fingerprint = simhash(text)
+        if fingerprint is None:
+            return None
+        keys = self._band_keys(fingerprint)
+        with self._lock:
+            for key in keys:
+                for cluster in self._buckets.get(key, []):
+                    if (self._fingerprints[cluster] ^ fingerprint).bit_count() <= self.max_distance:
+                        return cluster
+            cluster = len(self._fingerprints)
+            self._fingerprints.append(fingerprint)
+            for key in keys:
+                self._buckets.setdefault(key, []).append(cluster)
+        return cluster
+
+    def score(self, cluster: int, user_description: str) -> Optional[int]:
+        with self._lock:
+            return self._scores.get((cluster, user_description))
+
+    def set_score(self, cluster: int, user_description: str, score: int) -> None:
+        with self._lock:
+            self._scores[(cluster, user_description)] = score
+
+    def record(self, checked: int, skipped: int, llm_calls_saved: int) -> None:
+        with self._lock:
+            self.checked += checked
+            self.skipped += skipped
+            self.llm_calls_saved += llm_calls_saved
+
+    def log_stats(self) -> None:
+        logger.info(f"Near-duplicate jobs: {self.skipped} of {self.checked} scored jobs took the score of a near-duplicate "
+                    f"in {len(self._fingerprints)} clusters, {self.llm_calls_saved} LLM calls saved")
@@ -0,0 +1,137 @@
+# src/utils/pacer.py
+
+import asyncio
+import random
+import threading
+from collections import Counter
+from time import monotonic, sleep
+from typing import Any, Dict, List, Optional
+import src.logger as LOGGER
+from src.constants.constants import Constants
+
+
+logger = LOGGER.get(__name__)
+
+class Pacer:
+    """Thread-safe token bucket pacing the browser navigations and clicks, with jitter.
+    The rate speeds up while navigations are healthy, and is halved with an exponential backoff
+    on throttling (HTTP 429, challenge pages, empty results pages)."""
+
+    def __init__(self,
+                 rate: float = Constants.DEFAULT_PACING_RATE,
+                 max_rate: float = Constants.DEFAULT_PACING_MAX_RATE,
+                 burst: float = Constants.PACING_BURST,
+                 jitter: float = Constants.PACING_JITTER,
+                 challenge_urls: Optional[List[str]] = None):
+        logger.debug("Pacer instance created")
+        self.rate = rate
+        self.max_rate = max(rate, max_rate)
+        self.min_rate = min(rate, Constants.PACING_MIN_RATE)
+        self.burst = burst
+        self.jitter = jitter
+        self.challenge_urls = challenge_urls or []
+        self.failures = 0 # consecutive throttlings, the backoff doubles with each
+        self.navigations = 0
+        self.clicks = 0
+        self.waited = 0.0
+        self.peak_rate = rate
+        self.throttles: Counter = Counter()
+        self._tokens = burst
+        self._last_refill = monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, cost: float = 1.0) -> None:
+        """Blocks until `cost` tokens are available and any backoff is over, plus a random jitter."""
+        delay = self._reserve(cost)
+        if delay > 0:
+            logger.debug(f"Pacer.acquire waiting {delay:.2f}s (rate {self.rate:.2f}/s)")
+            sleep(delay)
+
+    async def acquire_async(self, cost: float = 1.0) -> None:
+        """acquire for the asyncio engine, waits without blocking the event loop."""
+        delay = self._reserve(cost)
+        if delay > 0:
+            logger.debug(f"Pacer.acquire_async waiting {delay:.2f}s (rate {self.rate:.2f}/s)")
+            await asyncio.sleep(delay)
+
+    def _reserve(self, cost: float) -> float:
+        """Takes `cost` tokens and returns how long to wait before using them."""
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            delay = max(0.0, (cost - self._tokens) / self.rate, self._blocked_until - now)
+            self._tokens -= cost
+            delay += random.uniform(0, self.jitter * cost / self.rate)
+            self.waited += delay
+        return delay
+
+    def success(self) -> None:
+        """A healthy navigation, speeds the rate up."""
+        with self._lock:
+            self.failures = 0
+            self.rate = min(self.max_rate, self.rate * Constants.PACING_SPEEDUP)
+            self.peak_rate = max(self.peak_rate, self.rate)
+
+    def throttled(self, reason: str) -> None:
+        """Halves the rate and blocks the next actions for an exponentially growing backoff."""
+        with self._lock:
+            self.failures += 1
+            self.throttles[reason] += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            backoff = min(Constants.PACING_MAX_BACKOFF, Constants.PACING_BACKOFF * 2 ** (self.failures - 1))
+            self._blocked_until = monotonic() + backoff
+            self._tokens = 0.0
+        logger.warning(f"Throttled ({reason}), backing off {backoff:.0f}s, rate now {self.rate:.2f}/s")
+
+    def goto(self, page: Any, url: str, **kwargs) -> Any:
+        """Paced page.goto, the response tells whether the site is throttling."""
+        self.acquire()
+        response = page.goto(url, **kwargs)
+        self._navigated(response, page)
+        return response
+
+    async def goto_async(self, page: Any, url: str, **kwargs) -> Any:
+        """goto for playwright.async_api pages."""
+        await self.acquire_async()
+        response = await page.goto(url, **kwargs)
+        self._navigated(response, page)
+        return response
+
+    def _navigated(self, response: Any, page: Any) -> None:
+        with self._lock:
+            self.navigations += 1
+        reason = self._throttle_reason(response, response.url if response else page.url)
+        if reason:
+            self.throttled(reason)
+        else:
+            self.success()
+
+    def click(self, element: Any) -> None:
+        self.acquire(Constants.PACING_CLICK_COST)
+        element.click()
+        with self._lock:
+            self.clicks += 1
+
+    async def click_async(self, element: Any) -> None:
+        await self.acquire_async(Constants.PACING_CLICK_COST)
+        await element.click()
+        with self._lock:
+            self.clicks += 1
+
+    def _throttle_reason(self, response: Any, url: str) -> Optional[str]:
+        if response is not None and response.status == 429:
+            return "HTTP 429"
+        if isinstance(url, str) and any(marker in url for marker in self.challenge_urls):
+            return "challenge page"
+        return None
+
+    def stats(self) -> Dict:
+        return {"rate": round(self.rate, 3), "peak_rate": round(self.peak_rate, 3), "navigations": self.navigations,
+                "clicks": self.clicks, "waited_seconds": round(self.waited, 1), "throttles": dict(self.throttles)}
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logger.info(f"Pacing: {stats['navigations']} navigations and {stats['clicks']} clicks, {stats['waited_seconds']}s waited, "
+                    f"rate {stats['rate']}/s (peak {stats['peak_rate']}/s), throttled {stats['throttles'] or 'never'}")
@@ -0,0 +1,30 @@
+# src/utils/rate_limiter.py
+
+import threading
+from time import monotonic, sleep
+import src.logger as LOGGER
+
+
+logger = LOGGER.get(__name__)
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls evenly to stay under a requests-per-minute budget."""
+
+    def __init__(self, requests_per_minute: int = 0):
+        logger.debug("RateLimiter instance created")
+        self.interval = 60.0 / requests_per_minute if requests_per_minute and requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until the caller is allowed to issue the next request."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            logger.debug(f"RateLimiter.acquire waiting {delay:.2f}s")
+            sleep(delay)
@@ -0,0 +1,76 @@
+# src/utils/resource_blocker.py
+
+import fnmatch
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+import src.logger as LOGGER
+from src.constants.constants import Constants
+
+
+logger = LOGGER.get(__name__)
+
+class ResourceBlocker:
+    """Aborts the requests of a browser context the scraper never uses (images, fonts, media, ads, tracking)
+    and keeps per-run statistics of what was blocked and what was transferred."""
+
+    def __init__(self,
+                 resource_types: Optional[List[str]] = None,
+                 url_patterns: Optional[List[str]] = None):
+        logger.debug("ResourceBlocker instance created")
+        self.resource_types = set(Constants.DEFAULT_BLOCKED_RESOURCE_TYPES if resource_types is None else resource_types)
+        self.url_patterns = list(Constants.DEFAULT_BLOCKED_URL_PATTERNS if url_patterns is None else url_patterns)
+        self._url_regex = re.compile("|".join(fnmatch.translate(pattern) for pattern in self.url_patterns)) if self.url_patterns else None
+        self.blocked: Counter = Counter()
+        self.allowed_requests = 0
+        self.bytes_transferred = 0
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        return resource_type in self.resource_types or bool(self._url_regex and self._url_regex.match(url))
+
+    def attach(self, context) -> None:
+        """Routes every request of a playwright.sync_api BrowserContext through the blocker."""
+        logger.debug("ResourceBlocker.attach")
+        context.route("**/*", self._handle)
+        context.on("response", self._on_response)
+
+    async def attach_async(self, context) -> None:
+        """Routes every request of a playwright.async_api BrowserContext through the blocker."""
+        logger.debug("ResourceBlocker.attach_async")
+        await context.route("**/*", self._handle_async)
+        context.on("response", self._on_response)
+
+    def _handle(self, route) -> None:
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked[request.resource_type] += 1
+            route.abort()
+        else:
+            self.allowed_requests += 1
+            route.continue_()
+
+    async def _handle_async(self, route) -> None:
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked[request.resource_type] += 1
+            await route.abort()
+        else:
+            self.allowed_requests += 1
+            await route.continue_()
+
+    def _on_response(self, response) -> None:
+        # Headers are already on the client side, reading them costs no browser round-trip.
+        self.bytes_transferred += int(response.headers.get("content-length") or 0)
+
+    def stats(self) -> Dict:
+        return {
+            "blocked_requests": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+            "allowed_requests": self.allowed_requests,
+            "bytes_transferred": self.bytes_transferred,
+        }
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logger.info(f"Resource blocking: {stats['blocked_requests']} requests blocked {stats['blocked_by_type']}, "
+                    f"{stats['allowed_requests']} requests allowed, {stats['bytes_transferred']} bytes transferred")
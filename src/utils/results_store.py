@@ -0,0 +1,139 @@
+# src/utils/results_store.py
+"""Indexed SQLite store of the jobs of every run, replacing the per-day JSON dumps.
+
+    python -m src.utils.results_store data/results/results.sqlite --company acme --min-score 80 --since 30
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict
+from time import time
+from typing import Dict, Iterable, List, Optional
+import src.logger as LOGGER
+from src.constants.constants import Constants
+from src.models.job import Job
+from src.utils.seen_jobs import SeenJobs
+
+
+logger = LOGGER.get(__name__)
+
+class ResultsStore:
+    """Jobs keyed by job id, indexed on company and title, posted date, score and the search queries that found them."""
+
+    SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, title TEXT, company TEXT, location TEXT, url TEXT, "
+        "score INTEGER, posted_at REAL, found_at REAL NOT NULL, updated_at REAL NOT NULL, data TEXT NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS job_queries (job_id TEXT NOT NULL, keywords TEXT NOT NULL DEFAULT '', location TEXT NOT NULL DEFAULT '', "
+        "epoch_ago INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (job_id, keywords, location, epoch_ago))",
+        "CREATE INDEX IF NOT EXISTS jobs_company_title ON jobs (company COLLATE NOCASE, title COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS jobs_posted_at ON jobs (posted_at)",
+        "CREATE INDEX IF NOT EXISTS jobs_found_at ON jobs (found_at)",
+        "CREATE INDEX IF NOT EXISTS jobs_score ON jobs (score)",
+        "CREATE INDEX IF NOT EXISTS job_queries_keywords ON job_queries (keywords COLLATE NOCASE, location COLLATE NOCASE)",
+    ]
+
+    def __init__(self, path: str = Constants.DEFAULT_RESULTS_DB_PATH):
+        logger.debug("ResultsStore instance created")
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            for statement in self.SCHEMA:
+                self._connection.execute(statement)
+
+    def add_many(self, jobs: Iterable[Job], query: Optional[Dict] = None) -> None:
+        """Adds or refreshes jobs in a single transaction. A job keeps the date it was first found and its last known score,
+        and is linked to every query in job.queries, or to `query` when the job has none."""
+        logger.debug("ResultsStore.add_many")
+        now = time()
+        job_rows, query_rows = [], []
+        for job in jobs:
+            job_id = SeenJobs.job_id(job)
+            job_rows.append((job_id, job.title, job.company, job.location, job.url, job.score, job.posted_at, now, now,
+                             json.dumps(asdict(job), ensure_ascii=False)))
+            for job_query in job.queries or ([query] if query else []):
+                query_rows.append((job_id, job_query.get("keywords") or "", job_query.get("location") or "", int(job_query.get("epoch_ago") or 0)))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO jobs (job_id, title, company, location, url, score, posted_at, found_at, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(job_id) DO UPDATE SET title = excluded.title, "
+                "company = excluded.company, location = excluded.location, url = excluded.url, "
+                "score = COALESCE(excluded.score, jobs.score), posted_at = COALESCE(excluded.posted_at, jobs.posted_at), "
+                "updated_at = excluded.updated_at, data = excluded.data", job_rows)
+            self._connection.executemany("INSERT OR IGNORE INTO job_queries (job_id, keywords, location, epoch_ago) VALUES (?, ?, ?, ?)", query_rows)
+        logger.info(f"Saved {len(job_rows)} jobs to {self.path}")
+
+    def query(self,
+              company: Optional[str] = None,
+              title: Optional[str] = None,
+              min_score: Optional[int] = None,
+              since: Optional[float] = None,
+              keywords: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Job]:
+        """Jobs matching every given condition, best score first. `company` is matched exactly and `title` as a prefix,
+        both case insensitive, `since` is an epoch time compared to the posted date, or the found date when unknown."""
+        logger.debug("ResultsStore.query")
+        conditions, parameters = [], []
+        if company:
+            conditions.append("company = ? COLLATE NOCASE")
+            parameters.append(company)
+        if title:
+            conditions.append("title LIKE ? ESCAPE '\\'")
+            parameters.append(title.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+        if min_score is not None:
+            conditions.append("score >= ?")
+            parameters.append(min_score)
+        if since is not None:
+            conditions.append("COALESCE(posted_at, found_at) >= ?")
+            parameters.append(since)
+        if keywords:
+            conditions.append("job_id IN (SELECT job_id FROM job_queries WHERE keywords = ? COLLATE NOCASE)")
+            parameters.append(keywords)
+        sql = "SELECT data FROM jobs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY score DESC, found_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+        return [Job(**json.loads(row[0])) for row in rows]
+
+    def close(self) -> None:
+        logger.debug("ResultsStore.close")
+        with self._lock:
+            self._connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?", default=Constants.DEFAULT_RESULTS_DB_PATH)
+    parser.add_argument("--company", help="exact company name, case insensitive")
+    parser.add_argument("--title", help="title prefix, case insensitive")
+    parser.add_argument("--min-score", type=int)
+    parser.add_argument("--since", type=float, help="only jobs posted (or found) in the last SINCE days")
+    parser.add_argument("--keywords", help="only jobs found by a search with these keywords")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="print full JSON records instead of a summary line per job")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+    LOGGER.setup(args.log_level)
+
+    store = ResultsStore(args.path)
+    try:
+        jobs = store.query(args.company, args.title, args.min_score, time() - args.since * 86400 if args.since else None, args.keywords, args.limit)
+    finally:
+        store.close()
+    for job in jobs:
+        print(json.dumps(asdict(job), ensure_ascii=False) if args.json else f"{job.score if job.score is not None else '-':>4}  {job}  {job.url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# src/utils/score_cache.py
+
+import os
+import sqlite3
+import threading
+from time import time
+from typing import Dict, Iterable, Tuple
+import src.logger as LOGGER
+from src.constants.constants import Constants
+
+
+logger = LOGGER.get(__name__)
+
+class ScoreCache:
+    """Persistent SQLite cache of raw LLM match scores with TTL and size based eviction."""
+
+    def __init__(self,
+                 path: str = Constants.DEFAULT_SCORE_CACHE_PATH,
+                 ttl: int = Constants.DEFAULT_SCORE_CACHE_TTL,
+                 max_entries: int = Constants.DEFAULT_SCORE_CACHE_MAX_ENTRIES):
+        logger.debug("ScoreCache instance created")
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, score INTEGER NOT NULL, created_at REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS scores_created_at ON scores (created_at)")
+        self._connection.commit()
+        self.evict()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, int]:
+        """Returns the cached scores of the given keys that exist and have not expired."""
+        logger.debug("ScoreCache.get_many")
+        keys = list(keys)
+        found = {}
+        min_created_at = time() - self.ttl if self.ttl else 0
+        with self._lock:
+            for key in keys:
+                row = self._connection.execute("SELECT score FROM scores WHERE key = ? AND created_at >= ?", (key, min_created_at)).fetchone()
+                if row is not None:
+                    found[key] = row[0]
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, int]]) -> None:
+        """Stores raw scores and evicts entries over the size limit."""
+        logger.debug("ScoreCache.put_many")
+        now = time()
+        with self._lock:
+            self._connection.executemany("INSERT OR REPLACE INTO scores (key, score, created_at) VALUES (?, ?, ?)", [(key, score, now) for key, score in items])
+            self._connection.commit()
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes expired entries, then the oldest entries above max_entries."""
+        logger.debug("ScoreCache.evict")
+        with self._lock:
+            if self.ttl:
+                self._connection.execute("DELETE FROM scores WHERE created_at < ?", (time() - self.ttl,))
+            if self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM scores WHERE key IN (SELECT key FROM scores ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,))
+            self._connection.commit()
+
+    def log_stats(self) -> None:
+        logger.info(f"Score cache: {self.hits} hits, {self.misses} misses")
+
+    def close(self) -> None:
+        logger.debug("ScoreCache.close")
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,91 @@
+# src/utils/seen_jobs.py
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import urllib.parse
+from time import time
+from typing import Iterable, List, Optional, Set
+import src.logger as LOGGER
+from src.constants.constants import Constants
+from src.models.job import Job
+
+
+logger = LOGGER.get(__name__)
+
+class SeenJobs:
+    """Persistent SQLite index of the jobs handled by previous runs, with their content hash and last score."""
+
+    JOB_ID_PATTERN = re.compile(r"/(\d+)/?$")
+
+    def __init__(self, path: str = Constants.DEFAULT_SEEN_JOBS_PATH):
+        logger.debug("SeenJobs instance created")
+        self.path = path
+        self.skipped = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_jobs (job_id TEXT PRIMARY KEY, url TEXT NOT NULL, content_hash TEXT NOT NULL, "
+            "score INTEGER, first_seen REAL NOT NULL, last_seen REAL NOT NULL)")
+        self._connection.commit()
+
+    @classmethod
+    def job_id(cls, job: Job) -> str:
+        """The site job id when it is known, otherwise the URL path without tracking parameters."""
+        job_id = (job.raw_data or {}).get("job_id")
+        if job_id:
+            return str(job_id)
+        return cls.url_job_id(job.url)
+
+    @classmethod
+    def url_job_id(cls, url: str) -> str:
+        """The job id of a job view URL, otherwise the URL path without tracking parameters."""
+        path = urllib.parse.urlsplit(url).path
+        match = cls.JOB_ID_PATTERN.search(path)
+        return match.group(1) if match else path.rstrip("/")
+
+    @staticmethod
+    def content_hash(job: Job) -> str:
+        payload = "\0".join(" ".join((value or "").split()) for value in [job.title, job.company, job.location, job.description])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def known(self, job_ids: Iterable[Optional[str]]) -> Set[str]:
+        """Returns the given job ids that were already recorded."""
+        logger.debug("SeenJobs.known")
+        job_ids = [job_id for job_id in dict.fromkeys(job_ids) if job_id]
+        found = set()
+        with self._lock:
+            for start in range(0, len(job_ids), 500):
+                chunk = job_ids[start:start + 500]
+                rows = self._connection.execute(
+                    f"SELECT job_id FROM seen_jobs WHERE job_id IN ({', '.join('?' * len(chunk))})", chunk).fetchall()
+                found.update(row[0] for row in rows)
+            self.skipped += len(found)
+        return found
+
+    def record(self, jobs: List[Job]) -> None:
+        """Adds or refreshes jobs in the index, keeping the score of the previous run when the job has none."""
+        logger.debug("SeenJobs.record")
+        now = time()
+        rows = [(self.job_id(job), job.url, self.content_hash(job), job.score, now, now) for job in jobs]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT INTO seen_jobs (job_id, url, content_hash, score, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET url = excluded.url, content_hash = excluded.content_hash, "
+                "score = COALESCE(excluded.score, seen_jobs.score), last_seen = excluded.last_seen", rows)
+            self._connection.commit()
+            self.recorded += len(rows)
+
+    def log_stats(self) -> None:
+        logger.info(f"Seen jobs index: {self.skipped} known jobs skipped, {self.recorded} jobs recorded")
+
+    def close(self) -> None:
+        logger.debug("SeenJobs.close")
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,86 @@
+# src/utils/snapshot_store.py
+
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+from time import time
+from typing import List, Tuple
+import src.logger as LOGGER
+
+
+logger = LOGGER.get(__name__)
+
+class SnapshotStore:
+    """Content-addressed store of the gzip compressed detail pane HTML of every extracted job.
+    Identical snapshots are kept once, an SQLite index maps every job id to the snapshot it was last extracted from."""
+
+    def __init__(self, path: str):
+        logger.debug("SnapshotStore instance created")
+        self.path = path
+        self.stored = 0
+        self.deduplicated = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(path, "objects"), exist_ok=True)
+        self._connection = sqlite3.connect(os.path.join(path, "index.sqlite"), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots (job_id TEXT PRIMARY KEY, url TEXT, digest TEXT NOT NULL, captured_at REAL NOT NULL)")
+        self._connection.commit()
+
+    @staticmethod
+    def object_path_in(path: str, digest: str) -> str:
+        return os.path.join(path, "objects", digest[:2], f"{digest}.html.gz")
+
+    def object_path(self, digest: str) -> str:
+        return self.object_path_in(self.path, digest)
+
+    def put(self, job_id: str, url: str, html: str) -> str:
+        """Stores the snapshot unless an identical one is stored already, and returns its digest."""
+        logger.debug("SnapshotStore.put")
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self.object_path(digest)
+        with self._lock:
+            if os.path.exists(object_path):
+                self.deduplicated += 1
+            else:
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                compressed = gzip.compress(data)
+                tmp_path = f"{object_path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(compressed)
+                os.replace(tmp_path, object_path)
+                self.stored += 1
+                self.raw_bytes += len(data)
+                self.compressed_bytes += len(compressed)
+            self._connection.execute(
+                "INSERT INTO snapshots (job_id, url, digest, captured_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET url = excluded.url, digest = excluded.digest, captured_at = excluded.captured_at",
+                (job_id, url, digest, time()))
+            self._connection.commit()
+        return digest
+
+    @staticmethod
+    def read(object_path: str) -> str:
+        with open(object_path, "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def get(self, digest: str) -> str:
+        return self.read(self.object_path(digest))
+
+    def entries(self) -> List[Tuple[str, str, str]]:
+        """(job id, url, digest) of every indexed job."""
+        with self._lock:
+            return self._connection.execute("SELECT job_id, url, digest FROM snapshots ORDER BY captured_at, rowid").fetchall()
+
+    def log_stats(self) -> None:
+        ratio = f", compressed to {self.compressed_bytes / self.raw_bytes:.0%}" if self.raw_bytes else ""
+        logger.info(f"Snapshot store: {self.stored} snapshots stored, {self.deduplicated} duplicates skipped{ratio}")
+
+    def close(self) -> None:
+        logger.debug("SnapshotStore.close")
+        with self._lock:
+            self._connection.close()
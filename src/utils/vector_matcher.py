@@ -0,0 +1,67 @@
+# src/utils/vector_matcher.py
+
+import re
+import zlib
+import numpy as np
+from functools import lru_cache
+from itertools import chain
+from typing import List, Optional, Tuple
+import src.logger as LOGGER
+from src.constants.constants import Constants
+
+
+logger = LOGGER.get(__name__)
+
+@lru_cache(maxsize=Constants.VECTOR_FEATURE_CACHE_SIZE)
+def _token_hash(token: str) -> int:
+    """crc32 of a token, the most recently used tokens are kept so common words are hashed once."""
+    return zlib.crc32(token.encode("utf-8"))
+
+
+class VectorMatcher:
+    """Scores job descriptions locally with hashed word n-gram TF-IDF vectors and cosine similarity."""
+
+    TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+    BIGRAM_MULTIPLIER = 1000003
+
+    def __init__(self, n_features: int = Constants.DEFAULT_VECTOR_FEATURES):
+        logger.debug("VectorMatcher instance created")
+        self.n_features = n_features
+
+    def scores(self, job_descriptions: List[Optional[str]], user_description: str) -> List[int]:
+        """Returns the 0-100 cosine similarity of every job description to the user description."""
+        logger.debug("VectorMatcher.scores")
+        if not job_descriptions:
+            return []
+
+        documents = [user_description] + list(job_descriptions)
+        doc_ids, indices = self._features(documents)
+
+        # Term frequencies of every (document, feature) pair, as a sparse COO matrix.
+        keys, counts = np.unique(doc_ids * self.n_features + indices, return_counts=True)
+        rows, cols = np.divmod(keys, self.n_features)
+        document_frequency = np.bincount(cols, minlength=self.n_features)
+        idf = np.log((1 + len(documents)) / (1 + document_frequency[cols])) + 1
+        weights = (1 + np.log(counts)) * idf
+
+        norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=len(documents)))
+        user_vector = np.zeros(self.n_features)
+        user_vector[cols[rows == 0]] = weights[rows == 0]
+        dots = np.bincount(rows, weights=weights * user_vector[cols], minlength=len(documents))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarity = np.where(norms > 0, dots / (norms * norms[0]), 0.0)
+        scores = np.rint(np.nan_to_num(similarity[1:]) * 100).astype(int).tolist()
+        logger.debug(f"Vector scores: {scores}")
+        return scores
+
+    def _features(self, documents: List[Optional[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Hashes the unigrams and bigrams of all documents, returning parallel (document id, feature index) arrays."""
+        tokens = [self.TOKEN_PATTERN.findall((document or "").lower()) for document in documents]
+        lengths = [len(document_tokens) for document_tokens in tokens]
+        doc_ids = np.repeat(np.arange(len(documents)), lengths)
+        unigrams = np.fromiter(map(_token_hash, chain.from_iterable(tokens)), dtype=np.int64, count=len(doc_ids)) % self.n_features
+
+        same_document = doc_ids[1:] == doc_ids[:-1]
+        bigrams = (unigrams[:-1][same_document] * self.BIGRAM_MULTIPLIER + unigrams[1:][same_document]) % self.n_features
+        return np.concatenate([doc_ids, doc_ids[1:][same_document]]), np.concatenate([unigrams, bigrams])
@@ -23,7 +23,7 @@ def config() -> configparser.ConfigParser:
 @pytest.fixture(scope="session")
 def logger(config: configparser.ConfigParser) -> logging.Logger:
     """Provides a configured logger instance."""
-    LOGGER.set_output_path(config.get("general", "log_file_path"))
+    LOGGER.setup(path=config.get("general", "log_file_path"))
     return LOGGER.get(__name__)
 
 @pytest.fixture(scope="session")
@@ -0,0 +1 @@
+# tests\fixtures\__init__.py
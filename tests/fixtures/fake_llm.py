@@ -0,0 +1,60 @@
+# tests/fixtures/fake_llm.py
+
+import random
+import re
+import threading
+import time
+from typing import List
+
+SINGLE_PROMPT = re.compile(r"^Given the current job description: (.*), and the desired job description: (.*), rate from 0 to 100", re.DOTALL)
+BATCH_USER_DESCRIPTION = re.compile(r"^Given the desired job description: (.*?), rate from 0 to 100", re.DOTALL)
+BATCH_JOB = re.compile(r"^Job \d+: (.*)$", re.MULTILINE)
+WORD = re.compile(r"[a-z0-9]+")
+
+
+class FakeLLM:
+    """Deterministic local stand-in for the LLM behind DescriptionMatcher, implementing LLMBackend.
+    Scores are the word overlap of the job and user descriptions, replies arrive after `latency` seconds,
+    and a seeded random share of the calls fails with a quota error or returns a malformed reply."""
+
+    QUOTA_ERROR = "429 Resource has been exhausted (e.g. check quota)."
+    MALFORMED_REPLY = "I am unable to rate these job descriptions."
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, malformed_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.calls = 0
+        self.errors = 0
+        self.malformed = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate_text(self, prompt: str) -> str:
+        with self._lock:
+            self.calls += 1
+            roll = self._random.random()
+        time.sleep(self.latency)
+        if roll < self.error_rate:
+            with self._lock:
+                self.errors += 1
+            raise RuntimeError(self.QUOTA_ERROR)
+        if roll < self.error_rate + self.malformed_rate:
+            with self._lock:
+                self.malformed += 1
+            return self.MALFORMED_REPLY
+
+        single = SINGLE_PROMPT.match(prompt)
+        if single:
+            return str(self.score(single.group(1), single.group(2)))
+        user_description = BATCH_USER_DESCRIPTION.match(prompt).group(1)
+        scores: List[int] = [self.score(job_description, user_description) for job_description in BATCH_JOB.findall(prompt)]
+        return f"{scores}"
+
+    @staticmethod
+    def score(job_description: str, user_description: str) -> int:
+        """Share of the user description words found in the job description, 0 to 100."""
+        user_words = set(WORD.findall(user_description.lower()))
+        if not user_words:
+            return 0
+        return round(100 * len(user_words & set(WORD.findall(job_description.lower()))) / len(user_words))
@@ -0,0 +1,137 @@
+# tests/fixtures/job_board.py
+
+import html
+import random
+import re
+import time
+from typing import Dict, List, Optional
+
+from src.constants.linkedin import LinkedInConstants
+from tests.fixtures.server import FixtureServer
+
+WORDS = ("python automation testing infrastructure pipelines cloud kubernetes selenium playwright api backend "
+         "frontend data platform reliability monitoring team product agile design review deploy scale security").split()
+TITLES = ["Automation Engineer", "QA Engineer", "Software Engineer", "DevOps Engineer", "Data Engineer", "SDET"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+LOCATIONS = ["Tel Aviv, Israel", "London, United Kingdom", "Berlin, Germany", "Remote"]
+
+# Renders the clicked card in the detail pane the way the site does: the pane is emptied at once
+# and filled when the detail request returns, so readers must wait for it.
+CARD_CLICK_SCRIPT = """
+document.querySelector(".jobs-search-results-list").addEventListener("click", async (event) => {
+    const card = event.target.closest("li[data-occludable-job-id]");
+    if (!card) return;
+    event.preventDefault();
+    const pane = document.querySelector(".jobs-details");
+    pane.innerHTML = "";
+    const response = await fetch("/jobs/detail/" + card.getAttribute("data-occludable-job-id"));
+    pane.innerHTML = await response.text();
+});
+"""
+
+
+class JobBoard:
+    """Synthetic job board serving LinkedIn-shaped search and job pages, matching LinkedInConstants.Locators,
+    as FixtureServer routes. Jobs are generated from a seed, so every run sees the same board."""
+
+    def __init__(self,
+                 total_jobs: int = 100,
+                 page_size: int = LinkedInConstants.NUM_OF_JOBS_IN_PAGE,
+                 latency: float = 0.0,
+                 detail_latency: float = 0.0,
+                 missing_rate: float = 0.0,
+                 easy_apply_rate: float = 0.5,
+                 seed: int = 0):
+        self.page_size = page_size
+        self.latency = latency
+        self.detail_latency = detail_latency
+        self.jobs = self._generate(total_jobs, missing_rate, easy_apply_rate, random.Random(seed))
+        self._jobs_by_id = {job["job_id"]: job for job in self.jobs}
+        self.base_url = ""
+
+    @staticmethod
+    def _generate(total_jobs: int, missing_rate: float, easy_apply_rate: float, rng: random.Random) -> List[Dict]:
+        jobs = []
+        for index in range(total_jobs):
+            job = {
+                "job_id": str(4000000000 + index),
+                "title": rng.choice(TITLES),
+                "company": rng.choice(COMPANIES),
+                "location": rng.choice(LOCATIONS),
+                "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(80, 300))),
+                "easy_apply": rng.random() < easy_apply_rate,
+            }
+            if rng.random() < missing_rate:
+                job[rng.choice(["company", "location"])] = None
+            jobs.append(job)
+        return jobs
+
+    def server(self) -> FixtureServer:
+        """A FixtureServer serving this board, start it with `with`."""
+        server = FixtureServer(self.routes())
+        self.base_url = server.url
+        return server
+
+    def constants(self) -> type:
+        """LinkedInConstants pointing at the server of this board."""
+        class JobBoardConstants(LinkedInConstants):
+            JOBS_SEARCH_URL = f"{self.base_url}/jobs/search/"
+            JOB_VIEW_URL = f"{self.base_url}/jobs/view/{{job_id}}/"
+            NUM_OF_JOBS_IN_PAGE = self.page_size
+        return JobBoardConstants
+
+    def routes(self) -> Dict:
+        return {
+            "/jobs/search": self._search_page,
+            "/jobs/detail/": self._detail_fragment,
+            "/jobs/view/": self._job_page,
+        }
+
+    @property
+    def valid_jobs(self) -> List[Dict]:
+        return [job for job in self.jobs if job["company"] and job["location"]]
+
+    def _search_page(self, path: str, query: Dict[str, str]) -> tuple:
+        time.sleep(self.latency)
+        start = int(query.get("start", 0))
+        cards = "".join(self._card(job) for job in self.jobs[start:start + self.page_size])
+        body = f"""<html><body><main id="main">
+<ul class="jobs-search-results-list">{cards}</ul>
+<div class="jobs-details"></div>
+</main><script>{CARD_CLICK_SCRIPT}</script></body></html>"""
+        return 200, "text/html", body.encode("utf-8")
+
+    def _detail_fragment(self, path: str, query: Dict[str, str]) -> tuple:
+        time.sleep(self.detail_latency)
+        job = self._job(path)
+        if job is None:
+            return 404, "text/plain", b"Not Found"
+        return 200, "text/html", self._details(job).encode("utf-8")
+
+    def _job_page(self, path: str, query: Dict[str, str]) -> tuple:
+        time.sleep(self.latency)
+        job = self._job(path)
+        if job is None:
+            return 404, "text/plain", b"Not Found"
+        return 200, "text/html", f"<html><body><main id='main'>{self._details(job)}</main></body></html>".encode("utf-8")
+
+    def _job(self, path: str) -> Optional[Dict]:
+        match = re.search(r"/(\d+)/?$", path)
+        return self._jobs_by_id.get(match.group(1)) if match else None
+
+    def _card(self, job: Dict) -> str:
+        field = lambda css_class, value: f'<div class="{css_class}">{html.escape(value)}</div>' if value else ""
+        easy_apply = '<li class="job-card-container__footer-item">Easy Apply</li>' if job["easy_apply"] else ""
+        return f"""<li class="jobs-search-results__list-item occludable-update" data-occludable-job-id="{job['job_id']}">
+<a class="job-card-list__title" href="{self.base_url}/jobs/view/{job['job_id']}/">{html.escape(job['title'])}</a>
+{field("artdeco-entity-lockup__subtitle", job["company"])}{field("artdeco-entity-lockup__caption", job["location"])}
+<ul>{easy_apply}</ul></li>"""
+
+    def _details(self, job: Dict) -> str:
+        field = lambda css_class, value: f'<div class="{css_class}">{html.escape(value)}</div>' if value else ""
+        button = "Easy Apply" if job["easy_apply"] else "Apply"
+        return f"""<a class="ember-view" href="{self.base_url}/jobs/view/{job['job_id']}/">{html.escape(job['title'])}</a>
+{field("job-details-jobs-unified-top-card__company-name", job["company"])}
+{field("job-details-jobs-unified-top-card__primary-description-container", job["location"])}
+<button><span>{button}</span></button>
+<div id="job-details">{html.escape(job['description'])}</div>"""
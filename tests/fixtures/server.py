@@ -0,0 +1,62 @@
+# tests/fixtures/server.py
+
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+
+# A route handler receives the request path and the parsed query string and returns (status, content type, body).
+Route = Callable[[str, Dict[str, str]], Tuple[int, str, bytes]]
+
+
+class FixtureServer:
+    """Local HTTP server standing in for a remote site, routes are matched by path prefix."""
+
+    def __init__(self, routes: Dict[str, Route], host: str = "127.0.0.1", port: int = 0):
+        self.routes = routes
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urllib.parse.urlsplit(self.path)
+                query = dict(urllib.parse.parse_qsl(parsed.query))
+                for prefix in sorted(server.routes, key=len, reverse=True):
+                    if parsed.path.startswith(prefix):
+                        status, content_type, body = server.routes[prefix](parsed.path, query)
+                        break
+                else:
+                    status, content_type, body = 404, "text/plain", b"Not Found"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,108 @@
+# tests/test_async_facade.py
+
+import asyncio
+import threading
+import time
+import pytest
+from playwright.async_api import Page
+
+import src.logger as LOGGER
+from src.async_facade import AsyncFacade
+from src.constants.linkedin import LinkedInConstants
+from src.models.job import Job
+from src.search.linkedin.async_search import AsyncJobSearch
+from src.utils.description_matcher import DescriptionMatcher
+from src.utils.seen_jobs import SeenJobs
+from src.utils.jsonl_writer import JsonlWriter
+from src.utils.checkpoint import Checkpoint
+
+logger = LOGGER.get(__name__)
+
+
+class TestAsyncFacade:
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker):
+        self.mocker = mocker
+        self.jobs = [
+            Job(title=f"Job {index}", company="Tech Company", location="London", url=f"url{index}", description=f"Description {index}", easy_apply=True)
+            for index in range(6)
+        ]
+        self.facade = AsyncFacade(mocker.MagicMock(spec=Page), LinkedInConstants, matcher=DescriptionMatcher(batch_size=2))
+        logger.info("Setup for AsyncFacade tests")
+
+    def _mock_search(self, delay: float) -> None:
+        jobs = self.jobs
+
+        async def iter_jobs(*args, **kwargs):
+            for job in jobs:
+                await asyncio.sleep(delay)
+                yield job
+        self.mocker.patch.object(AsyncJobSearch, "iter_jobs", side_effect=iter_jobs)
+
+    def test_run_filters_and_saves_in_order(self) -> None:
+        """Tests that run scores extracted jobs in batches and saves the matched jobs of every batch."""
+        self._mock_search(0)
+        self.mocker.patch.object(DescriptionMatcher, "scores", side_effect=lambda descriptions, user_description: [100 * (int(description.split()[-1]) % 2 == 0) for description in descriptions])
+        saved = []
+
+        jobs = asyncio.run(self.facade.run("Automation Engineer", "qa", "London", save=saved.append))
+
+        assert [job.title for job in jobs] == ["Job 0", "Job 2", "Job 4"]
+        assert DescriptionMatcher.scores.call_count == 3
+        assert [[job.title for job in batch] for batch in saved] == [["Job 0"], ["Job 2"], ["Job 4"]]
+        assert [job.score for job in self.jobs] == [100, 0, 100, 0, 100, 0]
+
+    def test_run_writes_checkpoints_and_marks_seen_jobs(self, tmp_path) -> None:
+        """Tests that every scored batch is written, checkpointed and recorded in the seen jobs index."""
+        self._mock_search(0)
+        self.mocker.patch.object(DescriptionMatcher, "scores", side_effect=lambda descriptions, user_description: [100] * len(descriptions))
+        seen = SeenJobs(str(tmp_path / "seen.sqlite"))
+        facade = AsyncFacade(self.mocker.MagicMock(spec=Page), LinkedInConstants, matcher=DescriptionMatcher(batch_size=2), seen=seen)
+        checkpoint = Checkpoint(str(tmp_path / "checkpoint.json"))
+        self.mocker.patch.object(checkpoint, "save", wraps=checkpoint.save)
+        extractor = facade.search_obj.job_extractor
+        extractor.position, extractor.processed = 75, 6
+
+        with JsonlWriter(str(tmp_path / "results.jsonl")) as writer:
+            asyncio.run(facade.run("Automation Engineer", "qa", "London", processed=4, writer=writer, checkpoint=checkpoint))
+
+        assert len(JsonlWriter.read(str(tmp_path / "results.jsonl"))) == len(self.jobs)
+        assert checkpoint.save.call_count == 3
+        assert checkpoint.load(facade.query("qa", "London"))["processed"] == 10
+        assert seen.known(SeenJobs.job_id(job) for job in self.jobs) == {SeenJobs.job_id(job) for job in self.jobs}
+        seen.close()
+
+    def test_run_scores_batches_concurrently(self) -> None:
+        """Tests that up to matcher.concurrency batches are scored at once and stored in extraction order."""
+        self.jobs = self.jobs[:4]
+        self._mock_search(0)
+        # Both batches must be in flight together to get through the barrier.
+        in_flight = threading.Barrier(2, timeout=5)
+        def scores(descriptions, user_description):
+            in_flight.wait()
+            return [100 * (int(description.split()[-1]) % 2 == 0) for description in descriptions]
+        self.mocker.patch.object(DescriptionMatcher, "scores", side_effect=scores)
+        facade = AsyncFacade(self.mocker.MagicMock(spec=Page), LinkedInConstants, matcher=DescriptionMatcher(batch_size=2, concurrency=2))
+        saved = []
+
+        jobs = asyncio.run(facade.run("Automation Engineer", save=saved.append))
+
+        assert [job.title for job in jobs] == ["Job 0", "Job 2"]
+        assert [[job.title for job in batch] for batch in saved] == [["Job 0"], ["Job 2"]]
+        assert not in_flight.broken
+
+    def test_run_overlaps_scraping_and_scoring(self) -> None:
+        """Tests that scoring a batch runs while the next jobs are being scraped."""
+        delay = 0.1
+        self._mock_search(delay)
+        def slow_scores(descriptions, user_description):
+            time.sleep(delay * len(descriptions))
+            return [100] * len(descriptions)
+        self.mocker.patch.object(DescriptionMatcher, "scores", side_effect=slow_scores)
+
+        start = time.perf_counter()
+        jobs = asyncio.run(self.facade.run("Automation Engineer"))
+        elapsed = time.perf_counter() - start
+
+        assert len(jobs) == len(self.jobs)
+        assert elapsed < 2 * delay * len(self.jobs) * 0.8
@@ -0,0 +1,16 @@
+# tests/test_checkpoint.py
+
+from src.utils.checkpoint import Checkpoint
+
+
+def test_checkpoint_save_load_clear(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / "checkpoint.json"))
+    query = {"keywords": "qa", "location": "London", "epoch_ago": 86400, "filters": None}
+    assert checkpoint.load(query) is None
+
+    checkpoint.save(query, 50, 47)
+    assert checkpoint.load(query) == {"query": query, "start": 50, "processed": 47}
+    assert checkpoint.load({**query, "keywords": "dev"}) is None
+
+    checkpoint.clear()
+    assert checkpoint.load() is None
@@ -0,0 +1,15 @@
+# tests/test_config.py
+
+import config
+
+
+def test_load_reads_the_file_and_the_environment(tmp_path, monkeypatch):
+    """Tests that load() reads the given file, and that credentials from the environment win over it."""
+    path = tmp_path / "config.ini"
+    path.write_text("[user_info]\nusername = file_user\npassword = file_password\n[search]\nkeywords = qa; sdet\nlimit = 7\n", encoding="utf-8")
+    monkeypatch.setenv("LINKEDIN_USERNAME", "env_user")
+
+    config.load(str(path))
+
+    assert (config.linkedin_username, config.linkedin_password) == ("env_user", "file_password")
+    assert (config.keywords_list, config.limit) == (["qa", "sdet"], 7)
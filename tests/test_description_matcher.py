@@ -1,8 +1,18 @@
 # tests/test_description_matcher.py
 
+import time
 import pytest
+from src.utils.description_compactor import DescriptionCompactor, estimate_tokens
 from src.utils.description_matcher import DescriptionMatcher
+import src.utils.matcher_backends as BACKENDS
+from src.utils.near_duplicates import NearDuplicates, simhash
+from src.utils.rate_limiter import RateLimiter
+from src.utils.score_cache import ScoreCache
+from src.utils.vector_matcher import VectorMatcher
 from llm_utils import LLMUtils
+from src.constants.constants import Constants
+from tests.fixtures.fake_llm import FakeLLM
+from tests.fixtures.job_board import JobBoard
 
 @pytest.mark.skip(reason="Fuzzy matching implementation was removed.")
 def test_description_matcher_fuzz():
@@ -15,6 +25,24 @@ def test_description_matcher_llm(mocker):
     assert matcher.matches("Software Engineer", "Senior Software Engineer") is True
     LLMUtils.generate_text.assert_called_once_with("Given the current job description: Software Engineer, and the desired job description: Senior Software Engineer, rate from 0 to 100 if the current job description is matching the desired job description. return only the final score.")
 
+def test_description_matcher_matches_many_single_batch(mocker):
+    mocker.patch.object(LLMUtils, "generate_text", return_value="Scores: [90, 40, 75]")
+    matcher = DescriptionMatcher(method="llm", threshold=60, batch_size=3)
+    assert matcher.matches_many(["QA Engineer", "Chef", "SDET"], "Automation Engineer") == [True, False, True]
+    LLMUtils.generate_text.assert_called_once()
+
+def test_description_matcher_matches_many_batch_size(mocker):
+    mocker.patch.object(LLMUtils, "generate_text", side_effect=["[90, 40]", "[75, 10]", "80"])
+    matcher = DescriptionMatcher(method="llm", threshold=60, batch_size=2)
+    assert matcher.scores(["a", "b", "c", "d", "e"], "Automation Engineer") == [90, 40, 75, 10, 80]
+    assert LLMUtils.generate_text.call_count == 3
+
+def test_description_matcher_matches_many_fallback(mocker):
+    mocker.patch.object(LLMUtils, "generate_text", side_effect=["not a list", "90", "40"])
+    matcher = DescriptionMatcher(method="llm", threshold=60, batch_size=2)
+    assert matcher.matches_many(["QA Engineer", "Chef"], "Automation Engineer") == [True, False]
+    assert LLMUtils.generate_text.call_count == 3
+
 def test_description_matcher_invalid_method():
     with pytest.raises(ValueError, match="Invalid matching method"):
         DescriptionMatcher(method="invalid").matches("","")
@@ -28,4 +56,194 @@ def test_fuzz_matches_different_thresholds():
     assert matcher._fuzz_matches(string1, string2) is True
     
     matcher = DescriptionMatcher(method="fuzz", threshold=90)
-    assert matcher._fuzz_matches(string1, string2) is False
\ No newline at end of file
+    assert matcher._fuzz_matches(string1, string2) is False
+
+def test_description_matcher_concurrent_speedup(mocker):
+    """Scores the same jobs sequentially and with a worker pool against a fake LLM with injected latency."""
+    latency = 0.2
+    def slow_generate_text(prompt):
+        time.sleep(latency)
+        return str(len(prompt) % 100)
+    mocker.patch.object(LLMUtils, "generate_text", side_effect=slow_generate_text)
+    descriptions = [f"Job description {index}" for index in range(8)]
+
+    sequential = DescriptionMatcher(method="llm", batch_size=1, concurrency=1)
+    start = time.perf_counter()
+    sequential_scores = sequential.scores(descriptions, "Automation Engineer")
+    sequential_elapsed = time.perf_counter() - start
+
+    concurrent = DescriptionMatcher(method="llm", batch_size=1, concurrency=4)
+    start = time.perf_counter()
+    concurrent_scores = concurrent.scores(descriptions, "Automation Engineer")
+    concurrent_elapsed = time.perf_counter() - start
+
+    assert concurrent_scores == sequential_scores
+    assert sequential_elapsed >= latency * len(descriptions)
+    assert concurrent_elapsed < sequential_elapsed / 2
+
+def test_description_matcher_concurrent_keeps_order(mocker):
+    def generate_text(prompt):
+        index = int(prompt.split("Job description ")[1].split(",")[0])
+        time.sleep(0.01 * (8 - index))
+        return str(index * 10)
+    mocker.patch.object(LLMUtils, "generate_text", side_effect=generate_text)
+    matcher = DescriptionMatcher(method="llm", batch_size=1, concurrency=8)
+    assert matcher.scores([f"Job description {index}" for index in range(8)], "Automation Engineer") == [0, 10, 20, 30, 40, 50, 60, 70]
+
+def test_description_matcher_retries_quota_errors(mocker):
+    mocker.patch("src.utils.description_matcher.sleep")
+    mocker.patch.object(LLMUtils, "generate_text", side_effect=[Exception("429 Resource has been exhausted (e.g. check quota)."), "90"])
+    matcher = DescriptionMatcher(method="llm")
+    assert matcher.matches("Software Engineer", "Senior Software Engineer") is True
+    assert LLMUtils.generate_text.call_count == 2
+
+def test_description_matcher_does_not_retry_other_errors(mocker):
+    mocker.patch.object(LLMUtils, "generate_text", side_effect=Exception("Invalid API key"))
+    matcher = DescriptionMatcher(method="llm")
+    with pytest.raises(Exception, match="Invalid API key"):
+        matcher.matches("Software Engineer", "Senior Software Engineer")
+    assert LLMUtils.generate_text.call_count == 1
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(requests_per_minute=600)
+    start = time.perf_counter()
+    for _ in range(4):
+        limiter.acquire()
+    assert time.perf_counter() - start >= 0.3
+
+def test_description_matcher_score_cache(mocker, tmp_path):
+    mocker.patch.object(LLMUtils, "generate_text", side_effect=["[90, 40]"])
+    cache = ScoreCache(str(tmp_path / "scores.sqlite"))
+    matcher = DescriptionMatcher(method="llm", threshold=60, cache=cache)
+    assert matcher.matches_many(["QA Engineer", "Chef"], "Automation Engineer") == [True, False]
+
+    matcher = DescriptionMatcher(method="llm", threshold=30, cache=cache)
+    assert matcher.matches_many(["QA  engineer", "Chef"], "Automation Engineer") == [True, True]
+    assert LLMUtils.generate_text.call_count == 1
+    assert (cache.hits, cache.misses) == (2, 2)
+
+def test_score_cache_size_eviction(tmp_path):
+    cache = ScoreCache(str(tmp_path / "scores.sqlite"), ttl=0, max_entries=2)
+    cache.put_many([("a", 1)])
+    time.sleep(0.01)
+    cache.put_many([("b", 2), ("c", 3)])
+    assert cache.get_many(["a", "b", "c"]) == {"b": 2, "c": 3}
+
+def test_score_cache_ttl_eviction(tmp_path):
+    cache = ScoreCache(str(tmp_path / "scores.sqlite"), ttl=60)
+    cache.put_many([("a", 1)])
+    cache._connection.execute("UPDATE scores SET created_at = created_at - 120")
+    assert cache.get_many(["a"]) == {}
+
+def test_description_matcher_vector(mocker):
+    mocker.patch.object(LLMUtils, "generate_text")
+    matcher = DescriptionMatcher(method="vector", threshold=20)
+    descriptions = [
+        "Automation engineer writing Python test infrastructure and CI tooling.",
+        "Pastry chef for a busy downtown restaurant.",
+        None,
+    ]
+    scores = matcher.scores(descriptions, "Python automation engineer for test infrastructure")
+    assert scores[0] > scores[1]
+    assert scores[2] == 0
+    assert matcher.matches_many(descriptions, "Python automation engineer for test infrastructure") == [True, False, False]
+    LLMUtils.generate_text.assert_not_called()
+
+def test_vector_matcher_identical_description():
+    assert VectorMatcher().scores(["Automation Engineer"], "automation  engineer") == [100]
+    assert VectorMatcher().scores([], "automation engineer") == []
+
+def test_description_matcher_injected_llm_backend():
+    fake_llm = FakeLLM()
+    matcher = DescriptionMatcher(method="llm", threshold=50, batch_size=2, llm=fake_llm)
+    assert matcher.scores(["Automation engineer, Python", "Chef", "Automation tester"], "automation engineer") == [100, 0, 50]
+    assert fake_llm.calls == 2
+
+def test_description_matcher_fake_llm_failures(mocker):
+    mocker.patch("src.utils.description_matcher.sleep")
+    matcher = DescriptionMatcher(method="llm", batch_size=2, llm=FakeLLM(error_rate=1.0))
+    with pytest.raises(RuntimeError, match="quota"):
+        matcher.scores(["QA Engineer"], "Automation Engineer")
+    assert matcher.llm.calls == Constants.LLM_MAX_RETRIES + 1
+
+    matcher = DescriptionMatcher(method="llm", batch_size=2, llm=FakeLLM(malformed_rate=1.0))
+    with pytest.raises(ValueError):
+        matcher.scores(["QA Engineer", "Chef"], "Automation Engineer")
+    # The malformed batch reply falls back to scoring the first job alone.
+    assert matcher.llm.calls == 2
+
+POSTING = JobBoard(2, seed=0).jobs[1]["description"]
+REPOST = "Reposted by a recruiting agency. " + POSTING
+
+def test_simhash_near_duplicates():
+    other = JobBoard(2, seed=1).jobs[0]["description"]
+    assert (simhash(POSTING) ^ simhash(REPOST)).bit_count() <= 6 < (simhash(POSTING) ^ simhash(other)).bit_count()
+    assert simhash("QA") is None
+
+    duplicates = NearDuplicates(6)
+    assert duplicates.cluster(POSTING) == duplicates.cluster(REPOST) != duplicates.cluster(other)
+
+def test_description_matcher_scores_near_duplicates_once():
+    fake_llm = FakeLLM()
+    duplicates = NearDuplicates(6)
+    matcher = DescriptionMatcher(method="llm", batch_size=1, llm=fake_llm, duplicates=duplicates)
+
+    scores = matcher.scores([POSTING, "Chef", REPOST], "automation engineer")
+    assert scores[0] == scores[2]
+    assert matcher.scores([POSTING + " Apply today."], "automation engineer") == [scores[0]]
+    assert fake_llm.calls == 2
+    assert (duplicates.checked, duplicates.skipped, duplicates.llm_calls_saved) == (4, 2, 2)
+
+RAW_POSTING = """About Us
+Acme Robotics builds warehouse robots and has offices in five countries.
+
+Responsibilities:
+   Build   Python test infrastructure.
+Maintain the CI pipelines.
+
+Requirements
+3+ years of test automation. Acme is an equal opportunity employer.
+
+Benefits
+Free lunch and a gym membership.
+"""
+
+def test_description_compactor_keeps_requirements():
+    compactor = DescriptionCompactor(token_budget=0)
+    assert compactor.compact(RAW_POSTING) == ("Responsibilities:\nBuild Python test infrastructure.\nMaintain the CI pipelines.\n"
+                                              "Requirements\n3+ years of test automation.")
+    assert compactor.compact("QA  engineer,\n\nPython") == "QA engineer,\nPython"
+    assert compactor.compact(None) is None
+    assert compactor.tokens_after < compactor.tokens_before
+
+def test_description_compactor_keeps_candidate_sections():
+    compactor = DescriptionCompactor(token_budget=0)
+    assert compactor.compact("About the job\nWe build robots.\nAbout You\n5 years of Python and Playwright.\nWhat we offer\nGym") == (
+        "About the job\nWe build robots.\nAbout You\n5 years of Python and Playwright.")
+    assert compactor.compact("About Acme Labs\nFounded in 1999.\nThe ideal candidate\nKnows pytest.") == "The ideal candidate\nKnows pytest."
+
+def test_description_compactor_token_budget():
+    compactor = DescriptionCompactor(token_budget=7)
+    assert compactor.compact("automation engineer writing python tests") == "automation engineer writing"
+    assert estimate_tokens("automation engineer writing") <= 7
+
+def test_description_matcher_compacts_prompts(mocker):
+    fake_llm = FakeLLM()
+    mocker.spy(fake_llm, "generate_text")
+    matcher = DescriptionMatcher(method="llm", llm=fake_llm, compactor=DescriptionCompactor())
+    matcher.scores([RAW_POSTING], "automation engineer")
+    prompt = fake_llm.generate_text.call_args.args[0]
+    assert "Maintain the CI pipelines." in prompt and "Free lunch" not in prompt
+
+def test_description_matcher_builds_backends_on_first_use(mocker):
+    load = mocker.spy(BACKENDS, "load")
+    matcher = DescriptionMatcher(method="vector")
+    load.assert_not_called()
+    assert matcher.scores(["Automation engineer"], "automation engineer") == [100]
+    assert [call.args[0] for call in load.call_args_list] == ["vector"]
+
+def test_score_cache_key_depends_on_batch_prompt(mocker):
+    matcher = DescriptionMatcher(method="llm", llm=FakeLLM())
+    key = matcher._cache_key("QA Engineer", "Automation Engineer")
+    mocker.patch.object(DescriptionMatcher, "BATCH_PROMPT_TEMPLATE", DescriptionMatcher.BATCH_PROMPT_TEMPLATE + " Be strict.")
+    assert matcher._cache_key("QA Engineer", "Automation Engineer") != key
@@ -1,11 +1,17 @@
 # tests/test_facade.py
 
+import threading
 import src.logger as LOGGER
 from pytest import raises
+from playwright.sync_api import Page
 from configparser import ConfigParser
 from src.exceptions import LoginError
+from src.constants.linkedin import LinkedInConstants
 from src.facade import Facade
 from src.models.job import Job
+from src.utils.checkpoint import Checkpoint
+from src.utils.jsonl_writer import JsonlWriter
+from src.utils.seen_jobs import SeenJobs
 
 logger = LOGGER.get(__name__)
 
@@ -82,12 +88,12 @@ class TestLinkedInFacade:
         linkedin_facade: Facade
     ) -> None:
         """Test the filter_jobs method of Facade."""
-        logger.info("Mocking DescriptionMatcher.matches method for filter_jobs test.")
-        # Mock the matches method
-        mocked_matched = mocker.patch("src.utils.description_matcher.DescriptionMatcher.matches")
+        logger.info("Mocking DescriptionMatcher.scores method for filter_jobs test.")
+        # Mock the scores method
+        mocked_scores = mocker.patch("src.utils.description_matcher.DescriptionMatcher.scores")
         
-        # Set up mock return value for matches
-        mocked_matched.side_effect = lambda job_desc, user_desc: job_desc == user_desc
+        # Set up mock return value for scores
+        mocked_scores.side_effect = lambda job_descs, user_desc: [100 if job_desc == user_desc else 0 for job_desc in job_descs]
 
         jobs = [
             Job(title="Software Engineer", company="Google", location="London", url="url1", description="Python Developer", easy_apply=False),
@@ -98,4 +104,120 @@ class TestLinkedInFacade:
         filtered_jobs = linkedin_facade.filter_jobs(jobs, "Python Developer")
         assert len(filtered_jobs) == 1, "filter_jobs should return one job."
         assert filtered_jobs[0].title == "Software Engineer", "Filtered job should be 'Software Engineer'."
-        logger.debug("filter_jobs returned the correct filtered job.")
\ No newline at end of file
+        assert [job.score for job in jobs] == [100, 0], "filter_jobs should keep the raw score on every job."
+        logger.debug("filter_jobs returned the correct filtered job.")
+
+    def test_facade_iter_filtered_overlaps_scraping_and_scoring(self, mocker) -> None:
+        """Tests that batches are scored while the next jobs are extracted and matched jobs keep their order."""
+        matcher = mocker.MagicMock(batch_size=2, concurrency=1, threshold=50)
+        third_batch_extracted = threading.Event()
+        overlapped = []
+        def scores(descriptions, user_description):
+            if descriptions[0] == "0":
+                # Only returns True if extraction goes on while the first batch is being scored.
+                overlapped.append(third_batch_extracted.wait(timeout=5))
+            return [int(description) % 2 * 100 for description in descriptions]
+        matcher.scores.side_effect = scores
+
+        def jobs(*args, **kwargs):
+            for index in range(6):
+                if index == 4:
+                    third_batch_extracted.set()
+                yield Job(title=f"Job {index}", company="Tech Company", location="London", url=f"url{index}", description=str(index), easy_apply=True)
+
+        facade = Facade(mocker.MagicMock(spec=Page), LinkedInConstants, matcher=matcher)
+        mocker.patch.object(facade, "iter_jobs", side_effect=jobs)
+
+        matched = list(facade.iter_filtered("user description"))
+
+        assert [job.title for job in matched] == ["Job 1", "Job 3", "Job 5"]
+        assert matcher.scores.call_count == 3
+        assert overlapped == [True]
+
+    def test_facade_iter_filtered_scores_batches_concurrently(self, mocker) -> None:
+        """Tests that up to matcher.concurrency batches are scored at once and matched jobs still keep their order."""
+        matcher = mocker.MagicMock(batch_size=2, concurrency=2, threshold=50)
+        # Both batches must be in flight together to get through the barrier.
+        in_flight = threading.Barrier(2, timeout=5)
+        def scores(descriptions, user_description):
+            in_flight.wait()
+            return [int(description) % 2 * 100 for description in descriptions]
+        matcher.scores.side_effect = scores
+        facade = Facade(mocker.MagicMock(spec=Page), LinkedInConstants, matcher=matcher)
+        mocker.patch.object(facade, "iter_jobs", side_effect=lambda *args, **kwargs: iter(
+            Job(title=f"Job {index}", company="Tech Company", location="London", url=f"url{index}", description=str(index), easy_apply=True) for index in range(4)))
+
+        matched = list(facade.iter_filtered("user description"))
+
+        assert [job.title for job in matched] == ["Job 1", "Job 3"]
+        assert not in_flight.broken
+
+
+def test_facade_iter_filtered_writes_results_and_checkpoint(mocker, tmp_path) -> None:
+    """Tests that every scored batch is logged before its search position is checkpointed, and that resuming continues from it."""
+    matcher = mocker.MagicMock(batch_size=2, concurrency=1, threshold=50)
+    matcher.scores.side_effect = lambda descriptions, user_description: [int(description) % 2 * 100 for description in descriptions]
+    facade = Facade(mocker.MagicMock(spec=Page), LinkedInConstants, matcher=matcher)
+    extractor = facade.search_obj.job_extractor
+
+    def jobs(keywords, location, epoch_ago, filters, limit, start):
+        for index in range(start, start + limit):
+            extractor.position, extractor.processed = index + 1, index + 1 - start
+            yield Job(title=f"Job {index}", company="Tech Company", location="London", url=f"url{index}", description=str(index), easy_apply=True)
+    iter_jobs = mocker.patch.object(facade, "iter_jobs", side_effect=jobs)
+    checkpoint = Checkpoint(str(tmp_path / "checkpoint.json"))
+    saves = mocker.spy(checkpoint, "save")
+
+    with JsonlWriter(str(tmp_path / "results.jsonl")) as writer:
+        matched = list(facade.iter_filtered("user description", "qa", "London", 86400, limit=3, writer=writer, checkpoint=checkpoint))
+
+    assert [job.title for job in matched] == ["Job 1"]
+    assert [job.score for job in JsonlWriter.read(str(tmp_path / "results.jsonl"))] == [0, 100, 0]
+    assert [call.args[1:] for call in saves.call_args_list] == [(2, 2), (3, 3)]
+
+    list(facade.iter_filtered("user description", "qa", "London", 86400, limit=5, start=3, processed=3))
+    iter_jobs.assert_called_with("qa", "London", 86400, None, 2, 3)
+
+
+def test_facade_login_reuses_saved_session(mocker, tmp_path) -> None:
+    """Tests that a valid saved session skips the login form and an expired one falls back to it and is saved again."""
+    page = mocker.MagicMock(spec=Page)
+    page.url = "about:blank"
+    session_path = str(tmp_path / "storage_state.json")
+    facade = Facade(page, LinkedInConstants, matcher=mocker.MagicMock(), session_path=session_path)
+    mocker.patch.object(facade.login_obj, "load_session", return_value=True)
+    is_logged_in = mocker.patch.object(facade.login_obj, "is_logged_in", return_value=True)
+    form_login = mocker.patch.object(facade.login_obj, "login")
+    save_session = mocker.patch.object(facade.login_obj, "save_session")
+
+    facade.login("username", "password")
+    form_login.assert_not_called()
+    assert facade.login_seconds is not None
+
+    is_logged_in.return_value = False
+    facade.login("username", "password")
+    form_login.assert_called_once_with("username", "password")
+    save_session.assert_called_once_with(session_path)
+
+
+def test_facade_filter_job_cards_fetches_descriptions_of_new_jobs_only(mocker, tmp_path) -> None:
+    """Tests that cards seen in previous runs are dropped before their description is fetched, and the others are scored."""
+    matcher = mocker.MagicMock(threshold=50)
+    matcher.scores.side_effect = lambda descriptions, user_description: [int(description) % 2 * 100 for description in descriptions]
+    seen = SeenJobs(str(tmp_path / "seen.sqlite"))
+    cards = [Job(title=f"Job {index}", company="Tech Company", location="London", url=f"https://www.linkedin.com/jobs/view/{index}/", easy_apply=True) for index in range(4)]
+    seen.record(cards[:1])
+    facade = Facade(mocker.MagicMock(spec=Page), LinkedInConstants, matcher=matcher, seen=seen)
+
+    def fetch_descriptions(jobs):
+        for job in jobs:
+            job.description = None if job.title == "Job 3" else job.title.split()[-1]
+        return jobs
+    fetch = mocker.patch.object(facade, "fetch_descriptions", side_effect=fetch_descriptions)
+
+    matched = facade.filter_job_cards(cards, "user description")
+
+    assert [job.title for job in fetch.call_args.args[0]] == ["Job 1", "Job 2", "Job 3"]
+    assert [job.title for job in matched] == ["Job 1"]
+    assert matcher.scores.call_args.args[0] == ["1", "2"]
+    seen.close()
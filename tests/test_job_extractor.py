@@ -1,13 +1,16 @@
 # tests\test_job_extractor.py
 
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 import src.logger as LOGGER
 from src.constants.constants import Constants
+from src.constants.linkedin import LinkedInConstants
 from src.search.linkedin.job_extractor import JobExtractor
 from src.models.job import Job
+from src.utils.seen_jobs import SeenJobs
 from src.constants.constants import Constants
+from tests.fixtures.job_board import JobBoard
 
 logger = LOGGER.get(__name__)
 
@@ -17,6 +20,7 @@ class TestJobExtractor:
     def setup(self, mocker: pytest.MonkeyPatch):
         self.mocker = mocker
         self.mock_page = self.mocker.MagicMock(spec=Page)
+        self.mock_page.url = "https://www.linkedin.com/jobs/search/?keywords=qa"
         self.job_extractor = JobExtractor(self.mock_page, Constants)
         logger.info("Setup for JobExtractor tests")
 
@@ -59,4 +63,180 @@ class TestJobExtractor:
             assert job.url == "https://example.com"
             assert job.description == "Job description"
             assert job.easy_apply is True
-        logger.info("test_extract_job_information completed successfully")
\ No newline at end of file
+        logger.info("test_extract_job_information completed successfully")
+    def test_extract_job_information_parallel(self) -> None:
+        """Tests that multi-tab extraction merges the tabs in offset order, deduplicates by URL and respects the limit."""
+        logger.info("Starting test_extract_job_information_parallel")
+
+        self.mock_page.url = "https://www.linkedin.com/jobs/search/?keywords=qa&start=0"
+        extra_tabs = [self.mocker.MagicMock(spec=Page), self.mocker.MagicMock(spec=Page)]
+        self.mock_page.context.new_page.side_effect = extra_tabs
+
+        def process_current_page(extractor, limit):
+            offset = int(extractor.page.goto.call_args.args[0].split("&start=")[1])
+            jobs = [
+                Job(title=f"Job {offset + index}", company="Tech Company", location="London",
+                    url=f"https://www.linkedin.com/jobs/view/{offset + index}/?trackingId={offset}", easy_apply=True)
+                for index in range(limit)
+            ]
+            if offset == 25:
+                jobs[0].url = "https://www.linkedin.com/jobs/view/0/?trackingId=other"
+            return jobs, Constants.NUM_OF_JOBS_IN_PAGE
+        self.mocker.patch.object(JobExtractor, '_process_current_page', autospec=True, side_effect=process_current_page)
+
+        job_extractor = JobExtractor(self.mock_page, LinkedInConstants, tabs=3)
+        jobs = job_extractor.extract_jobs(None, 60)
+
+        assert len(jobs) == 59
+        assert [job.title for job in jobs[:3]] == ["Job 0", "Job 1", "Job 2"]
+        assert "Job 25" not in [job.title for job in jobs]
+        assert jobs[-1].title == "Job 59"
+        self.mock_page.goto.assert_called_once_with("https://www.linkedin.com/jobs/search/?keywords=qa&start=0", wait_until="commit")
+        for tab in extra_tabs:
+            tab.close.assert_called_once()
+        logger.info("test_extract_job_information_parallel completed successfully")
+
+    def test_extract_job_information_parallel_resume_counts_clicked_jobs(self, tmp_path) -> None:
+        """Tests that a resumed multi-tab search skips the seen cards and, like the sequential search, counts only the clicked ones as processed."""
+        logger.info("Starting test_extract_job_information_parallel_resume_counts_clicked_jobs")
+
+        self.mock_page.url = "https://www.linkedin.com/jobs/search/?keywords=qa&start=25"
+        extra_tab = self.mocker.MagicMock(spec=Page)
+        self.mock_page.context.new_page.return_value = extra_tab
+        for tab in [self.mock_page, extra_tab]:
+            tab.locator.return_value.evaluate_all.side_effect = lambda *args, tab=tab: [
+                str(int(tab.goto.call_args.args[0].split("&start=")[1]) + index) for index in range(Constants.NUM_OF_JOBS_IN_PAGE)]
+        seen = SeenJobs(str(tmp_path / "seen.sqlite"))
+        seen.record([Job(title=f"Job {index}", company="Tech Company", location="London", url=f"https://www.linkedin.com/jobs/view/{index}/", easy_apply=True) for index in [25, 26, 27]])
+        self.mocker.patch.object(JobExtractor, 'search_results_elements', [self.mocker.MagicMock() for _ in range(Constants.NUM_OF_JOBS_IN_PAGE)])
+        self.mocker.patch.object(JobExtractor, 'click')
+        clicked = iter(range(100))
+        def process_single_job_element():
+            index = next(clicked)
+            return Job(title=f"Job {index}", company="Tech Company", location="London", url=f"https://www.linkedin.com/jobs/view/{index}/", easy_apply=True)
+        self.mocker.patch.object(JobExtractor, '_process_single_job_element', side_effect=process_single_job_element)
+
+        job_extractor = JobExtractor(self.mock_page, LinkedInConstants, tabs=2, seen=seen)
+        jobs = job_extractor.extract_jobs(None, 50)
+
+        assert len(jobs) == 47
+        assert (job_extractor.position, job_extractor.processed) == (75, 47)
+        seen.close()
+        logger.info("test_extract_job_information_parallel_resume_counts_clicked_jobs completed successfully")
+
+    def test_extract_single_job_data_bulk(self) -> None:
+        """Tests that the job details are read with a single evaluate call instead of one locator per field."""
+        logger.info("Starting test_extract_single_job_data_bulk")
+
+        job_data = {
+            "title": "Software Engineer", "company": "Tech Company", "location": "London",
+            "url": "https://example.com", "description": "Job description", "easy_apply": False, "apply_button": True,
+        }
+        self.mock_page.evaluate.return_value = job_data
+        job_title = self.mocker.patch.object(JobExtractor, 'job_title', new_callable=self.mocker.PropertyMock)
+        is_job_apply_button = self.mocker.patch.object(JobExtractor, 'is_job_apply_button', new_callable=self.mocker.PropertyMock)
+
+        job_extractor = JobExtractor(self.mock_page, LinkedInConstants)
+        job = job_extractor._process_single_job_element()
+
+        assert job.title == "Software Engineer"
+        assert job.easy_apply is False
+        self.mock_page.wait_for_selector.assert_called_once_with(LinkedInConstants.Locators.Job.DESCRIPTION, timeout=LinkedInConstants.DEFAULT_TIMEOUT * 1000)
+        self.mock_page.evaluate.assert_called_once()
+        job_title.assert_not_called()
+        is_job_apply_button.assert_not_called()
+        logger.info("test_extract_single_job_data_bulk completed successfully")
+
+    def test_extract_job_cards(self) -> None:
+        """Tests that job cards are read page by page with one evaluate call and no clicks."""
+        logger.info("Starting test_extract_job_cards")
+
+        def page_cards(offset, count):
+            return [
+                {"job_id": str(offset + index), "title": f"Job {offset + index}", "company": "Tech Company", "location": "London",
+                 "url": f"https://www.linkedin.com/jobs/view/{offset + index}/", "easy_apply": index % 2 == 0}
+                for index in range(count)
+            ]
+        self.mock_page.url = "https://www.linkedin.com/jobs/search/?keywords=qa"
+        self.mock_page.evaluate.side_effect = [page_cards(0, 25), page_cards(25, 25)]
+
+        job_extractor = JobExtractor(self.mock_page, LinkedInConstants)
+        jobs = job_extractor.extract_job_cards(None, 30)
+
+        assert len(jobs) == 30
+        assert jobs[29].title == "Job 29"
+        assert jobs[0].raw_data == {"job_id": "0"}
+        assert jobs[0].description is None
+        assert self.mock_page.evaluate.call_count == 2
+        self.mock_page.goto.assert_called_once_with("https://www.linkedin.com/jobs/search/?keywords=qa&start=25")
+        logger.info("test_extract_job_cards completed successfully")
+
+    def test_extract_job_cards_reports_a_timed_out_page_as_throttling(self) -> None:
+        """Tests that a results page after a full one showing no cards before the timeout slows the pacer down."""
+        logger.info("Starting test_extract_job_cards_reports_a_timed_out_page_as_throttling")
+
+        self.mock_page.wait_for_selector.side_effect = [None, PlaywrightTimeoutError("Timeout 10000ms exceeded")]
+        self.mock_page.evaluate.return_value = [
+            {"job_id": str(index), "title": f"Job {index}", "company": "Tech Company", "location": "London",
+             "url": f"https://www.linkedin.com/jobs/view/{index}/", "easy_apply": True}
+            for index in range(25)
+        ]
+        pacer = self.mocker.MagicMock()
+
+        jobs = JobExtractor(self.mock_page, LinkedInConstants, pacer=pacer).extract_job_cards(None, 50)
+
+        assert len(jobs) == 25
+        pacer.throttled.assert_called_once_with("empty results page")
+        logger.info("test_extract_job_cards_reports_a_timed_out_page_as_throttling completed successfully")
+
+    def test_extract_jobs_skips_seen_jobs(self) -> None:
+        """Tests that cards seen in previous runs are not clicked and pagination stops on a fully known page."""
+        logger.info("Starting test_extract_jobs_skips_seen_jobs")
+
+        seen = self.mocker.MagicMock()
+        seen.known.side_effect = lambda job_ids: {job_id for job_id in job_ids if int(job_id) % 2 == 0 or int(job_id) >= 25}
+        self.mock_page.url = "https://www.linkedin.com/jobs/search/?keywords=qa"
+        self.mock_page.locator.return_value.evaluate_all.side_effect = [
+            [str(index) for index in range(25)],
+            [str(index) for index in range(25, 50)],
+        ]
+        elements = [self.mocker.MagicMock() for _ in range(25)]
+        self.mocker.patch.object(JobExtractor, 'search_results_elements', elements)
+        process_single_job_element = self.mocker.patch.object(JobExtractor, '_process_single_job_element', return_value=self.mocker.MagicMock(spec=Job))
+
+        job_extractor = JobExtractor(self.mock_page, LinkedInConstants, seen=seen)
+        jobs = job_extractor.extract_jobs(None, 100)
+
+        assert len(jobs) == 12
+        assert process_single_job_element.call_count == 12
+        assert [element.click.call_count for element in elements[:4]] == [0, 1, 0, 1]
+        self.mock_page.goto.assert_called_once_with("https://www.linkedin.com/jobs/search/?keywords=qa&start=25")
+        logger.info("test_extract_jobs_skips_seen_jobs completed successfully")
+
+    def test_iter_jobs_skips_failing_cards(self) -> None:
+        """Tests that jobs are yielded one by one and a card that fails is not retried forever."""
+        logger.info("Starting test_iter_jobs_skips_failing_cards")
+
+        elements = [self.mocker.MagicMock() for _ in range(3)]
+        elements[1].click.side_effect = Exception("detached")
+        self.mocker.patch.object(JobExtractor, 'search_results_elements', elements)
+        self.mocker.patch.object(JobExtractor, '_process_single_job_element', side_effect=lambda: self.mocker.MagicMock(spec=Job))
+
+        jobs = self.job_extractor.iter_jobs(None, 3)
+        next(jobs)
+        assert elements[2].click.call_count == 0
+        assert len(list(jobs)) == 1
+        assert elements[1].click.call_count == 1
+        logger.info("test_iter_jobs_skips_failing_cards completed successfully")
+
+
+def test_extract_jobs_from_job_board(playwright_page_no_data: Page) -> None:
+    """Tests clicking through the paginated results of the synthetic job board, cards missing a field are skipped."""
+    board = JobBoard(total_jobs=30, page_size=10, missing_rate=0.2)
+    with board.server():
+        constants = board.constants()
+        job_extractor = JobExtractor(playwright_page_no_data, constants)
+        jobs = job_extractor.extract_jobs(f"{constants.JOBS_SEARCH_URL}?keywords=qa", 30)
+
+    assert [job.url for job in jobs] == [f"{board.base_url}/jobs/view/{job['job_id']}/" for job in board.valid_jobs]
+    assert all(job.description for job in jobs)
@@ -0,0 +1,45 @@
+# tests/test_jsonl_writer.py
+
+from src.models.job import Job
+from src.utils.jsonl_writer import JsonlWriter
+
+
+def _job(index: int) -> Job:
+    return Job(title=f"Job {index}", company="Tech Company", location="London", url=f"url{index}",
+               easy_apply=True, description="Python", score=index * 10, raw_data={"job_id": str(index)})
+
+
+def test_jsonl_writer_appends_and_reads_back(tmp_path):
+    path = str(tmp_path / "results" / "results.jsonl")
+    with JsonlWriter(path) as writer:
+        writer.write_many([_job(1), _job(2)])
+    with JsonlWriter(path) as writer:
+        writer.write_many([_job(3)])
+
+    assert JsonlWriter.read(path) == [_job(1), _job(2), _job(3)]
+
+def test_jsonl_writer_records_are_readable_before_close(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    writer = JsonlWriter(path, fsync_interval=0)
+    writer.write_many([_job(1)])
+
+    assert JsonlWriter.read(path) == [_job(1)]
+    writer.close()
+
+def test_jsonl_writer_ignores_truncated_line(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    with JsonlWriter(path) as writer:
+        writer.write_many([_job(1)])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"title": "Job 2", "comp')
+
+    assert JsonlWriter.read(path) == [_job(1)]
+
+def test_jsonl_writer_new_run_truncates(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    with JsonlWriter(path) as writer:
+        writer.write_many([_job(1)])
+    with JsonlWriter(path, append=False) as writer:
+        writer.write_many([_job(2)])
+
+    assert JsonlWriter.read(path) == [_job(2)]
@@ -0,0 +1,11 @@
+# tests/test_logger.py
+
+import subprocess
+import sys
+
+
+def test_import_does_not_configure_logging():
+    """Importing the package must not add handlers or open the log file, the entry points call LOGGER.setup."""
+    code = "import logging, src.utils.description_matcher; print(len(logging.getLogger().handlers), 'llm_utils' in __import__('sys').modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["0", "False"]
@@ -1,6 +1,7 @@
 # tests\test_login.py
 
 import configparser
+import json
 import pytest
 import src.logger as LOGGER
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
@@ -65,3 +66,30 @@ class TestLogin:
 
         with pytest.raises(LoginError, match="Login failed Due to timeout."):
             login_manager.login(invalid_username, invalid_password)
+
+
+class TestLoginSession:
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker: pytest.MonkeyPatch) -> None:
+        self.page = mocker.MagicMock(spec=Page)
+        self.page.context = mocker.MagicMock()
+        self.login_manager = Login(self.page, LinkedInConstants)
+
+    @pytest.mark.parametrize("status, logged_in", [(200, True), (302, False), (303, False)])
+    def test_is_logged_in(self, status: int, logged_in: bool) -> None:
+        """Tests that the session is checked with one request of the feed that does not follow redirects."""
+        self.page.context.request.get.return_value.status = status
+
+        assert self.login_manager.is_logged_in() is logged_in
+        self.page.context.request.get.assert_called_once_with(LinkedInConstants.FEED_URL, max_redirects=0, timeout=LinkedInConstants.DEFAULT_TIMEOUT * 1000)
+        self.page.goto.assert_not_called()
+
+    def test_load_session(self, tmp_path) -> None:
+        """Tests that the cookies of a saved storage state are added to the context."""
+        path = tmp_path / "storage_state.json"
+        assert self.login_manager.load_session(str(path)) is False
+
+        cookies = [{"name": "li_at", "value": "token", "domain": ".linkedin.com", "path": "/"}]
+        path.write_text(json.dumps({"cookies": cookies, "origins": []}), encoding="utf-8")
+        assert self.login_manager.load_session(str(path)) is True
+        self.page.context.add_cookies.assert_called_once_with(cookies)
@@ -0,0 +1,50 @@
+# tests/test_metrics.py
+
+import json
+
+import src.utils.metrics as METRICS
+from src.utils.metrics import Metrics
+
+
+class TestMetrics:
+    def test_summary_percentiles_and_counters(self, mocker):
+        metrics = Metrics()
+        metrics.durations["card_click"] = [float(value) for value in range(1, 21)]
+        metrics.count("jobs_extracted", 10)
+        metrics.count("llm_calls")
+        mocker.patch("src.utils.metrics.perf_counter", return_value=metrics.started + 5)
+
+        summary = metrics.summary()
+
+        assert summary["stages"]["card_click"] == {"count": 20, "total": 210.0, "p50": 10.0, "p95": 19.0}
+        assert summary["counters"] == {"jobs_extracted": 10, "llm_calls": 1}
+        assert summary["jobs_per_second"] == 2.0
+
+    def test_export_writes_json_and_prometheus_text(self, tmp_path):
+        metrics = Metrics()
+        with metrics.span("login"):
+            pass
+        metrics.count("score_cache_hits", 3)
+
+        metrics.export(str(tmp_path / "metrics"))
+
+        assert json.loads((tmp_path / "metrics.json").read_text())["counters"] == {"score_cache_hits": 3}
+        prometheus = (tmp_path / "metrics.prom").read_text()
+        assert 'jobscraper_stage_seconds{stage="login",quantile="0.95"}' in prometheus
+        assert 'jobscraper_stage_seconds_count{stage="login"} 1' in prometheus
+        assert "jobscraper_score_cache_hits_total 3" in prometheus
+
+    def test_module_spans_are_a_shared_no_op_while_disabled(self):
+        METRICS.disable()
+        assert METRICS.span("login") is METRICS.span("save")
+        METRICS.count("llm_calls")
+
+        metrics = METRICS.enable()
+        try:
+            with METRICS.span("login"):
+                pass
+            METRICS.count("llm_calls")
+            assert len(metrics.durations["login"]) == 1
+            assert metrics.counters["llm_calls"] == 1
+        finally:
+            METRICS.disable()
@@ -0,0 +1,62 @@
+# tests/test_pacer.py
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+from src.utils.pacer import Pacer
+
+
+class TestPacer:
+    def test_token_bucket_spaces_actions_after_the_burst(self, mocker):
+        waits = mocker.patch("src.utils.pacer.sleep")
+        pacer = Pacer(rate=2, max_rate=2, burst=2, jitter=0)
+
+        for _ in range(4):
+            pacer.acquire()
+
+        delays = [call.args[0] for call in waits.call_args_list]
+        assert len(delays) == 2
+        assert 0.4 < delays[0] <= 0.5 and 0.9 < delays[1] <= 1.0
+
+    def test_speeds_up_while_healthy_and_backs_off_on_throttling(self, mocker):
+        waits = mocker.patch("src.utils.pacer.sleep")
+        pacer = Pacer(rate=1, max_rate=1.1, burst=100, jitter=0, challenge_urls=["/checkpoint/challenge"])
+        page = MagicMock()
+        page.goto.return_value = MagicMock(status=200, url="https://www.linkedin.com/jobs/search/")
+
+        for _ in range(3):
+            pacer.goto(page, "https://www.linkedin.com/jobs/search/")
+        assert pacer.rate == 1.1
+
+        page.goto.return_value = MagicMock(status=429, url="https://www.linkedin.com/jobs/search/")
+        pacer.goto(page, "https://www.linkedin.com/jobs/search/")
+        page.goto.return_value = MagicMock(status=200, url="https://www.linkedin.com/checkpoint/challenge/123")
+        pacer.goto(page, "https://www.linkedin.com/jobs/search/")
+
+        assert pacer.rate < 0.3
+        assert pacer.throttles == {"HTTP 429": 1, "challenge page": 1}
+
+        page.goto.return_value = MagicMock(status=200, url="https://www.linkedin.com/jobs/search/")
+        pacer.goto(page, "https://www.linkedin.com/jobs/search/")
+        # The navigation after the second throttling waits for the doubled backoff.
+        assert 9 < waits.call_args_list[-1].args[0] <= 10
+        assert pacer.failures == 0
+        assert pacer.stats()["navigations"] == 6
+
+    def test_async_goto_waits_without_blocking_and_reports_throttling(self, mocker):
+        blocking_waits = mocker.patch("src.utils.pacer.sleep")
+        waits = mocker.patch("src.utils.pacer.asyncio.sleep", new_callable=AsyncMock)
+        pacer = Pacer(rate=1, max_rate=1, burst=1, jitter=0)
+        page = MagicMock()
+        page.goto = AsyncMock(return_value=MagicMock(status=429, url="https://www.linkedin.com/jobs/search/"))
+
+        async def navigate():
+            for _ in range(2):
+                await pacer.goto_async(page, "https://www.linkedin.com/jobs/search/")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(asyncio.run, navigate()).result()
+
+        assert not blocking_waits.called
+        assert 4 < waits.await_args.args[0] <= 5
+        assert pacer.throttles == {"HTTP 429": 2}
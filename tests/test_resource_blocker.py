@@ -0,0 +1,50 @@
+# tests/test_resource_blocker.py
+
+from unittest.mock import MagicMock
+
+from src.utils.resource_blocker import ResourceBlocker
+
+
+def _route(resource_type: str, url: str) -> MagicMock:
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    return route
+
+
+class TestResourceBlocker:
+    def test_blocks_resource_types_and_url_patterns(self):
+        blocker = ResourceBlocker(["image", "font"], ["*doubleclick.net*"])
+
+        assert blocker.should_block("image", "https://www.linkedin.com/logo.png")
+        assert blocker.should_block("script", "https://ad.doubleclick.net/tag.js")
+        assert not blocker.should_block("document", "https://www.linkedin.com/jobs/search/")
+        assert not blocker.should_block("xhr", "https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards")
+
+    def test_handle_aborts_or_continues_and_counts(self):
+        blocker = ResourceBlocker(["image"], ["*/li/track*"])
+        image, tracking, document = _route("image", "https://x/a.png"), _route("xhr", "https://x/li/track"), _route("document", "https://x/")
+
+        for route in [image, tracking, document]:
+            blocker._handle(route)
+        response = MagicMock(headers={"content-length": "1234"})
+        blocker._on_response(response)
+
+        image.abort.assert_called_once()
+        tracking.abort.assert_called_once()
+        document.continue_.assert_called_once()
+        assert blocker.stats() == {
+            "blocked_requests": 2,
+            "blocked_by_type": {"image": 1, "xhr": 1},
+            "allowed_requests": 1,
+            "bytes_transferred": 1234,
+        }
+
+    def test_attach_routes_all_requests(self):
+        blocker = ResourceBlocker()
+        context = MagicMock()
+
+        blocker.attach(context)
+
+        context.route.assert_called_once_with("**/*", blocker._handle)
+        context.on.assert_called_once_with("response", blocker._on_response)
@@ -0,0 +1,88 @@
+# tests/test_response_capture.py
+
+import json
+import pathlib
+from playwright.sync_api import Page
+
+import src.logger as LOGGER
+from src.constants.linkedin import LinkedInConstants
+from src.search.linkedin.job_extractor import JobExtractor
+from src.search.linkedin.response_capture import JobResponseCapture
+from tests.fixtures.server import FixtureServer
+
+logger = LOGGER.get(__name__)
+
+PAYLOADS = pathlib.Path(__file__).parent / "fixtures" / "linkedin"
+
+SEARCH_PAGE = b"""<html><body><script>
+const start = new URLSearchParams(location.search).get("start") || "0";
+fetch("/voyager/api/voyagerJobsDashJobCards?start=" + start);
+</script></body></html>"""
+
+JOB_PAGE = b"""<html><body><script>
+const jobId = location.pathname.split("/").filter(Boolean).pop();
+fetch("/voyager/api/jobs/jobPostings/" + jobId);
+</script></body></html>"""
+
+
+def _payload(name: str) -> dict:
+    return json.loads((PAYLOADS / name).read_text(encoding="utf-8"))
+
+
+def _json(body: dict):
+    return 200, "application/json", json.dumps(body).encode("utf-8")
+
+
+def _job_cards(path, query):
+    return _json(_payload("job_cards.json") if query.get("start", "0") == "0" else {"data": {}, "included": []})
+
+
+def _job_posting(path, query):
+    return _json(_payload(f"job_posting_{path.rstrip('/').split('/')[-1]}.json"))
+
+
+class TestJobResponseCapture:
+    def test_parse_job_cards_payload(self) -> None:
+        """Tests that job cards are parsed from the normalized search payload."""
+        records = JobResponseCapture.parse_payload(_payload("job_cards.json"))
+
+        assert list(records) == ["4137169472", "4137169473", "4137169474"]
+        assert records["4137169472"]["title"] == "Automation Engineer"
+        assert records["4137169472"]["company"] == "Acme Robotics"
+        assert records["4137169472"]["easy_apply"] is True
+        assert records["4137169473"]["easy_apply"] is None
+        assert "description" not in records["4137169472"]
+
+    def test_parse_job_posting_payload(self) -> None:
+        """Tests that the job posting payload provides the description, company and apply method."""
+        records = JobResponseCapture.parse_payload(_payload("job_posting_4137169473.json"))
+
+        assert records["4137169473"]["description"].startswith("Develop and maintain")
+        assert records["4137169473"]["company"] == "Globex"
+        assert records["4137169473"]["easy_apply"] is False
+        assert records["4137169473"]["posted_at"] == 1737000500
+
+    def test_extract_jobs_from_network(self, playwright_page_no_data: Page) -> None:
+        """Tests network capture mode against a local server serving recorded payloads."""
+        logger.info("Starting test_extract_jobs_from_network")
+        routes = {
+            "/jobs/search/": lambda path, query: (200, "text/html", SEARCH_PAGE),
+            "/jobs/view/": lambda path, query: (200, "text/html", JOB_PAGE),
+            LinkedInConstants.Api.JOB_CARDS: _job_cards,
+            LinkedInConstants.Api.JOB_POSTING: _job_posting,
+        }
+        with FixtureServer(routes) as server:
+            class LocalConstants(LinkedInConstants):
+                JOBS_SEARCH_URL = f"{server.url}/jobs/search/"
+                JOB_VIEW_URL = f"{server.url}/jobs/view/{{job_id}}/"
+
+            job_extractor = JobExtractor(playwright_page_no_data, LocalConstants)
+            jobs = job_extractor.extract_jobs_from_network(f"{LocalConstants.JOBS_SEARCH_URL}?keywords=automation", 10)
+
+        assert [job.company for job in jobs] == ["Acme Robotics", "Globex", "Initech"]
+        assert [job.easy_apply for job in jobs] == [True, False, True]
+        assert all(job.description for job in jobs)
+        assert jobs[0].url == f"{server.url}/jobs/view/4137169472/"
+        assert jobs[0].raw_data["job_id"] == "4137169472"
+        assert len(jobs[0].raw_data["entities"]) == 2
+        logger.info("test_extract_jobs_from_network completed successfully")
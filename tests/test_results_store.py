@@ -0,0 +1,43 @@
+# tests/test_results_store.py
+
+from time import time
+
+from src.models.job import Job
+from src.utils.results_store import ResultsStore
+
+
+def _job(job_id: int, company: str = "Acme", title: str = "Automation Engineer", score: int = 80, posted_at: float = None) -> Job:
+    return Job(title=title, company=company, location="Israel", url=f"https://www.linkedin.com/jobs/view/{job_id}/",
+               easy_apply=False, score=score, posted_at=posted_at)
+
+
+class TestResultsStore:
+    def test_query_by_company_title_score_and_date(self, tmp_path):
+        store = ResultsStore(str(tmp_path / "results.sqlite"))
+        store.add_many([
+            _job(1, score=90),
+            _job(2, company="Globex", score=95),
+            _job(3, title="QA Engineer", score=85),
+            _job(4, score=60),
+            _job(5, score=99, posted_at=time() - 60 * 86400),
+        ])
+
+        assert [job.url for job in store.query(company="acme", title="automation", min_score=80)] == [
+            "https://www.linkedin.com/jobs/view/5/", "https://www.linkedin.com/jobs/view/1/"]
+        assert [job.score for job in store.query(company="acme", min_score=80, since=time() - 30 * 86400)] == [90, 85]
+        store.close()
+
+    def test_add_many_updates_jobs_and_links_queries(self, tmp_path):
+        store = ResultsStore(str(tmp_path / "results.sqlite"))
+        store.add_many([_job(1, score=None)], {"keywords": "automation engineer", "location": "Israel", "epoch_ago": "86400"})
+        job = _job(1, score=70)
+        job.queries = [{"keywords": "qa engineer", "location": "Israel", "epoch_ago": 86400}]
+        store.add_many([job])
+
+        assert [job.score for job in store.query(keywords="Automation Engineer")] == [70]
+        assert [job.score for job in store.query(keywords="qa engineer")] == [70]
+        assert store.query(keywords="developer") == []
+        store.close()
+
+    def test_job_has_no_instance_dict(self):
+        assert not hasattr(_job(1), "__dict__")
@@ -0,0 +1,69 @@
+# tests/test_run_matrix.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from playwright.sync_api import Page
+
+from src.async_facade import AsyncFacade
+from src.constants.linkedin import LinkedInConstants
+from src.facade import Facade
+from src.models.job import Job
+from src.run_matrix import AsyncRunMatrix, RunMatrix, SearchQuery, build_run_matrix
+
+# Job ids found by every keywords query, "qa" and "sdet" overlap on job 2.
+RESULTS = {"qa": [1, 2], "sdet": [2, 3]}
+
+
+def _run(coroutine):
+    """asyncio.run on a fresh thread, the session Playwright fixture keeps a loop running on the main one."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def _job(job_id: int) -> Job:
+    return Job(title=f"Job {job_id}", company="Tech Company", location="London",
+               url=f"https://www.linkedin.com/jobs/view/{job_id}/", description=str(job_id), easy_apply=True)
+
+
+def _scores(descriptions, user_description):
+    return [100 if int(description) != 3 else 0 for description in descriptions]
+
+
+def test_build_run_matrix():
+    queries = build_run_matrix(["qa", "sdet"], ["London"], [86400, 604800])
+
+    assert [(query.keywords, query.epoch_ago) for query in queries] == [("qa", 86400), ("qa", 604800), ("sdet", 86400), ("sdet", 604800)]
+    assert build_run_matrix([None], [None], []) == [SearchQuery()]
+
+def test_run_matrix_deduplicates_and_annotates(mocker):
+    matcher = mocker.MagicMock(batch_size=10, concurrency=1, threshold=50)
+    matcher.scores.side_effect = _scores
+    facade = Facade(mocker.MagicMock(spec=Page), LinkedInConstants, matcher=matcher)
+    mocker.patch.object(facade, "iter_jobs", side_effect=lambda keywords, *args: iter(map(_job, RESULTS[keywords])))
+
+    jobs = RunMatrix(facade, build_run_matrix(["qa", "sdet"], ["London"], [86400])).run("user description")
+
+    assert [job.title for job in jobs] == ["Job 1", "Job 2"]
+    assert [query["keywords"] for query in jobs[1].queries] == ["qa", "sdet"]
+    assert [call.args[0] for call in matcher.scores.call_args_list] == [["1", "2"], ["3"]]
+
+def test_async_run_matrix_runs_queries_in_parallel(mocker):
+    matcher = mocker.MagicMock(batch_size=10, concurrency=1, threshold=50)
+    matcher.scores.side_effect = _scores
+    context = mocker.MagicMock()
+    context.new_page = mocker.AsyncMock()
+
+    async def search_jobs(facade, keywords, *args, **kwargs):
+        await asyncio.sleep(0.2)
+        return list(map(_job, RESULTS[keywords]))
+    mocker.patch.object(AsyncFacade, "search_jobs", autospec=True, side_effect=search_jobs)
+
+    queries = build_run_matrix(["qa", "sdet"], ["London"], [86400])
+    start = time.perf_counter()
+    jobs = _run(AsyncRunMatrix(context, LinkedInConstants, matcher, queries, parallel=2).run("user description"))
+
+    assert time.perf_counter() - start < 0.35
+    assert sorted(job.title for job in jobs) == ["Job 1", "Job 2"]
+    assert sum(len(call.args[0]) for call in matcher.scores.call_args_list) == 3
+    assert context.new_page.await_count == 2
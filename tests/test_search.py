@@ -9,6 +9,7 @@ import src.logger as LOGGER
 from src.exceptions import SearchError
 from src.search.linkedin.job_extractor import JobExtractor
 from src.search.linkedin.search import JobSearch
+from src.search.linkedin.filters import encode_filters
 from src.models.job import Job
 
 logger = LOGGER.get(__name__)
@@ -105,10 +106,47 @@ class TestLinkedInJobSearch:
         
         logger.info("test_search_jobs_error completed successfully")
 
-    def test_select_time_range(self) -> None:
-        """Tests the _select_time_range method."""
-        logger.info("Starting test_select_time_range")
-        search_url = LinkedInConstants.JOBS_SEARCH_URL
-        self.linkedin_page.goto(search_url)
-        self.search._select_time_range()
-        logger.info("test_select_time_range completed successfully")
\ No newline at end of file
+
+def test_encode_filters() -> None:
+    """Tests the mapping of the filter names and values onto the search URL parameters."""
+    parameters = encode_filters("604800", {"easy_apply": True, "experience": "entry, mid-senior", "job_type": ["full_time", "C"], "sort_by": "recent"})
+    assert parameters == {"f_TPR": "r604800", "f_AL": "true", "f_E": "2,4", "f_JT": "F,C", "sortBy": "DD"}
+    assert encode_filters(None, {"easy_apply": False}) == {}
+    with pytest.raises(ValueError):
+        encode_filters(None, {"salary": "100k"})
+    with pytest.raises(ValueError):
+        encode_filters(None, {"workplace": "moon"})
+
+
+def test_build_search_url_with_filters(mocker) -> None:
+    """Tests that the time range and the filters are part of the search URL."""
+    search = JobSearch(mocker.MagicMock(spec=Page), LinkedInConstants)
+    search_url = search._build_search_url("qa", "london", {"easy_apply": True, "workplace": ["remote", "hybrid"]}, 86400)
+    assert "f_TPR=r86400" in search_url
+    assert "f_AL=true" in search_url
+    assert "f_WT=2%2C3" in search_url
+
+
+def test_search_opens_filtered_url_without_clicks(mocker) -> None:
+    """Tests that a filtered search is a single navigation."""
+    page = mocker.MagicMock(spec=Page)
+    search = JobSearch(page, LinkedInConstants)
+    mocker.patch.object(search.job_extractor, "extract_jobs", return_value=[])
+
+    search.search_jobs("qa", "london", 86400, {"workplace": "remote"})
+
+    page.goto.assert_called_once()
+    assert "f_TPR=r86400" in page.goto.call_args.args[0] and "f_WT=2" in page.goto.call_args.args[0]
+    page.locator.assert_not_called()
+
+
+def test_network_search_navigates_once_per_results_page(mocker) -> None:
+    """Tests that the network search leaves the first navigation to the extractor, which captures its responses."""
+    page = mocker.MagicMock(spec=Page)
+    search = JobSearch(page, LinkedInConstants)
+    extract = mocker.patch.object(search.job_extractor, "extract_jobs_from_network", return_value=[])
+
+    search.search_jobs_from_network("qa", "london", 86400, limit=5)
+
+    page.goto.assert_not_called()
+    assert "f_TPR=r86400" in extract.call_args.args[0]
@@ -0,0 +1,36 @@
+# tests/test_seen_jobs.py
+
+import sqlite3
+from src.models.job import Job
+from src.utils.seen_jobs import SeenJobs
+
+
+def _job(job_id: str, description: str = "Python", score=None) -> Job:
+    return Job(title=f"Job {job_id}", company="Tech Company", location="London",
+               url=f"https://www.linkedin.com/jobs/view/{job_id}/?trackingId=abc", easy_apply=True,
+               description=description, score=score)
+
+
+def test_seen_jobs_job_id():
+    assert SeenJobs.job_id(_job("4137169472")) == "4137169472"
+    assert SeenJobs.job_id(Job(title="t", company="c", location="l", url="https://x/jobs/view/1/", easy_apply=True, raw_data={"job_id": "42"})) == "42"
+
+def test_seen_jobs_persist_between_runs(tmp_path):
+    path = str(tmp_path / "seen.sqlite")
+    seen = SeenJobs(path)
+    seen.record([_job("1", score=90), _job("2", score=10)])
+    seen.close()
+
+    seen = SeenJobs(path)
+    assert seen.known(["1", "3", None, "2"]) == {"1", "2"}
+    assert seen.skipped == 2
+
+def test_seen_jobs_keep_last_score_and_content_hash(tmp_path):
+    path = str(tmp_path / "seen.sqlite")
+    seen = SeenJobs(path)
+    seen.record([_job("1", score=90)])
+    seen.record([_job("1", description="Python and Go")])
+    seen.close()
+
+    row = sqlite3.connect(path).execute("SELECT score, content_hash FROM seen_jobs WHERE job_id = '1'").fetchone()
+    assert row == (90, SeenJobs.content_hash(_job("1", description="Python and Go")))
@@ -0,0 +1,67 @@
+# tests/test_snapshot_store.py
+
+import os
+
+from src.constants.linkedin import LinkedInConstants
+from src.search.linkedin.scripts import job_details_selectors
+from src.search.linkedin.snapshot_parser import SnapshotParser, parse_snapshot
+from src.utils.snapshot_store import SnapshotStore
+from tests.fixtures.job_board import JobBoard
+
+
+def _pane(board: JobBoard, job: dict) -> str:
+    return f'<div class="jobs-details">{board._details(job)}</div>'
+
+
+class TestSnapshotStore:
+    def test_put_deduplicates_and_compresses(self, tmp_path):
+        store = SnapshotStore(str(tmp_path / "snapshots"))
+        html = "<div class='jobs-details'>" + "automation engineer " * 200 + "</div>"
+
+        digest = store.put("1", "https://www.linkedin.com/jobs/view/1/", html)
+        assert store.put("2", "https://www.linkedin.com/jobs/view/2/", html) == digest
+
+        assert store.get(digest) == html
+        assert (store.stored, store.deduplicated) == (1, 1)
+        assert os.path.getsize(store.object_path(digest)) < len(html) / 10
+        assert [entry[0] for entry in store.entries()] == ["1", "2"]
+        store.close()
+
+    def test_parse_snapshot_with_site_locators(self):
+        board = JobBoard(1, easy_apply_rate=0.0)
+        job = board.jobs[0]
+
+        job_data = parse_snapshot(_pane(board, job), job_details_selectors(LinkedInConstants.Locators))
+
+        assert (job_data["title"], job_data["company"], job_data["location"]) == (job["title"], job["company"], job["location"])
+        assert job_data["description"] == job["description"]
+        assert job_data["url"] == f"/jobs/view/{job['job_id']}/"
+        assert (job_data["easy_apply"], job_data["apply_button"]) == (False, True)
+
+    def test_parser_rebuilds_jobs_across_processes(self, mocker, tmp_path):
+        board = JobBoard(30, missing_rate=0.2)
+        board.base_url = "https://www.linkedin.com"
+        store = SnapshotStore(str(tmp_path / "snapshots"))
+        for job in board.jobs:
+            store.put(job["job_id"], f"{board.base_url}/jobs/view/{job['job_id']}/", _pane(board, job))
+        mocker.patch.object(SnapshotParser, "CHUNK_SIZE", 10)
+
+        jobs = SnapshotParser(store, LinkedInConstants, processes=2).parse_all()
+
+        assert [job.raw_data["job_id"] for job in jobs] == [job["job_id"] for job in board.valid_jobs]
+        assert all(job.description for job in jobs)
+        store.close()
+
+    def test_parser_skips_already_applied_jobs(self, tmp_path):
+        board = JobBoard(2, missing_rate=0.0)
+        board.base_url = "https://www.linkedin.com"
+        store = SnapshotStore(str(tmp_path / "snapshots"))
+        available, applied = board.jobs
+        store.put(available["job_id"], f"{board.base_url}/jobs/view/{available['job_id']}/", _pane(board, available))
+        store.put(applied["job_id"], f"{board.base_url}/jobs/view/{applied['job_id']}/",
+                  _pane(board, applied).replace("<button><span>Easy Apply</span></button>", "").replace("<button><span>Apply</span></button>", ""))
+
+        jobs = SnapshotParser(store, LinkedInConstants, processes=1).parse_all()
+
+        assert [job.raw_data["job_id"] for job in jobs] == [available["job_id"]]
+        store.close()